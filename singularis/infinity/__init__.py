@@ -4,7 +4,12 @@ Singularis Infinity Engine - Phase 2 Innovations
 Next-generation cognitive systems built on HaackLang + SCCE foundation.
 """
 
-from .coherence_engine_v2 import CoherenceEngineV2, CoherenceReport, CognitiveAdjustments
+from .coherence_engine_v2 import (
+    CoherenceEngineV2,
+    CoherenceReport,
+    CognitiveAdjustments,
+    CognitiveState,
+)
 from .meta_context import MetaContextSystem, Context, ContextLevel, ConditionalRule
 from .polyrhythmic_learning import (
     PolyrhythmicLearner,
@@ -28,6 +33,7 @@ __all__ = [
     'CoherenceEngineV2',
     'CoherenceReport',
     'CognitiveAdjustments',
+    'CognitiveState',
     'MetaContextSystem',
     'Context',
     'ContextLevel',
@@ -0,0 +1,150 @@
+"""
+Coherence Kernels - bit-packed helpers for Coherence Engine V2
+
+The pair scans in the coherence engine only care about *opposed* track
+values. For values in [0, 1], a pair can only differ by more than ``gap``
+if the smaller value is below ``1 - gap`` and the larger one above ``gap``.
+So each track is packed into two bitmasks (one bit per track): a LOW mask
+for values that could be the bottom of an opposed pair and a HIGH mask for
+values that could be the top. Candidate pairs are then read straight off
+the set bits instead of comparing every pair in Python.
+
+Masks are plain Python ints, so there is no upper limit on track count.
+
+scan_pairs() fuses the engine's three pair analyses (contradictions,
+conflicts, agreement ratio) into one pass per TruthValue.
+"""
+
+from typing import Iterator, List, Mapping, Sequence, Tuple
+
+
+def pack_extremes(values: Sequence[float], gap: float) -> Tuple[int, int]:
+    """
+    Pack track values into (low_mask, high_mask) for an opposition gap.
+
+    Bit i of low_mask is set when values[i] < 1 - gap, bit i of high_mask
+    when values[i] > gap. Any pair with |a - b| > gap has one member in
+    each mask. If any value falls outside [0, 1] the bound no longer holds,
+    so every track is flagged in both masks and the scan degrades to a
+    plain all-pairs comparison.
+    """
+    # Small slack keeps the filter conservative under float rounding
+    low_cut = 1.0 - gap + 1e-9
+    high_cut = gap - 1e-9
+    low = 0
+    high = 0
+    bit = 1
+    for v in values:
+        if v < 0.0 or v > 1.0:
+            everything = (1 << len(values)) - 1
+            return everything, everything
+        if v < low_cut:
+            low |= bit
+        if v > high_cut:
+            high |= bit
+        bit <<= 1
+    return low, high
+
+
+def iter_set_bits(mask: int) -> Iterator[int]:
+    """Yield indices of set bits in ascending order."""
+    while mask:
+        lowest = mask & -mask
+        mask ^= lowest
+        yield lowest.bit_length() - 1
+
+
+def iter_opposed_pairs(
+    values: Sequence[float],
+    gap: float,
+) -> Iterator[Tuple[int, int, float]]:
+    """
+    Yield (i, j, |v_i - v_j|) for every pair i < j with |v_i - v_j| > gap.
+
+    Pairs are produced in the same (i, j) order as a nested ``for i`` /
+    ``for j > i`` loop, but only candidates flagged by the packed masks are
+    compared. When either mask is empty no pair can qualify and the scan
+    costs a single pass over the values.
+    """
+    low, high = pack_extremes(values, gap)
+    if not low or not high:
+        return
+
+    abs_ = abs
+    for i in iter_set_bits(low | high):
+        above = ~((1 << (i + 1)) - 1)
+        partners = 0
+        if (low >> i) & 1:
+            partners |= high
+        if (high >> i) & 1:
+            partners |= low
+        partners &= above
+        if not partners:
+            continue
+
+        vi = values[i]
+        for j in iter_set_bits(partners):
+            d = abs_(vi - values[j])
+            if d > gap:
+                yield i, j, d
+
+
+def count_close_pairs(values: Sequence[float], gap: float) -> int:
+    """
+    Count pairs i < j with |v_i - v_j| < gap.
+
+    Sorts once and sweeps a window, O(n log n) instead of comparing every
+    pair.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    count = 0
+    lo = 0
+    for hi in range(n):
+        top = ordered[hi]
+        while top - ordered[lo] >= gap:
+            lo += 1
+        count += hi - lo
+    return count
+
+
+def scan_pairs(
+    snapshot: Mapping[str, Tuple[Sequence[str], Sequence[float]]],
+    contradiction_gap: float = 0.7,
+    conflict_gap: float = 0.6,
+    agreement_gap: float = 0.3,
+) -> Tuple[List[Tuple[str, str, str, float, float, float]], List[Tuple[str, str]], int, int]:
+    """
+    All pair-derived coherence metrics in one pass per TruthValue.
+
+    Contradictions are a subset of conflicts (contradiction_gap must be
+    >= conflict_gap), so both come out of a single opposed-pair scan, and
+    agreements are counted by the sorted sweep above.
+
+    Args:
+        snapshot: {tv_name: (track_names, values)}; callers should drop
+            single-track entries first since they can never form a pair
+
+    Returns:
+        (contradictions, conflicts, agreements, comparisons) where each
+        contradiction is (tv_name, track1, track2, val1, val2, diff) and
+        each conflict is ("tv.track1", "tv.track2")
+    """
+    contradictions = []
+    conflicts = []
+    agreements = 0
+    comparisons = 0
+
+    for tv_name, (tracks, values) in snapshot.items():
+        n = len(values)
+        comparisons += n * (n - 1) // 2
+        agreements += count_close_pairs(values, agreement_gap)
+
+        for i, j, diff in iter_opposed_pairs(values, conflict_gap):
+            track1 = tracks[i]
+            track2 = tracks[j]
+            conflicts.append((f"{tv_name}.{track1}", f"{tv_name}.{track2}"))
+            if diff > contradiction_gap:
+                contradictions.append((tv_name, track1, track2, values[i], values[j], diff))
+
+    return contradictions, conflicts, agreements, comparisons
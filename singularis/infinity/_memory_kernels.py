@@ -0,0 +1,127 @@
+"""
+Memory Kernels - rhythm scoring helpers for Memory Engine V2
+
+Each kernel comes in two forms:
+- a plain loop written so Numba can compile it (one fused pass, no
+  temporaries), used when Numba is installed
+- a vectorized NumPy version, used otherwise
+
+Both compute exactly the scores of RhythmSignature.compute_similarity and
+MemoryEngineV2._compute_interference, so callers can switch freely.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+_TAU = math.tau
+_INV_PI = 1.0 / math.pi  # Multiply instead of dividing by π
+
+# Below this many stored memories the NumPy path wins (no JIT call overhead)
+NUMBA_MIN_ROWS = 256
+
+
+# ========== Batch Rhythm Similarity ==========
+
+def _batch_similarity_loop(phase_mat, track_mask, track_count, live,
+                           q_phase, q_mask, n_query, dom_freq, q_freq, out):
+    """Fused overlap + phase + frequency score per row (compiled by Numba)"""
+    rows, width = phase_mat.shape
+    for r in prange(rows):
+        if not live[r]:
+            out[r] = -np.inf
+            continue
+        n_common = 0
+        phase_sum = 0.0
+        for c in range(width):
+            if track_mask[r, c] and q_mask[c]:
+                d = abs(phase_mat[r, c] - q_phase[c])
+                if _TAU - d < d:
+                    d = _TAU - d
+                phase_sum += 1.0 - d * _INV_PI
+                n_common += 1
+        if n_common == 0:
+            out[r] = 0.0
+            continue
+        overlap = n_common / max(track_count[r], n_query)
+        freq_score = math.exp(abs(dom_freq[r] - q_freq) * -0.1)
+        out[r] = 0.4 * overlap + 0.4 * (phase_sum / n_common) + 0.2 * freq_score
+
+
+def batch_similarity_numpy(phase_mat, track_mask, track_count, live,
+                           q_phase, q_mask, n_query, dom_freq, q_freq, out):
+    """Same scores as _batch_similarity_loop using NumPy broadcasting"""
+    common = track_mask & q_mask
+    n_common = common.sum(axis=1)
+
+    diff = np.abs(phase_mat - q_phase)
+    diff = np.minimum(diff, _TAU - diff)
+    phase_sum = np.where(common, 1.0 - diff * _INV_PI, 0.0).sum(axis=1)
+
+    overlap = n_common / np.maximum(track_count, n_query)
+    phase_score = phase_sum / np.maximum(n_common, 1)
+    freq_score = np.exp(np.abs(dom_freq - q_freq) * -0.1)
+
+    total = 0.4 * overlap + 0.4 * phase_score + 0.2 * freq_score
+    out[:] = np.where(n_common > 0, total, 0.0)
+    out[~live] = -np.inf
+
+
+# ========== Pairwise Rhythm Similarity ==========
+
+def _pair_similarity_loop(p1, p2, idx1, idx2, f1, f2, n1, n2):
+    """
+    RhythmSignature.compute_similarity for one pair, given the aligned
+    indices of their shared tracks (compiled by Numba).
+    """
+    n_common = idx1.shape[0]
+    if n_common == 0:
+        return 0.0
+    phase_sum = 0.0
+    for k in range(n_common):
+        d = abs(p1[idx1[k]] - p2[idx2[k]])
+        if _TAU - d < d:
+            d = _TAU - d
+        phase_sum += 1.0 - d * _INV_PI
+    overlap = n_common / max(n1, n2)
+    freq_score = math.exp(abs(f1 - f2) * -0.1)
+    return 0.4 * overlap + 0.4 * (phase_sum / n_common) + 0.2 * freq_score
+
+
+# ========== Interference ==========
+
+def _interference_loop(phases, periods, window, out):
+    """Mean cos(phase) across tracks for each of `window` steps (Numba)"""
+    n = phases.shape[0]
+    inv_n = 1.0 / n
+    for t in range(window):
+        total = 0.0
+        for k in range(n):
+            total += math.cos((phases[k] + _TAU * t / periods[k]) % _TAU)
+        out[t] = total * inv_n
+
+
+def interference_numpy(phases, periods, window, out):
+    """Same values as _interference_loop over a (window, tracks) grid"""
+    t = np.arange(window, dtype=np.float64)[:, None]
+    current = np.mod(phases + _TAU * t / periods, _TAU)
+    out[:] = np.cos(current).mean(axis=1)
+
+
+# Compiled loops when Numba is installed, vectorized NumPy otherwise
+if NUMBA_AVAILABLE:
+    batch_rhythm_similarity = njit(parallel=True, fastmath=True, cache=True)(_batch_similarity_loop)
+    rhythm_similarity = njit(fastmath=True, cache=True)(_pair_similarity_loop)
+    compute_interference_nb = njit(fastmath=True, cache=True)(_interference_loop)
+else:
+    batch_rhythm_similarity = batch_similarity_numpy
+    rhythm_similarity = None  # RhythmSignature keeps its NumPy expression
+    compute_interference_nb = interference_numpy
@@ -0,0 +1,107 @@
+"""
+Rhythm Kernels - scalar update steps for the Polyrhythmic Learner
+
+Written as plain loops over the learner's column arrays so Numba can
+compile them when it is installed. Otherwise a scalar twin of each loop
+runs over memoryviews of the columns (see kernel_view): indexing a
+memoryview yields Python numbers, where indexing an array yields NumPy
+scalars that are several times slower to read and compute with. Only
+columns and scalars cross the call boundary.
+
+Numba is used without fastmath: periods come from truncating the
+velocity, so the float arithmetic has to round exactly as in Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# ========== Reward Adaptation ==========
+
+def _reward_update_loop(ring, heads, counts, periods, velocities, momenta, rates,
+                        mins, maxs, slot, reward):
+    """
+    Record `reward` in the track's ring, then apply one momentum step of
+    PolyrhythmicLearner.adapt_from_reward.
+
+    Returns (reward_trend, old_period, new_period); the period column is
+    only written when the two differ.
+    """
+    window = ring.shape[1]
+    head = heads[slot]
+    ring[slot, head] = reward
+    head = (head + 1) % window
+    count = min(counts[slot] + 1, window)
+    heads[slot] = head
+    counts[slot] = count
+
+    old_period = int(periods[slot])
+    if count < 2:
+        return 0.0, old_period, old_period
+
+    # Newest minus oldest reward in the window
+    reward_trend = reward - ring[slot, (head - count) % window]
+    gradient = reward_trend * 100  # Scale to period units
+    velocity = momenta[slot] * velocities[slot] + rates[slot] * gradient
+    velocities[slot] = velocity
+
+    new_period = old_period + int(velocity)
+    new_period = max(int(mins[slot]), min(int(maxs[slot]), new_period))
+    if new_period != old_period:
+        periods[slot] = new_period
+    return reward_trend, old_period, new_period
+
+
+def _reward_update_scalar(ring, heads, counts, periods, velocities, momenta, rates,
+                          mins, maxs, slot, reward):
+    """
+    _reward_update_loop for the interpreter, over memoryviews: the same
+    arithmetic, with the wraps and clamps written as comparisons rather
+    than min/max/int calls.
+    """
+    window = ring.shape[1]
+    head = heads[slot]
+    ring[slot, head] = reward
+    head += 1
+    if head == window:
+        head = 0
+    heads[slot] = head
+    count = counts[slot]
+    if count < window:
+        count += 1
+        counts[slot] = count
+
+    old_period = periods[slot]
+    if count < 2:
+        return 0.0, old_period, old_period
+
+    # Newest minus oldest reward in the window
+    reward_trend = reward - ring[slot, (head - count) % window]
+    gradient = reward_trend * 100  # Scale to period units
+    velocity = momenta[slot] * velocities[slot] + rates[slot] * gradient
+    velocities[slot] = velocity
+
+    new_period = old_period + int(velocity)
+    if new_period > maxs[slot]:
+        new_period = maxs[slot]
+    if new_period < mins[slot]:
+        new_period = mins[slot]
+    if new_period != old_period:
+        periods[slot] = new_period
+    return reward_trend, old_period, new_period
+
+
+# Compiled over the arrays when Numba is installed, scalar Python over
+# memoryviews otherwise
+if NUMBA_AVAILABLE:
+    reward_update = njit(cache=True)(_reward_update_loop)
+    
+    def kernel_view(column):
+        """Column as passed to the kernels (the array itself)"""
+        return column
+else:
+    reward_update = _reward_update_scalar
+    kernel_view = memoryview
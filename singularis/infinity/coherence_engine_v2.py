@@ -15,22 +15,110 @@ Key capabilities:
 - Rewrite cognitive rules on-the-fly
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
-from enum import Enum
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Protocol, Set, Tuple
+from enum import IntEnum
 import time
 import math
 
+from loguru import logger
 
-class InterventionType(Enum):
+from ._coherence_kernels import scan_pairs
+
+
+class InterventionType(IntEnum):
     """Types of meta-logic interventions"""
-    DAMPEN_TRACK = "dampen_track"
-    BOOST_TRACK = "boost_track"
-    FORCE_CONTEXT_SHIFT = "force_context_shift"
-    REWRITE_RULE = "rewrite_rule"
-    MODULATE_EMOTION = "modulate_emotion"
-    SYNC_TRACKS = "sync_tracks"
-    RESET_TRACK = "reset_track"
+    DAMPEN_TRACK = 0
+    BOOST_TRACK = 1
+    FORCE_CONTEXT_SHIFT = 2
+    REWRITE_RULE = 3
+    MODULATE_EMOTION = 4
+    SYNC_TRACKS = 5
+    RESET_TRACK = 6
+    
+    @property
+    def label(self) -> str:
+        """Human-readable name, e.g. 'dampen_track'"""
+        return _INTERVENTION_NAMES[self]
+
+
+# Indexed by InterventionType value
+_INTERVENTION_NAMES = (
+    "dampen_track",
+    "boost_track",
+    "force_context_shift",
+    "rewrite_rule",
+    "modulate_emotion",
+    "sync_tracks",
+    "reset_track",
+)
+
+
+class _Contradiction:
+    """
+    One contradiction found by the pair scan (see _analyze).
+    
+    Slotted record instead of a dict; ``c['val1']`` item access is kept
+    for callers written against the old dict form.
+    """
+    __slots__ = ('truthvalue', 'track1', 'track2', 'val1', 'val2', 'severity')
+    
+    def __init__(self, truthvalue: str, track1: str, track2: str,
+                 val1: float, val2: float, severity: float):
+        self.truthvalue = truthvalue
+        self.track1 = track1
+        self.track2 = track2
+        self.val1 = val1
+        self.val2 = val2
+        self.severity = severity
+    
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+    
+    def __repr__(self) -> str:
+        return (f"_Contradiction({self.truthvalue}: {self.track1}={self.val1:.2f} "
+                f"vs {self.track2}={self.val2:.2f})")
+
+
+# {tv_name: (track_names, values)} - track values read once per evaluation
+TruthValueSnapshot = Dict[str, Tuple[Tuple[str, ...], Tuple[float, ...]]]
+
+
+# Threshold breach bits for CoherenceReport.breach_mask
+BREACH_CONTRADICTION = 1
+BREACH_TENSION = 2
+BREACH_COHERENCE = 4
+BREACH_CONSISTENCY = 8
+BREACH_CONTEXT = 16
+
+
+# Goal keyword pairs that pull in opposite directions.
+# Simplified - real version would use semantic understanding
+_CONFLICT_PAIRS = (
+    ('explore', 'hide'),
+    ('attack', 'flee'),
+    ('trust', 'suspect'),
+)
+_CONFLICT_KEYWORDS = frozenset(kw for pair in _CONFLICT_PAIRS for kw in pair)
+_CONFLICT_EDGES = frozenset(_CONFLICT_PAIRS) | frozenset((b, a) for a, b in _CONFLICT_PAIRS)
+
+
+def _goal_tags(goal: str) -> FrozenSet[str]:
+    """Conflict keywords contained in a goal string"""
+    lowered = goal.lower()
+    return frozenset(kw for kw in _CONFLICT_KEYWORDS if kw in lowered)
+
+
+def _tags_conflict(tags1: FrozenSet[str], tags2: FrozenSet[str]) -> bool:
+    """True if any keyword pair across the two tag sets is a conflict edge"""
+    for a in tags1:
+        for b in tags2:
+            if (a, b) in _CONFLICT_EDGES:
+                return True
+    return False
 
 
 @dataclass
@@ -49,12 +137,18 @@ class CoherenceReport:
     
     # Detailed diagnostics
     conflicting_tracks: List[Tuple[str, str]] = field(default_factory=list)
-    contradictions: List[Dict] = field(default_factory=list)
+    contradictions: List[_Contradiction] = field(default_factory=list)
     tension_sources: List[str] = field(default_factory=list)
     misaligned_tracks: List[str] = field(default_factory=list)
     
     # Temporal
-    timestamp: float = field(default_factory=time.time)
+    timestamp: int = field(default_factory=time.monotonic_ns)  # Monotonic ns; / 1e9 for seconds
+    
+    # Thresholds breached at evaluation, as BREACH_* bits (-1 = not
+    # evaluated). Set by evaluate_coherence and not kept in sync with
+    # later metric edits: reset it to -1 after editing a metric so
+    # apply_corrections recomputes it.
+    breach_mask: int = -1
     
     def needs_adjustment(self, thresholds: Dict[str, float]) -> bool:
         """Check if any metric exceeds intervention threshold"""
@@ -66,20 +160,61 @@ class CoherenceReport:
             self.context_appropriateness < thresholds.get('context', 0.5)
         )
     
+    def needs_adjustment_fast(self, thr: Tuple[float, float, float, float, float]) -> bool:
+        """
+        needs_adjustment() against a precomputed threshold tuple.
+        
+        Args:
+            thr: (contradiction, tension, coherence, consistency, context)
+        """
+        return (
+            self.contradiction_level > thr[0] or
+            self.cognitive_tension > thr[1] or
+            self.coherence_ratio < thr[2] or
+            self.modal_consistency < thr[3] or
+            self.context_appropriateness < thr[4]
+        )
+    
+    def compute_breach_mask(self, thr: Tuple[float, float, float, float, float]) -> int:
+        """
+        Bitmask of breached thresholds (0 = all metrics acceptable).
+        
+        Args:
+            thr: (contradiction, tension, coherence, consistency, context)
+        """
+        mask = 0
+        if self.contradiction_level > thr[0]:
+            mask |= BREACH_CONTRADICTION
+        if self.cognitive_tension > thr[1]:
+            mask |= BREACH_TENSION
+        if self.coherence_ratio < thr[2]:
+            mask |= BREACH_COHERENCE
+        if self.modal_consistency < thr[3]:
+            mask |= BREACH_CONSISTENCY
+        if self.context_appropriateness < thr[4]:
+            mask |= BREACH_CONTEXT
+        return mask
+    
     def severity(self) -> float:
-        """Overall severity score [0, 1] - higher = worse"""
+        """
+        Overall severity score [0, 1] - higher = worse
+        
+        Weighted sum 0.3*contradiction + 0.25*tension + 0.25*(1-coherence)
+        + 0.1*(1-consistency) + 0.1*(1-context), with the constant terms
+        folded.
+        """
         return (
-            self.contradiction_level * 0.3 +
-            self.cognitive_tension * 0.25 +
-            (1.0 - self.coherence_ratio) * 0.25 +
-            (1.0 - self.modal_consistency) * 0.1 +
-            (1.0 - self.context_appropriateness) * 0.1
+            0.45 +
+            0.3 * self.contradiction_level +
+            0.25 * self.cognitive_tension -
+            0.25 * self.coherence_ratio -
+            0.1 * self.modal_consistency -
+            0.1 * self.context_appropriateness
         )
 
 
-@dataclass
-class CognitiveAdjustment:
-    """Single adjustment to cognitive state"""
+class CognitiveAdjustment(NamedTuple):
+    """Single adjustment to cognitive state (read-only view)"""
     intervention_type: InterventionType
     target: str  # Track name, context, or rule ID
     parameter: str  # What to adjust
@@ -87,22 +222,52 @@ class CognitiveAdjustment:
     reason: str  # Why this adjustment
 
 
-@dataclass
 class CognitiveAdjustments:
-    """Collection of adjustments to apply"""
-    adjustments: List[CognitiveAdjustment] = field(default_factory=list)
-    priority: int = 0  # Higher = more urgent
+    """
+    Collection of adjustments to apply.
+    
+    Stored column-wise (one list per field) so ``add()`` is a handful of
+    appends and scans over a single field don't touch the others.
+    ``CognitiveAdjustment`` views are built only when iterated.
+    """
+    
+    def __init__(
+        self,
+        adjustments: Optional[Iterable[CognitiveAdjustment]] = None,
+        priority: int = 0
+    ):
+        self.types: List[InterventionType] = []
+        self.targets: List[str] = []
+        self.parameters: List[str] = []
+        self.values = array('d')
+        self.reasons: List[str] = []
+        self.priority = priority  # Higher = more urgent
+        
+        for adj in adjustments or ():
+            self.add(*adj)
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def __iter__(self) -> Iterator[CognitiveAdjustment]:
+        return map(
+            CognitiveAdjustment,
+            self.types, self.targets, self.parameters, self.values, self.reasons
+        )
+    
+    @property
+    def adjustments(self) -> List[CognitiveAdjustment]:
+        """All adjustments as CognitiveAdjustment views"""
+        return list(self)
     
     def add(self, intervention: InterventionType, target: str, 
             parameter: str, value: float, reason: str):
         """Add an adjustment"""
-        self.adjustments.append(CognitiveAdjustment(
-            intervention_type=intervention,
-            target=target,
-            parameter=parameter,
-            value=value,
-            reason=reason
-        ))
+        self.types.append(intervention)
+        self.targets.append(target)
+        self.parameters.append(parameter)
+        self.values.append(value)
+        self.reasons.append(reason)
     
     def dampen_track(self, track: str, factor: float, reason: str):
         """Dampen a track's influence"""
@@ -143,7 +308,9 @@ class CoherenceEngineV2:
         coherence_minimum: float = 0.4,
         consistency_minimum: float = 0.5,
         context_fit_minimum: float = 0.5,
-        verbose: bool = True
+        verbose: bool = True,
+        shape_cache_size: int = 0,
+        shape_cache_epsilon: float = 0.0
     ):
         """
         Initialize Coherence Engine V2.
@@ -154,7 +321,13 @@ class CoherenceEngineV2:
             coherence_minimum: Min acceptable coherence ratio
             consistency_minimum: Min acceptable modal consistency
             context_fit_minimum: Min acceptable context appropriateness
-            verbose: Print diagnostic info
+            verbose: Log diagnostic info (always off under ``python -O``)
+            shape_cache_size: Max state shapes remembered for report reuse
+                (0, the default, disables the cache). Each miss costs a
+                fingerprint, a report copy and an insert, so only enable it
+                when states repeat exactly or within shape_cache_epsilon
+            shape_cache_epsilon: Max Euclidean drift in state values for a
+                cached report to be reused (0.0 = exact repeats only)
         """
         self.thresholds = {
             'contradiction': contradiction_threshold,
@@ -163,23 +336,57 @@ class CoherenceEngineV2:
             'consistency': consistency_minimum,
             'context': context_fit_minimum
         }
+        # Same thresholds as a tuple for the per-report checks
+        self._thr_tuple = (
+            contradiction_threshold,
+            tension_threshold,
+            coherence_minimum,
+            consistency_minimum,
+            context_fit_minimum,
+        )
         
-        self.verbose = verbose
+        # Diagnostics are compiled out under -O; every log site is gated
+        # on ``__debug__ and self.verbose`` so quiet engines skip formatting
+        self.verbose = verbose and __debug__
         
         # History
-        self.reports: List[CoherenceReport] = []
-        self.interventions: List[CognitiveAdjustments] = []
         self.max_history = 1000
+        self.reports: Deque[CoherenceReport] = deque(maxlen=self.max_history)
+        self.interventions: Deque[CognitiveAdjustments] = deque(maxlen=self.max_history)
+        
+        # Recent severities and their running sum (avg_severity window);
+        # the sum is rebuilt from the ring every time the ring wraps
+        self._severity_ring: Deque[float] = deque(maxlen=100)
+        self._severity_sum = 0.0
+        self._severity_pushes = 0
+        
+        # Breach bit -> correction, in the order corrections are applied
+        self._correction_handlers = (
+            (BREACH_CONTRADICTION, self._resolve_contradictions),
+            (BREACH_TENSION, self._reduce_tension),
+            (BREACH_COHERENCE, self._restore_coherence),
+            (BREACH_CONSISTENCY, self._fix_modal_consistency),
+            (BREACH_CONTEXT, self._adjust_context),
+        )
+        
+        # id(tracks) -> (tracks, version, fast, slow); see _partition_tracks
+        self._track_partition_cache: Dict[int, Tuple[List, int, List, List]] = {}
+        
+        # State shape -> (value vector, report); see _fingerprint
+        self._shape_cache: OrderedDict[Tuple, Tuple[Tuple[float, ...], CoherenceReport]] = OrderedDict()
+        self.shape_cache_size = shape_cache_size
+        self.shape_cache_epsilon = shape_cache_epsilon
         
         # Statistics
         self.total_evaluations = 0
         self.total_interventions = 0
+        self.shape_cache_hits = 0
         
-        if verbose:
-            print("[COHERENCE V2] Meta-Logic 2.0 initialized")
-            print(f"[COHERENCE V2] Thresholds: {self.thresholds}")
+        if __debug__ and self.verbose:
+            logger.info("[COHERENCE V2] Meta-Logic 2.0 initialized")
+            logger.info("[COHERENCE V2] Thresholds: {}", self.thresholds)
     
-    def evaluate_coherence(self, cognitive_state: 'CognitiveState') -> CoherenceReport:
+    def evaluate_coherence(self, cognitive_state: 'CognitiveStateLike') -> CoherenceReport:
         """
         Comprehensive coherence analysis across all cognitive dimensions.
         
@@ -191,47 +398,122 @@ class CoherenceEngineV2:
         """
         self.total_evaluations += 1
         
+        # Read every track value once
+        snapshot = self._snapshot_truth_values(cognitive_state)
+        
+        # Reuse the last report for an identically shaped, (near-)identical state
+        report = None
+        if self.shape_cache_size > 0:
+            shape, vector = self._fingerprint(cognitive_state, snapshot)
+            cached = self._shape_cache.get(shape)
+            if cached is not None and math.dist(vector, cached[0]) <= self.shape_cache_epsilon:
+                self._shape_cache.move_to_end(shape)
+                report = self._reuse_report(cached[1])
+                self.shape_cache_hits += 1
+        
+        if report is None:
+            report = self._analyze(cognitive_state, snapshot)
+            if self.shape_cache_size > 0:
+                # Cache a private copy so callers can't edit the template
+                self._shape_cache[shape] = (vector, self._reuse_report(report))
+                self._shape_cache.move_to_end(shape)
+                if len(self._shape_cache) > self.shape_cache_size:
+                    self._shape_cache.popitem(last=False)
+        
+        report.breach_mask = report.compute_breach_mask(self._thr_tuple)
+        
+        # Store report
+        self.reports.append(report)
+        
+        # Running sum over the last 100 severities for get_statistics
+        sev = report.severity()
+        ring = self._severity_ring
+        if len(ring) == ring.maxlen:
+            self._severity_sum -= ring[0]
+        ring.append(sev)
+        self._severity_pushes += 1
+        if self._severity_pushes % ring.maxlen == 0:
+            # Exact re-sum once per wrap so add/subtract drift can't build up
+            self._severity_sum = math.fsum(ring)
+        else:
+            self._severity_sum += sev
+        
+        if __debug__ and self.verbose and sev > 0.5:
+            logger.warning("[COHERENCE V2] High severity: {:.2f}", sev)
+            logger.debug("  Contradiction: {:.2f}", report.contradiction_level)
+            logger.debug("  Tension: {:.2f}", report.cognitive_tension)
+            logger.debug("  Coherence: {:.2f}", report.coherence_ratio)
+        
+        return report
+    
+    def _analyze(self, state: 'CognitiveStateLike', snapshot: TruthValueSnapshot) -> CoherenceReport:
+        """Run all five analyses and build a fresh report"""
         report = CoherenceReport()
         
-        # 1. Detect contradictions
-        report.contradiction_level, report.contradictions = self._detect_contradictions(
-            cognitive_state
+        # 1, 3, 6. Pair analyses (contradictions, coherence ratio,
+        # conflicting tracks) fused into a single scan
+        contradictions, conflicts, agreements, comparisons = scan_pairs(
+            self._multi_track(snapshot)
         )
+        report.contradictions = [_Contradiction(*c) for c in contradictions]
+        report.contradiction_level = self._contradiction_level(report.contradictions)
+        report.coherence_ratio = agreements / comparisons if comparisons else 1.0
+        report.conflicting_tracks = conflicts
         
         # 2. Measure cognitive tension
         report.cognitive_tension, report.tension_sources = self._measure_cognitive_tension(
-            cognitive_state
+            state
         )
         
-        # 3. Compute coherence ratio
-        report.coherence_ratio = self._compute_coherence_ratio(cognitive_state)
-        
         # 4. Check modal consistency
         report.modal_consistency, report.misaligned_tracks = self._check_modal_alignment(
-            cognitive_state
+            state
         )
         
         # 5. Evaluate context appropriateness
         report.context_appropriateness = self._evaluate_context_appropriateness(
-            cognitive_state
+            state
         )
         
-        # 6. Identify conflicting tracks
-        report.conflicting_tracks = self._find_conflicting_tracks(cognitive_state)
-        
-        # Store report
-        self.reports.append(report)
-        if len(self.reports) > self.max_history:
-            self.reports.pop(0)
-        
-        if self.verbose and report.severity() > 0.5:
-            print(f"[COHERENCE V2] WARNING High severity: {report.severity():.2f}")
-            print(f"  Contradiction: {report.contradiction_level:.2f}")
-            print(f"  Tension: {report.cognitive_tension:.2f}")
-            print(f"  Coherence: {report.coherence_ratio:.2f}")
-        
         return report
     
+    def _fingerprint(
+        self,
+        state: 'CognitiveStateLike',
+        snapshot: TruthValueSnapshot
+    ) -> Tuple[Tuple, Tuple[float, ...]]:
+        """
+        Split a state into (shape, values) for the report cache.
+        
+        The shape holds everything compared exactly (TruthValue and track
+        names, context, goals, track periods); the values are every track
+        value plus the fear/trust emotions that feed tension.
+        """
+        names = sorted(snapshot)
+        shape = (
+            tuple((name, snapshot[name][0]) for name in names),
+            state.context,
+            tuple(state.goals),
+            tuple(t.period for t in state.tracks),
+        )
+        emotions = state.emotions
+        vector = [emotions.get('fear', 0.0), emotions.get('trust', 0.0)]
+        for name in names:
+            vector.extend(snapshot[name][1])
+        return shape, tuple(vector)
+    
+    @staticmethod
+    def _reuse_report(cached: CoherenceReport) -> CoherenceReport:
+        """Fresh copy of a cached report with its own timestamp and lists"""
+        return replace(
+            cached,
+            conflicting_tracks=list(cached.conflicting_tracks),
+            contradictions=list(cached.contradictions),
+            tension_sources=list(cached.tension_sources),
+            misaligned_tracks=list(cached.misaligned_tracks),
+            timestamp=time.monotonic_ns(),
+        )
+    
     def apply_corrections(self, report: CoherenceReport) -> CognitiveAdjustments:
         """
         Apply dynamic adjustments to restore coherence.
@@ -250,80 +532,67 @@ class CoherenceEngineV2:
         # Priority based on severity
         adjustments.priority = int(report.severity() * 10)
         
-        # 1. Handle contradictions
-        if report.contradiction_level > self.thresholds['contradiction']:
-            self._resolve_contradictions(report, adjustments)
-        
-        # 2. Reduce cognitive tension
-        if report.cognitive_tension > self.thresholds['tension']:
-            self._reduce_tension(report, adjustments)
-        
-        # 3. Restore coherence
-        if report.coherence_ratio < self.thresholds['coherence']:
-            self._restore_coherence(report, adjustments)
+        mask = report.breach_mask
+        if mask < 0:
+            # Report wasn't produced by evaluate_coherence
+            mask = report.compute_breach_mask(self._thr_tuple)
+        if not mask:
+            return adjustments
         
-        # 4. Fix modal inconsistency
-        if report.modal_consistency < self.thresholds['consistency']:
-            self._fix_modal_consistency(report, adjustments)
-        
-        # 5. Adjust context if inappropriate
-        if report.context_appropriateness < self.thresholds['context']:
-            self._adjust_context(report, adjustments)
+        # Contradictions, tension, coherence, modal consistency, context
+        for bit, handler in self._correction_handlers:
+            if mask & bit:
+                handler(report, adjustments)
         
         # Store intervention
-        if adjustments.adjustments:
+        if len(adjustments):
             self.total_interventions += 1
             self.interventions.append(adjustments)
-            if len(self.interventions) > self.max_history:
-                self.interventions.pop(0)
             
-            if self.verbose:
-                print(f"[COHERENCE V2] Applying {len(adjustments.adjustments)} corrections")
-                for adj in adjustments.adjustments[:3]:  # Show first 3
-                    print(f"  - {adj.intervention_type.value}: {adj.target} ({adj.reason})")
+            if __debug__ and self.verbose:
+                logger.opt(lazy=True).debug(
+                    "[COHERENCE V2] Applying {} corrections: {}",
+                    lambda: len(adjustments),
+                    lambda: "; ".join(  # Show first 3
+                        f"{_INTERVENTION_NAMES[adj.intervention_type]}: {adj.target} ({adj.reason})"
+                        for adj in islice(adjustments, 3)
+                    )
+                )
         
         return adjustments
     
     # ========== Detection Methods ==========
     
-    def _detect_contradictions(self, state: 'CognitiveState') -> Tuple[float, List[Dict]]:
+    @staticmethod
+    def _snapshot_truth_values(state: 'CognitiveStateLike') -> TruthValueSnapshot:
         """
-        Detect logical contradictions across tracks.
+        Fetch every TruthValue's track values once.
         
-        A contradiction occurs when:
-        - Same TruthValue has opposite values on different tracks
-        - Paraconsistent track holds both P and ¬P strongly
-        - Beliefs conflict with strong evidence
+        Returns:
+            {tv_name: (track_names, values)} with values aligned to names
         """
-        contradictions = []
-        
-        # Check for opposite values across tracks
+        snapshot = {}
         for tv_name, tv in state.truth_values.items():
-            tracks = tv.tracks.keys()
-            for i, track1 in enumerate(tracks):
-                for track2 in list(tracks)[i+1:]:
-                    val1 = tv.get(track1)
-                    val2 = tv.get(track2)
-                    
-                    # Opposite values (one high, one low)
-                    if abs(val1 - val2) > 0.7:
-                        contradictions.append({
-                            'truthvalue': tv_name,
-                            'track1': track1,
-                            'track2': track2,
-                            'val1': val1,
-                            'val2': val2,
-                            'severity': abs(val1 - val2)
-                        })
-        
-        # Compute overall contradiction level
+            names = tuple(tv.tracks)
+            get = tv.get
+            snapshot[tv_name] = (names, tuple([get(track) for track in names]))
+        return snapshot
+    
+    @staticmethod
+    def _multi_track(snapshot: TruthValueSnapshot) -> TruthValueSnapshot:
+        """Only the TruthValues with 2+ tracks - the ones that can form pairs"""
+        return {name: entry for name, entry in snapshot.items() if len(entry[0]) >= 2}
+    
+    @staticmethod
+    def _contradiction_level(contradictions: List[_Contradiction]) -> float:
+        """Average contradiction severity, capped at 1.0"""
         if not contradictions:
-            return 0.0, []
+            return 0.0
         
-        avg_severity = sum(c['severity'] for c in contradictions) / len(contradictions)
-        return min(1.0, avg_severity), contradictions
+        avg_severity = sum(c.severity for c in contradictions) / len(contradictions)
+        return min(1.0, avg_severity)
     
-    def _measure_cognitive_tension(self, state: 'CognitiveState') -> Tuple[float, List[str]]:
+    def _measure_cognitive_tension(self, state: 'CognitiveStateLike') -> Tuple[float, List[str]]:
         """
         Measure dissonance between competing beliefs or goals.
         
@@ -336,17 +605,23 @@ class CoherenceEngineV2:
         total_tension = 0.0
         count = 0
         
-        # Check for goal conflicts
-        if hasattr(state, 'goals'):
-            for i, goal1 in enumerate(state.goals):
-                for goal2 in state.goals[i+1:]:
-                    if self._goals_conflict(goal1, goal2):
+        # Check for goal conflicts (a lone goal has nothing to conflict with)
+        if len(state.goals) >= 2:
+            # Tag each goal once; untagged goals can't conflict
+            tagged = []
+            for goal in state.goals:
+                tags = _goal_tags(goal)
+                if tags:
+                    tagged.append((goal, tags))
+            for i, (goal1, tags1) in enumerate(tagged):
+                for goal2, tags2 in tagged[i+1:]:
+                    if _tags_conflict(tags1, tags2):
                         tension_sources.append(f"Goal conflict: {goal1} vs {goal2}")
                         total_tension += 0.5
                         count += 1
         
         # Check for emotional dissonance
-        if hasattr(state, 'emotions'):
+        if state.emotions:
             # Fear + Trust = tension
             fear = state.emotions.get('fear', 0.0)
             trust = state.emotions.get('trust', 0.0)
@@ -361,41 +636,7 @@ class CoherenceEngineV2:
         
         return min(1.0, total_tension / count), tension_sources
     
-    def _compute_coherence_ratio(self, state: 'CognitiveState') -> float:
-        """
-        Ratio of integrated vs. conflicting information.
-        
-        High coherence = most tracks agree
-        Low coherence = tracks diverge
-        """
-        if not hasattr(state, 'truth_values') or not state.truth_values:
-            return 1.0
-        
-        agreements = 0
-        comparisons = 0
-        
-        for tv in state.truth_values.values():
-            tracks = list(tv.tracks.keys())
-            if len(tracks) < 2:
-                continue
-            
-            # Compare all track pairs
-            for i, track1 in enumerate(tracks):
-                for track2 in tracks[i+1:]:
-                    val1 = tv.get(track1)
-                    val2 = tv.get(track2)
-                    
-                    # Agreement if values are close
-                    if abs(val1 - val2) < 0.3:
-                        agreements += 1
-                    comparisons += 1
-        
-        if comparisons == 0:
-            return 1.0
-        
-        return agreements / comparisons
-    
-    def _check_modal_alignment(self, state: 'CognitiveState') -> Tuple[float, List[str]]:
+    def _check_modal_alignment(self, state: 'CognitiveStateLike') -> Tuple[float, List[str]]:
         """
         Check if different cognitive modes (perception, intuition, reflection) align.
         
@@ -406,11 +647,10 @@ class CoherenceEngineV2:
         # This requires track metadata about their cognitive role
         # For now, use heuristic: fast tracks vs slow tracks should roughly agree
         
-        if not hasattr(state, 'tracks'):
+        if not state.tracks:
             return 1.0, []
         
-        fast_tracks = [t for t in state.tracks if t.period < 200]
-        slow_tracks = [t for t in state.tracks if t.period > 1000]
+        fast_tracks, slow_tracks = self._partition_tracks(state)
         
         if not fast_tracks or not slow_tracks:
             return 1.0, []
@@ -421,13 +661,49 @@ class CoherenceEngineV2:
         
         return consistency, misaligned
     
-    def _evaluate_context_appropriateness(self, state: 'CognitiveState') -> float:
+    def _partition_tracks(self, state: 'CognitiveStateLike') -> Tuple[List, List]:
+        """
+        Split state.tracks into (fast, slow) by period.
+        
+        Track configuration changes far less often than evaluations run, so
+        when the state exposes a non-None ``tracks_version`` counter the
+        partition is cached per tracks list and reused until the version
+        changes. States leaving it None (the default) are partitioned
+        fresh every call - the counter is only trustworthy if the owner
+        bumps it on every in-place edit.
+        """
+        tracks = state.tracks
+        version = state.tracks_version
+        key = id(tracks)
+        
+        if version is not None:
+            cached = self._track_partition_cache.get(key)
+            if cached is not None and cached[0] is tracks and cached[1] == version:
+                return cached[2], cached[3]
+        
+        fast_tracks = []
+        slow_tracks = []
+        for t in tracks:
+            period = t.period
+            if period < 200:
+                fast_tracks.append(t)
+            elif period > 1000:
+                slow_tracks.append(t)
+        
+        if version is not None:
+            if len(self._track_partition_cache) >= 32:
+                self._track_partition_cache.clear()
+            self._track_partition_cache[key] = (tracks, version, fast_tracks, slow_tracks)
+        
+        return fast_tracks, slow_tracks
+    
+    def _evaluate_context_appropriateness(self, state: 'CognitiveStateLike') -> float:
         """
         Validate that current cognitive state matches environmental demands.
         
         E.g., if danger is high but context is 'creative', that's inappropriate
         """
-        if not hasattr(state, 'context') or not hasattr(state, 'truth_values'):
+        if not state.truth_values:
             return 1.0
         
         context = state.context
@@ -447,47 +723,24 @@ class CoherenceEngineV2:
         
         return 1.0  # Default: appropriate
     
-    def _find_conflicting_tracks(self, state: 'CognitiveState') -> List[Tuple[str, str]]:
-        """Find pairs of tracks with conflicting values"""
-        conflicts = []
-        
-        for tv_name, tv in state.truth_values.items():
-            tracks = list(tv.tracks.keys())
-            for i, track1 in enumerate(tracks):
-                for track2 in tracks[i+1:]:
-                    val1 = tv.get(track1)
-                    val2 = tv.get(track2)
-                    
-                    if abs(val1 - val2) > 0.6:
-                        conflicts.append((f"{tv_name}.{track1}", f"{tv_name}.{track2}"))
-        
-        return conflicts
-    
     # ========== Correction Methods ==========
     
     def _resolve_contradictions(self, report: CoherenceReport, adjustments: CognitiveAdjustments):
         """Resolve detected contradictions"""
         for contradiction in report.contradictions[:3]:  # Top 3
             # Dampen the more extreme track
-            tv = contradiction['truthvalue']
-            track1 = contradiction['track1']
-            track2 = contradiction['track2']
-            val1 = contradiction['val1']
-            val2 = contradiction['val2']
+            tv = contradiction.truthvalue
+            pair = (contradiction.track1, contradiction.track2)
+            val1 = contradiction.val1
+            val2 = contradiction.val2
             
-            # Dampen whichever is more extreme
-            if abs(val1 - 0.5) > abs(val2 - 0.5):
-                adjustments.dampen_track(
-                    f"{tv}.{track1}",
-                    0.7,
-                    f"Contradiction with {track2}"
-                )
-            else:
-                adjustments.dampen_track(
-                    f"{tv}.{track2}",
-                    0.7,
-                    f"Contradiction with {track1}"
-                )
+            # Index of whichever is more extreme (ties go to track2)
+            k = int(abs(val2 - 0.5) >= abs(val1 - 0.5))
+            adjustments.dampen_track(
+                f"{tv}.{pair[k]}",
+                0.7,
+                f"Contradiction with {pair[1 - k]}"
+            )
     
     def _reduce_tension(self, report: CoherenceReport, adjustments: CognitiveAdjustments):
         """Reduce cognitive tension"""
@@ -534,19 +787,7 @@ class CoherenceEngineV2:
     
     def _goals_conflict(self, goal1: str, goal2: str) -> bool:
         """Check if two goals conflict"""
-        # Simplified - real version would use semantic understanding
-        conflict_pairs = [
-            ('explore', 'hide'),
-            ('attack', 'flee'),
-            ('trust', 'suspect'),
-        ]
-        
-        for g1, g2 in conflict_pairs:
-            if (g1 in goal1.lower() and g2 in goal2.lower()) or \
-               (g2 in goal1.lower() and g1 in goal2.lower()):
-                return True
-        
-        return False
+        return _tags_conflict(_goal_tags(goal1), _goal_tags(goal2))
     
     def get_statistics(self) -> Dict:
         """Get engine statistics"""
@@ -554,22 +795,40 @@ class CoherenceEngineV2:
             'total_evaluations': self.total_evaluations,
             'total_interventions': self.total_interventions,
             'intervention_rate': self.total_interventions / max(1, self.total_evaluations),
-            'avg_severity': sum(r.severity() for r in self.reports[-100:]) / max(1, len(self.reports[-100:])),
+            'avg_severity': self._severity_sum / max(1, len(self._severity_ring)),
             'recent_reports': len(self.reports),
+            'shape_cache_hits': self.shape_cache_hits,
         }
 
 
-# ========== Mock CognitiveState for Type Hints ==========
+# ========== Cognitive State ==========
 # Real version would import from actual cognitive architecture
 
+class CognitiveStateLike(Protocol):
+    """
+    What CoherenceEngineV2 reads from a cognitive state.
+    
+    Every field must be present (empty when unused); the engine checks
+    emptiness, not existence. ``tracks_version`` may be None, which
+    disables partition caching - see CoherenceEngineV2._partition_tracks.
+    """
+    truth_values: Dict
+    tracks: List
+    tracks_version: Optional[int]
+    context: str
+    goals: List[str]
+    emotions: Dict[str, float]
+
+
+@dataclass
 class CognitiveState:
     """
-    Mock cognitive state for type hints.
+    Minimal cognitive state satisfying CognitiveStateLike.
     Real implementation would come from HaackLang runtime.
     """
-    def __init__(self):
-        self.truth_values: Dict = {}
-        self.tracks: List = []
-        self.context: str = 'default'
-        self.goals: List[str] = []
-        self.emotions: Dict[str, float] = {}
+    truth_values: Dict = field(default_factory=dict)
+    tracks: List = field(default_factory=list)
+    tracks_version: Optional[int] = None  # Opt-in partition caching; bump on every track change
+    context: str = 'default'
+    goals: List[str] = field(default_factory=list)
+    emotions: Dict[str, float] = field(default_factory=dict)
@@ -11,10 +11,23 @@ Extends HaackLang from a guard language to a full cognitive DSL with:
 These operators compile to SCCE primitives and execute on the track system.
 """
 
-from typing import List, Dict, Optional, Callable, Any
+from typing import List, Dict, Optional, Callable, Any, Final
 from dataclasses import dataclass
+from functools import lru_cache, wraps
+import inspect
 import math
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+TWO_PI: Final[float] = 2.0 * math.pi
+
 
 # ========== Fuzzy Logic Operators ==========
 
@@ -39,6 +52,32 @@ def fuzzy_blend(a: float, b: float, weight: float = 0.5) -> float:
     return (1.0 - weight) * a + weight * b
 
 
+def make_fuzzy_blend(weight: float) -> Callable[[float, float], float]:
+    """
+    Specialize ⊕ for a weight known at parse time, e.g. ``⊕(0.1)``.
+    
+    The DSL compiler stores the returned closure so the per-call weight
+    arithmetic disappears: w=0.5 is a single add and multiply, w=0 and
+    w=1 just pick an operand.
+    
+    Args:
+        weight: Blend weight [0, 1]
+    
+    Returns:
+        Callable (a, b) -> blended value, equal to fuzzy_blend(a, b, weight)
+    """
+    if weight == 0.5:
+        return lambda a, b: (a + b) * 0.5
+    if weight == 0.0:
+        return lambda a, b: a
+    if weight == 1.0:
+        return lambda a, b: b
+    
+    w = weight
+    iw = 1.0 - weight
+    return lambda a, b: iw * a + w * b
+
+
 def fuzzy_product(a: float, b: float) -> float:
     """
     Fuzzy product operator: ⊗
@@ -90,9 +129,71 @@ def fuzzy_not(a: float) -> float:
     return 1.0 - a
 
 
+# ========== Vectorized Fuzzy Operators ==========
+# Batched versions for many truth values at once. Each takes an optional
+# ``out`` buffer (must not alias ``a``) so steady-state callers allocate
+# nothing; the algebra is rearranged so no temporaries are needed.
+
+def fuzzy_blend_vec(a: np.ndarray, b: np.ndarray, weight: float = 0.5,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Elementwise ⊕: (1 - w)*a + w*b, computed as a + w*(b - a)"""
+    out = np.subtract(b, a, out=out)
+    out *= weight
+    out += a
+    return out
+
+
+def fuzzy_product_vec(a: np.ndarray, b: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Elementwise ⊗: a * b"""
+    return np.multiply(a, b, out=out)
+
+
+def fuzzy_sum_vec(a: np.ndarray, b: np.ndarray,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Elementwise ⊞: a + b - a*b, computed as a + b*(1 - a)"""
+    out = np.subtract(1.0, a, out=out)
+    out *= b
+    out += a
+    return out
+
+
+def fuzzy_not_vec(a: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Elementwise ¬: 1 - a"""
+    return np.subtract(1.0, a, out=out)
+
+
+def uncertainty_vec(value: np.ndarray, confidence: float = 1.0,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Elementwise ~: value*c + 0.5*(1 - c), computed as 0.5 + c*(value - 0.5)"""
+    out = np.subtract(value, 0.5, out=out)
+    out *= confidence
+    out += 0.5
+    return out
+
+
+def _elementwise(scalar: Callable, vector: Callable, batch_type: type = np.ndarray) -> Callable:
+    """
+    Registry entry that runs ``vector`` for batch input, else ``scalar``.
+    
+    Keeps the scalar function's name/docstring so the registry still
+    reports e.g. 'fuzzy_blend'. Dispatches on the first parameter whether
+    it is passed positionally or by keyword.
+    """
+    first = next(iter(inspect.signature(scalar).parameters))
+    
+    @wraps(scalar)
+    def dispatch(*args, **kwargs):
+        lead = args[0] if args else kwargs.get(first)
+        if isinstance(lead, batch_type):
+            return vector(*args, **kwargs)
+        return scalar(*args, **kwargs)
+    return dispatch
+
+
 # ========== Paraconsistent Operators ==========
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParaconsistentValue:
     """
     Paraconsistent truth value: can hold both P and ¬P.
@@ -124,6 +225,23 @@ class ParaconsistentValue:
         return min(self.belief, self.disbelief)
 
 
+def make_pv(belief: float, disbelief: float) -> ParaconsistentValue:
+    """
+    Interned ParaconsistentValue for DSL literals.
+    
+    Values are immutable, so repeated constants such as (1.0, 0.0) or
+    (0.5, 0.5) can share one instance instead of allocating each time.
+    Inputs are coerced to float first, so ``make_pv(1, 0)`` and
+    ``make_pv(1.0, 0.0)`` share one float-valued instance.
+    """
+    return _interned_pv(float(belief), float(disbelief))
+
+
+@lru_cache(maxsize=4096)
+def _interned_pv(belief: float, disbelief: float) -> ParaconsistentValue:
+    return ParaconsistentValue(belief, disbelief)
+
+
 def paraconsistent_and(a: ParaconsistentValue, b: ParaconsistentValue) -> ParaconsistentValue:
     """
     Paraconsistent conjunction: ⊓
@@ -163,6 +281,79 @@ def paraconsistent_or(a: ParaconsistentValue, b: ParaconsistentValue) -> Paracon
     )
 
 
+class ParaconsistentArray:
+    """
+    Batch of paraconsistent values stored as two float32 arrays.
+    
+    Struct-of-arrays companion to ParaconsistentValue for evaluating
+    ⊓/⊔ over many propositions at once. float32 is plenty for [0, 1]
+    degrees and halves the memory traffic.
+    """
+    
+    def __init__(self, belief, disbelief):
+        self.belief = np.asarray(belief, dtype=np.float32)
+        self.disbelief = np.asarray(disbelief, dtype=np.float32)
+    
+    @classmethod
+    def empty(cls, n: int) -> 'ParaconsistentArray':
+        """Uninitialized batch of n values (for use as an ``out`` buffer)"""
+        return cls(np.empty(n, dtype=np.float32), np.empty(n, dtype=np.float32))
+    
+    @classmethod
+    def from_values(cls, values: List[ParaconsistentValue]) -> 'ParaconsistentArray':
+        """Pack a list of ParaconsistentValue"""
+        return cls([v.belief for v in values], [v.disbelief for v in values])
+    
+    def __len__(self) -> int:
+        return len(self.belief)
+    
+    def __getitem__(self, i: int) -> ParaconsistentValue:
+        return ParaconsistentValue(float(self.belief[i]), float(self.disbelief[i]))
+    
+    def is_contradictory(self, threshold: float = 0.5) -> np.ndarray:
+        """Boolean mask of contradictory values"""
+        return is_contradictory_vec(self, threshold)
+    
+    def is_uncertain(self, threshold: float = 0.5) -> np.ndarray:
+        """Boolean mask of uncertain values"""
+        return (self.belief < threshold) & (self.disbelief < threshold)
+    
+    def certainty(self) -> np.ndarray:
+        """Degree of certainty per value"""
+        return np.abs(self.belief - self.disbelief)
+    
+    def contradiction(self) -> np.ndarray:
+        """Degree of contradiction per value"""
+        return np.minimum(self.belief, self.disbelief)
+
+
+def paraconsistent_and_vec(a: ParaconsistentArray, b: ParaconsistentArray,
+                           out: Optional[ParaconsistentArray] = None) -> ParaconsistentArray:
+    """Elementwise ⊓ over two batches"""
+    if out is None:
+        return ParaconsistentArray(np.minimum(a.belief, b.belief),
+                                   np.minimum(a.disbelief, b.disbelief))
+    np.minimum(a.belief, b.belief, out=out.belief)
+    np.minimum(a.disbelief, b.disbelief, out=out.disbelief)
+    return out
+
+
+def paraconsistent_or_vec(a: ParaconsistentArray, b: ParaconsistentArray,
+                          out: Optional[ParaconsistentArray] = None) -> ParaconsistentArray:
+    """Elementwise ⊔ over two batches"""
+    if out is None:
+        return ParaconsistentArray(np.maximum(a.belief, b.belief),
+                                   np.maximum(a.disbelief, b.disbelief))
+    np.maximum(a.belief, b.belief, out=out.belief)
+    np.maximum(a.disbelief, b.disbelief, out=out.disbelief)
+    return out
+
+
+def is_contradictory_vec(a: ParaconsistentArray, threshold: float = 0.5) -> np.ndarray:
+    """Boolean mask: belief and disbelief both above threshold"""
+    return (a.belief > threshold) & (a.disbelief > threshold)
+
+
 def paraconsistent_to_fuzzy(p: ParaconsistentValue) -> float:
     """
     Convert paraconsistent value to fuzzy truth value.
@@ -177,56 +368,119 @@ def paraconsistent_to_fuzzy(p: ParaconsistentValue) -> float:
 
 # ========== Temporal Operators ==========
 
+def _trend_loop(y: np.ndarray, n: int) -> float:
+    """Least-squares slope of y[:n] against 0..n-1 (compiled by Numba)"""
+    # x = 0..n-1 is fixed-stride, so its mean and sum of squared
+    # deviations are closed-form: (n-1)/2 and n(n²-1)/12
+    x_mean = (n - 1) / 2.0
+    denominator = n * (n * n - 1) / 12.0
+    if denominator == 0.0:
+        return 0.0
+    
+    # One streaming pass: Σ(i - x̄)(yᵢ - ȳ) = Σ i·yᵢ - x̄·Σ yᵢ
+    sum_y = 0.0
+    sum_iy = 0.0
+    for i in range(n):
+        yi = float(y[i])  # Accumulate in float64 even for float32 windows
+        sum_y += yi
+        sum_iy += i * yi
+    
+    return (sum_iy - x_mean * sum_y) / denominator
+
+
+def _trend_numpy(y: np.ndarray, n: int) -> float:
+    """Least-squares slope of y[:n] against 0..n-1 (NumPy reductions)"""
+    denominator = n * (n * n - 1) / 12.0
+    if denominator == 0.0:
+        return 0.0
+    y = y[:n].astype(np.float64, copy=False)
+    sum_iy = float(np.arange(n, dtype=np.float64) @ y)
+    return (sum_iy - (n - 1) / 2.0 * float(y.sum())) / denominator
+
+
+# Compiled loop when Numba is installed, vectorized NumPy otherwise
+if NUMBA_AVAILABLE:
+    _trend_kernel = njit(cache=True, fastmath=True)(_trend_loop)
+else:
+    _trend_kernel = _trend_numpy
+
+
 class TemporalWindow:
     """
     Temporal window for storing recent values.
     
-    Used by last(n) operator.
+    Used by last(n) operator. Values live in a fixed circular buffer, so
+    add() is O(1) once the window is full; get_values() returns them
+    oldest-first. Truth values are [0, 1], so they are stored as float32;
+    timestamps keep float64 precision.
     """
     
     def __init__(self, size: int):
         self.size = size
-        self.values: List[float] = []
-        self.timestamps: List[float] = []
+        self.values = np.empty(size, dtype=np.float32)
+        self.timestamps = np.empty(size, dtype=np.float64)
+        self._head = 0  # Next slot to write
+        self._count = 0
+    
+    def __len__(self) -> int:
+        return self._count
     
     def add(self, value: float, timestamp: float):
-        """Add value to window"""
-        self.values.append(value)
-        self.timestamps.append(timestamp)
+        """Add value to window (overwrites the oldest once full)"""
+        if self.size <= 0:
+            return
         
-        # Keep only last N
-        if len(self.values) > self.size:
-            self.values.pop(0)
-            self.timestamps.pop(0)
-    
-    def get_values(self) -> List[float]:
-        """Get all values in window"""
-        return list(self.values)
+        head = self._head
+        self.values[head] = value
+        self.timestamps[head] = timestamp
+        self._head = (head + 1) % self.size
+        if self._count < self.size:
+            self._count += 1
+    
+    def get_values(self) -> np.ndarray:
+        """Get all values in window, oldest first"""
+        if self._count < self.size:
+            return self.values[:self._count].copy()
+        head = self._head
+        return np.concatenate((self.values[head:], self.values[:head]))
     
     def mean(self) -> float:
         """Average value in window"""
-        return sum(self.values) / len(self.values) if self.values else 0.0
+        return float(self.values[:self._count].mean()) if self._count else 0.0
     
     def trend(self) -> float:
         """Trend: positive = increasing, negative = decreasing"""
-        if len(self.values) < 2:
+        n = self._count
+        if n < 2:
             return 0.0
         
         # Simple linear regression slope
-        n = len(self.values)
-        x = list(range(n))
-        y = self.values
-        
-        x_mean = sum(x) / n
-        y_mean = sum(y) / n
-        
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.0
-        
-        return numerator / denominator
+        return _trend_kernel(self.get_values(), n)
+
+
+class TemporalWindowQ8(TemporalWindow):
+    """
+    TemporalWindow storing values as 8-bit fixed point (q = round(v * 255)).
+    
+    For long archival histories of [0, 1] values: a quarter of the float32
+    footprint at a resolution of 1/255. Values are clamped to [0, 1].
+    """
+    
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.values = np.empty(size, dtype=np.uint8)
+    
+    def add(self, value: float, timestamp: float):
+        """Quantize and add value to window"""
+        super().add(int(min(1.0, max(0.0, value)) * 255.0 + 0.5), timestamp)
+    
+    def get_values(self) -> np.ndarray:
+        """Get all values in window (dequantized), oldest first"""
+        return super().get_values().astype(np.float32) * np.float32(1.0 / 255.0)
+    
+    def mean(self) -> float:
+        """Average value in window"""
+        return float(self.values[:self._count].mean()) / 255.0 if self._count else 0.0
 
 
 def temporal_derivative(window: TemporalWindow) -> float:
@@ -248,7 +502,7 @@ def temporal_derivative(window: TemporalWindow) -> float:
     return window.trend()
 
 
-def temporal_last(window: TemporalWindow, n: int) -> List[float]:
+def temporal_last(window: TemporalWindow, n: int) -> np.ndarray:
     """
     Last N values operator: last(n)
     
@@ -259,7 +513,7 @@ def temporal_last(window: TemporalWindow, n: int) -> List[float]:
         n: Number of recent values to retrieve
     
     Returns:
-        List of last N values
+        Array of last N values, oldest first
     
     Example:
         last(3)  # Last 3 values
@@ -289,6 +543,27 @@ def temporal_future(current: float, derivative: float, steps: int = 1) -> float:
     return current + derivative * steps
 
 
+def temporal_future_vec(current: np.ndarray, derivative: np.ndarray,
+                        steps: np.ndarray) -> np.ndarray:
+    """
+    Batched future(): extrapolate K features over S horizons at once.
+    
+    Args:
+        current: (K,) current values
+        derivative: (K,) rates of change
+        steps: (S,) step counts to predict ahead
+    
+    Returns:
+        (K, S) array, entry [k, s] = current[k] + derivative[k] * steps[s]
+    """
+    current = np.asarray(current, dtype=np.float64)
+    derivative = np.asarray(derivative, dtype=np.float64)
+    steps = np.asarray(steps, dtype=np.float64)
+    out = np.multiply(derivative[:, None], steps[None, :])
+    out += current[:, None]
+    return out
+
+
 # ========== Multi-Track Operators ==========
 
 def track_sync(tracks: List['Track'], target_phase: float = 0.0):
@@ -326,18 +601,9 @@ def track_interference(track_a: 'Track', track_b: 'Track') -> float:
         if interfere(fast, slow) > 0.8:
             # Tracks are synchronized
     """
-    # Phase difference
-    phase_diff = abs(track_a.phase - track_b.phase)
-    
-    # Normalize to [0, π]
-    phase_diff = phase_diff % (2 * math.pi)
-    if phase_diff > math.pi:
-        phase_diff = 2 * math.pi - phase_diff
-    
-    # Convert to interference: 0° = +1, 180° = -1
-    interference = math.cos(phase_diff)
-    
-    return interference
+    # Interference: 0° = +1, 180° = -1. cos is even and 2π-periodic, so
+    # the raw phase difference needs no folding into [0, π]
+    return math.cos(track_a.phase - track_b.phase)
 
 
 def track_align(track_a: 'Track', track_b: 'Track', strength: float = 0.1):
@@ -354,19 +620,65 @@ def track_align(track_a: 'Track', track_b: 'Track', strength: float = 0.1):
     Example:
         align(intuition, perception, 0.2)  # Intuition follows perception
     """
-    # Compute phase difference
-    diff = track_b.phase - track_a.phase
-    
-    # Normalize to [-π, π]
-    while diff > math.pi:
-        diff -= 2 * math.pi
-    while diff < -math.pi:
-        diff += 2 * math.pi
+    # Phase difference, normalized to [-π, π] (IEEE remainder, no loop)
+    diff = math.remainder(track_b.phase - track_a.phase, TWO_PI)
     
     # Adjust phase
     track_a.phase += diff * strength
 
 
+class TrackBank:
+    """
+    Phases of many tracks in one contiguous float32 array.
+    
+    Lets sync/interfere run over whole track sets at once instead of one
+    Track object (and one math.cos) at a time.
+    """
+    
+    def __init__(self, names: List[str], phases, periods=None):
+        self.names = list(names)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.phases = np.asarray(phases, dtype=np.float32)
+        self.periods = (
+            np.asarray(periods, dtype=np.int32) if periods is not None
+            else np.zeros(len(self.names), dtype=np.int32)
+        )
+    
+    @classmethod
+    def from_tracks(cls, tracks: List['Track']) -> 'TrackBank':
+        """Snapshot a list of Track objects"""
+        return cls(
+            [t.name for t in tracks],
+            [t.phase for t in tracks],
+            [t.period for t in tracks]
+        )
+    
+    def apply_to(self, tracks: List['Track']):
+        """Write bank phases back onto Track objects (matched by name)"""
+        index = self.index
+        phases = self.phases
+        for track in tracks:
+            i = index.get(track.name)
+            if i is not None:
+                track.phase = float(phases[i])
+
+
+def track_sync_vec(bank: TrackBank, idxs, target_phase: float = 0.0):
+    """Batched sync(): set phases[idxs] to target_phase in one store"""
+    bank.phases[idxs] = target_phase
+
+
+def interference_matrix(bank: TrackBank) -> np.ndarray:
+    """
+    Pairwise interfere() for every track in the bank.
+    
+    Returns:
+        (N, N) array, entry [i, j] = cos(phase_i - phase_j) in [-1, 1]
+    """
+    phases = bank.phases
+    return np.cos(phases[:, None] - phases[None, :])
+
+
 # ========== Probabilistic Operators ==========
 
 def probability(evidence: float, prior: float = 0.5) -> float:
@@ -389,11 +701,8 @@ def probability(evidence: float, prior: float = 0.5) -> float:
     # P(H|E) ∝ P(E|H) * P(H)
     # Assuming P(E|H) = evidence, P(E|¬H) = 1 - evidence
     
-    likelihood_h = evidence
-    likelihood_not_h = 1.0 - evidence
-    
-    numerator = likelihood_h * prior
-    denominator = likelihood_h * prior + likelihood_not_h * (1.0 - prior)
+    numerator = evidence * prior
+    denominator = numerator + (1.0 - evidence) * (1.0 - prior)
     
     if denominator == 0:
         return prior
@@ -401,6 +710,21 @@ def probability(evidence: float, prior: float = 0.5) -> float:
     return numerator / denominator
 
 
+def probability_vec(evidence: np.ndarray, prior) -> np.ndarray:
+    """
+    Batched probability(): posterior for many evidence/prior pairs.
+    
+    Same algebra as the scalar operator; entries whose denominator is 0
+    fall back to their prior.
+    """
+    evidence = np.asarray(evidence, dtype=np.float64)
+    prior = np.broadcast_to(np.asarray(prior, dtype=np.float64), evidence.shape)
+    numerator = evidence * prior
+    denominator = numerator + (1.0 - evidence) * (1.0 - prior)
+    safe = denominator != 0
+    return np.divide(numerator, denominator, out=prior.copy(), where=safe)
+
+
 def uncertainty(value: float, confidence: float = 1.0) -> float:
     """
     Uncertainty operator: ~value
@@ -433,15 +757,15 @@ class OperatorRegistry:
     
     def __init__(self):
         self.operators: Dict[str, Callable] = {
-            # Fuzzy logic
-            '⊕': fuzzy_blend,
-            '⊗': fuzzy_product,
-            '⊞': fuzzy_sum,
-            '¬': fuzzy_not,
+            # Fuzzy logic (scalar or ndarray)
+            '⊕': _elementwise(fuzzy_blend, fuzzy_blend_vec),
+            '⊗': _elementwise(fuzzy_product, fuzzy_product_vec),
+            '⊞': _elementwise(fuzzy_sum, fuzzy_sum_vec),
+            '¬': _elementwise(fuzzy_not, fuzzy_not_vec),
             
             # Paraconsistent
-            '⊓': paraconsistent_and,
-            '⊔': paraconsistent_or,
+            '⊓': _elementwise(paraconsistent_and, paraconsistent_and_vec, ParaconsistentArray),
+            '⊔': _elementwise(paraconsistent_or, paraconsistent_or_vec, ParaconsistentArray),
             
             # Temporal
             'Δ': temporal_derivative,
@@ -454,8 +778,8 @@ class OperatorRegistry:
             'align': track_align,
             
             # Probabilistic
-            'P': probability,
-            '~': uncertainty,
+            'P': _elementwise(probability, probability_vec),
+            '~': _elementwise(uncertainty, uncertainty_vec),
         }
         
         # Aliases
@@ -466,26 +790,63 @@ class OperatorRegistry:
             'not': '¬',
             'derivative': 'Δ',
         }
-    
-    def get(self, operator: str) -> Optional[Callable]:
-        """Get operator implementation"""
-        # Check direct match
-        if operator in self.operators:
-            return self.operators[operator]
         
-        # Check alias
-        if operator in self.aliases:
-            return self.operators[self.aliases[operator]]
+        # Symbols and aliases resolved into one flat table for get(), plus
+        # integer IDs into a tuple for compiled programs (get_id/get_by_id)
+        self._dispatch: Dict[str, Callable] = {}
+        self._id_map: Dict[str, int] = {}
+        self._table: tuple = ()
+        self._rebuild_dispatch()
+        
+        # list_operators() result, dropped whenever an operator is registered
+        self._op_list_cache: Optional[List[str]] = None
+    
+    def _rebuild_dispatch(self):
+        """Resolve aliases once so lookups are a single dict probe"""
+        dispatch = {
+            alias: self.operators[target]
+            for alias, target in self.aliases.items()
+            if target in self.operators
+        }
+        dispatch.update(self.operators)  # Direct symbols win over aliases
+        self._dispatch = dispatch
+        
+        # IDs follow registration order, so existing IDs stay stable
+        id_map = {symbol: i for i, symbol in enumerate(self.operators)}
+        for alias, target in self.aliases.items():
+            if alias not in id_map and target in id_map:
+                id_map[alias] = id_map[target]
+        self._id_map = id_map
+        self._table = tuple(self.operators.values())
+    
+    def get_id(self, operator: str) -> Optional[int]:
+        """
+        Resolve a symbol or alias to its integer operator ID.
         
-        return None
+        Meant to be called once at compile time; the program then
+        dispatches with get_by_id() and never hashes the symbol again.
+        """
+        return self._id_map.get(operator)
+    
+    def get_by_id(self, op_id: int) -> Callable:
+        """Operator implementation for an ID from get_id()"""
+        return self._table[op_id]
+    
+    def get(self, operator: str) -> Optional[Callable]:
+        """Get operator implementation (symbol or alias)"""
+        return self._dispatch.get(operator)
     
     def register(self, symbol: str, func: Callable):
         """Register custom operator"""
         self.operators[symbol] = func
+        self._rebuild_dispatch()
+        self._op_list_cache = None
     
     def list_operators(self) -> List[str]:
-        """List all available operators"""
-        return list(self.operators.keys())
+        """List all available operators (shared list - don't mutate)"""
+        if self._op_list_cache is None:
+            self._op_list_cache = list(self.operators.keys())
+        return self._op_list_cache
 
 
 # ========== Global Registry ==========
@@ -542,6 +903,8 @@ if __name__ == "__main__":
 
 class Track:
     """Mock track class for type hints"""
+    __slots__ = ('name', 'period', 'phase')
+    
     def __init__(self, name: str, period: int, phase: float = 0.0):
         self.name = name
         self.period = period
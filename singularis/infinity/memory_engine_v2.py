@@ -14,12 +14,57 @@ Key concepts:
 - Forgetting respects harmonic structure
 """
 
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, Final, List, Optional, Tuple, Set
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+import itertools
 import time
 import math
 import numpy as np
+from loguru import logger
+
+from ._memory_kernels import (
+    NUMBA_AVAILABLE,
+    NUMBA_MIN_ROWS,
+    batch_rhythm_similarity,
+    batch_similarity_numpy,
+    compute_interference_nb,
+    rhythm_similarity,
+)
+
+
+TWO_PI: Final[float] = math.tau
+_INV_PI: Final[float] = 1.0 / math.pi  # Multiply instead of dividing by π
+
+# Access clock: a process-wide monotonic tick instead of a wall-clock read
+# on every recall. last_access values are comparable across engines.
+_next_tick = itertools.count(1).__next__
+
+# Strengths live in [0, 1] and are stored as unsigned 16-bit fixed point.
+# (8 bits is too coarse: the default decay rate of 0.001 would round to a
+# decay factor of exactly 1.0 and memories would never fade.)
+STRENGTH_SCALE: Final[int] = 65535
+FORGET_THRESHOLD: Final[float] = 0.1
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k largest scores, best first.
+    
+    Uses a partial partition (O(n)) and only sorts the winners. Equal
+    scores keep index order, matching a stable descending sort sliced to
+    ``[:k]``; callers that need insertion order pass scores pre-sorted by
+    seq.
+    """
+    n = scores.size
+    if k <= 0 or k >= n:
+        return np.argsort(-scores, kind='stable')[:k]
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - above.size]
+    idx = np.sort(np.concatenate((above, ties)))
+    return idx[np.argsort(-scores[idx], kind='stable')]
 
 
 class MemoryType(Enum):
@@ -41,42 +86,77 @@ class RhythmSignature:
     """
     track_phases: Dict[str, float]  # Phase of each track at encoding time
     track_periods: Dict[str, int]   # Period of each track
-    interference_pattern: List[float]  # Interference strength over time
+    interference_pattern: np.ndarray  # Interference strength over time (float32)
     dominant_frequency: float  # Primary rhythm
     
+    def __post_init__(self):
+        # Lists are accepted for convenience; pooled float32 rows pass through
+        self.interference_pattern = np.asarray(self.interference_pattern, dtype=np.float32)
+        
+        # Sorted track axis shared by the vectorized similarity kernels.
+        # Signatures are treated as immutable once built; rebuild the
+        # signature rather than editing track_phases in place.
+        names = tuple(sorted(self.track_phases))
+        self._keys = frozenset(names)
+        self._track_names = names
+        self._name_array = np.array(names, dtype=str)
+        self._phases = np.fromiter(
+            (self.track_phases[n] for n in names), dtype=np.float64, count=len(names)
+        )
+        self._periods = np.fromiter(
+            (self.track_periods.get(n, 0) for n in names), dtype=np.int32, count=len(names)
+        )
+    
+    def __eq__(self, other):
+        # Field-wise like the generated __eq__, but arrays compare by value
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.track_phases == other.track_phases and
+            self.track_periods == other.track_periods and
+            np.array_equal(self.interference_pattern, other.interference_pattern) and
+            self.dominant_frequency == other.dominant_frequency
+        )
+    
     def compute_similarity(self, other: 'RhythmSignature') -> float:
         """
         Compute similarity between two rhythm signatures.
         
         Uses phase correlation and frequency matching.
         """
-        if not self.track_phases or not other.track_phases:
+        n1 = len(self._track_names)
+        n2 = len(other._track_names)
+        if n1 == 0 or n2 == 0:
             return 0.0
         
-        # 1. Track overlap
-        common_tracks = set(self.track_phases.keys()) & set(other.track_phases.keys())
-        if not common_tracks:
+        # 1. Track overlap (cached key sets; no arrays touched when disjoint)
+        n_common = len(self._keys & other._keys)
+        if n_common == 0:
             return 0.0
         
-        overlap_score = len(common_tracks) / max(len(self.track_phases), len(other.track_phases))
+        overlap_score = n_common / max(n1, n2)
         
-        # 2. Phase similarity (circular distance)
-        phase_similarities = []
-        for track in common_tracks:
-            p1 = self.track_phases[track]
-            p2 = other.track_phases[track]
-            
-            # Circular distance (phases wrap at 2π)
-            diff = abs(p1 - p2)
-            diff = min(diff, 2 * math.pi - diff)
-            similarity = 1.0 - (diff / math.pi)
-            phase_similarities.append(similarity)
+        # Indices of the shared tracks in each signature
+        _, i1, i2 = np.intersect1d(
+            self._name_array, other._name_array,
+            assume_unique=True, return_indices=True
+        )
         
-        phase_score = sum(phase_similarities) / len(phase_similarities)
+        # Compiled single-pass kernel when Numba is installed
+        if rhythm_similarity is not None:
+            return rhythm_similarity(
+                self._phases, other._phases, i1, i2,
+                self.dominant_frequency, other.dominant_frequency, n1, n2
+            )
+        
+        # 2. Phase similarity (circular distance, phases wrap at 2π)
+        diff = np.abs(self._phases[i1] - other._phases[i2])
+        diff = np.minimum(diff, TWO_PI - diff)
+        phase_score = float((1.0 - diff * _INV_PI).mean())
         
         # 3. Frequency similarity
         freq_diff = abs(self.dominant_frequency - other.dominant_frequency)
-        freq_score = math.exp(-freq_diff / 10.0)
+        freq_score = math.exp(freq_diff * -0.1)
         
         # Weighted combination
         total_similarity = 0.4 * overlap_score + 0.4 * phase_score + 0.2 * freq_score
@@ -87,10 +167,66 @@ class RhythmSignature:
         return f"RhythmSignature({len(self.track_phases)} tracks, f={self.dominant_frequency:.2f})"
 
 
+class _StoreColumn:
+    """
+    MemoryTrace field kept in a MemoryEngineV2 column while the trace is
+    stored, so engine sweeps (decay, eviction) run over contiguous arrays.
+    Detached traces hold the value in their own __dict__.
+    """
+    
+    def __init__(self, column: str, cast, default=None):
+        self.column = column
+        self.cast = cast
+        self.default = default
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # Class access: dataclass reads the field default from here
+            if self.default is None:
+                raise AttributeError(self.name)
+            return self.default
+        store = obj._store
+        if store is None:
+            return obj.__dict__[self.name]
+        return self.cast(getattr(store, self.column)[obj._slot])
+    
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj.__dict__[self.name] = value
+        else:
+            getattr(store, self.column)[obj._slot] = value
+
+
+class _StrengthColumn(_StoreColumn):
+    """
+    Strength is stored as the value at its last update; the engine applies
+    the elapsed decay lazily when it is read.
+    """
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None or obj._store is None:
+            return super().__get__(obj, objtype)
+        return obj._store._effective_strength(obj._slot)
+    
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj.__dict__[self.name] = value
+        else:
+            store._set_strengths(np.array([obj._slot]), np.array([value], dtype=np.float64))
+
+
 @dataclass
 class MemoryTrace:
     """
     A single memory trace with temporal-rhythmic encoding.
+    
+    While stored in a MemoryEngineV2, the strength/consolidation fields
+    and timestamps live in the engine's column arrays (see _StoreColumn).
     """
     memory_id: str
     memory_type: MemoryType
@@ -100,21 +236,29 @@ class MemoryTrace:
     rhythm_signature: RhythmSignature
     
     # Temporal context
-    timestamp: float
+    timestamp: float = _StoreColumn('_timestamp', float)
     context: str  # Context name when encoded
     
     # Strength and consolidation
-    strength: float = 1.0
-    access_count: int = 0
-    last_access: float = field(default_factory=time.time)
+    strength: float = _StrengthColumn('_strength_q', float, 1.0)
+    access_count: int = _StoreColumn('_access_count', int, 0)
+    last_access: int = _StoreColumn('_last_access', int, 0)  # Access tick (0 = stamp on creation)
     
     # Consolidation
-    is_consolidated: bool = False
-    consolidation_count: int = 0  # How many times reinforced
+    is_consolidated: bool = _StoreColumn('_is_cons', bool, False)
+    consolidation_count: int = _StoreColumn('_cons_count', int, 0)  # How many times reinforced
     
     # Associations
     associated_memories: Set[str] = field(default_factory=set)
     
+    # Owning engine and row while stored (not dataclass fields)
+    _store = None
+    _slot = -1
+    
+    def __post_init__(self):
+        if self.last_access == 0:
+            self.last_access = _next_tick()
+    
     def decay(self, rate: float):
         """Apply forgetting decay"""
         self.strength *= (1.0 - rate)
@@ -123,7 +267,7 @@ class MemoryTrace:
         """Reinforce memory on access"""
         self.strength = min(1.0, self.strength + amount)
         self.access_count += 1
-        self.last_access = time.time()
+        self.last_access = _next_tick()
         self.consolidation_count += 1
     
     def should_consolidate(self, threshold: int = 3) -> bool:
@@ -138,6 +282,11 @@ class MemoryTrace:
         return f"Memory({self.memory_id}, {self.memory_type.value}, strength={self.strength:.2f})"
 
 
+_STORE_FIELDS = tuple(
+    name for name, value in vars(MemoryTrace).items() if isinstance(value, _StoreColumn)
+)
+
+
 @dataclass
 class SemanticPattern:
     """
@@ -189,18 +338,66 @@ class MemoryEngineV2:
         semantic_capacity: int = 500,
         decay_rate: float = 0.001,
         consolidation_threshold: int = 3,
-        verbose: bool = True
+        verbose: bool = True,
+        decay_knee: int = 1000,
+        phasor_recall: bool = False
     ):
         self.episodic_capacity = episodic_capacity
         self.semantic_capacity = semantic_capacity
         self.decay_rate = decay_rate
         self.consolidation_threshold = consolidation_threshold
         self.verbose = verbose
+        self.decay_knee = max(1, decay_knee)
+        self.phasor_recall = phasor_recall
         
         # Memory stores
         self.episodic_memories: Dict[str, MemoryTrace] = {}
         self.semantic_patterns: Dict[str, SemanticPattern] = {}
         
+        # Structure-of-arrays mirror of the episodic store. Each memory owns
+        # one row (slot); tracks share a global column vocabulary so recall
+        # scores every memory with a single vectorized kernel.
+        self._n_slots = episodic_capacity + 1  # encode may briefly overshoot
+        self._track_ids: Dict[str, int] = {}
+        self._track_names: List[str] = []  # Column -> track name
+        self._slot_of: Dict[str, int] = {}
+        self._mem_by_slot: List[Optional[MemoryTrace]] = [None] * self._n_slots
+        self._free_slots: List[int] = list(range(self._n_slots - 1, -1, -1))
+        self._live = np.zeros(self._n_slots, dtype=bool)
+        self._dom_freq = np.zeros(self._n_slots, dtype=np.float64)
+        self._track_count = np.zeros(self._n_slots, dtype=np.int32)
+        self._phase_matrix = np.zeros((self._n_slots, 0), dtype=np.float64)
+        self._period_matrix = np.zeros((self._n_slots, 0), dtype=np.int32)
+        self._track_mask = np.zeros((self._n_slots, 0), dtype=bool)
+        self._phasors = np.zeros((self._n_slots, 0), dtype=np.complex64)  # e^{iφ}, 0 if absent
+        
+        # Per-slot interference rows; encode computes straight into them
+        self._interference_window = 10
+        self._interference_pool = np.zeros(
+            (self._n_slots, self._interference_window), dtype=np.float32
+        )
+        
+        # Hot per-memory fields backing MemoryTrace (see _StoreColumn)
+        self._strength_q = np.zeros(self._n_slots, dtype=np.uint16)  # Fixed point
+        self._updated_at = np.zeros(self._n_slots, dtype=np.int64)  # Decay epoch of last write
+        self._is_cons = np.zeros(self._n_slots, dtype=bool)
+        self._access_count = np.zeros(self._n_slots, dtype=np.int32)
+        self._cons_count = np.zeros(self._n_slots, dtype=np.int32)
+        self._timestamp = np.zeros(self._n_slots, dtype=np.float64)
+        self._last_access = np.zeros(self._n_slots, dtype=np.int64)
+        self._seq = np.zeros(self._n_slots, dtype=np.int64)  # Insertion order
+        self._context_ids: Dict[str, int] = {}
+        self._context_id = np.zeros(self._n_slots, dtype=np.int32)
+        self._by_context: Dict[str, Set[int]] = defaultdict(set)  # context -> slots
+        self._next_seq = 0
+        
+        # Lazy forgetting: apply_forgetting only advances the decay epoch;
+        # strengths are decayed when read, and a sweep runs only once the
+        # earliest possible death epoch has been reached.
+        self._decay_epoch = 0
+        self._decay_rate_applied = decay_rate
+        self._next_death = math.inf
+        
         # Statistics
         self.total_encodings = 0
         self.total_recalls = 0
@@ -208,10 +405,10 @@ class MemoryEngineV2:
         self.total_forgotten = 0
         
         if self.verbose:
-            print("[MEMORY ENGINE V2] Initialized")
-            print(f"  Episodic capacity: {episodic_capacity}")
-            print(f"  Semantic capacity: {semantic_capacity}")
-            print(f"  Decay rate: {decay_rate}")
+            logger.info(
+                "[MEMORY ENGINE V2] Initialized (episodic capacity: {}, semantic capacity: {}, decay rate: {})",
+                episodic_capacity, semantic_capacity, decay_rate
+            )
     
     def encode_episodic(
         self,
@@ -245,9 +442,20 @@ class MemoryEngineV2:
         else:
             dominant_freq = 0.0
         
-        # Use provided interference or compute simple one
+        # Re-encoding an id replaces the old trace but keeps its place in
+        # eviction order, like the dict entry it overwrites
+        seq = None
+        if memory_id in self._slot_of:
+            seq = int(self._seq[self._slot_of[memory_id]])
+            self._release_slot(memory_id)
+        
+        # Use provided interference or compute simple one into the row of
+        # the slot this memory is about to take
         if interference_pattern is None:
-            interference_pattern = self._compute_interference(track_phases, track_periods)
+            interference_pattern = self._compute_interference(
+                track_phases, track_periods,
+                out=self._interference_pool[self._free_slots[-1]]
+            )
         
         rhythm_sig = RhythmSignature(
             track_phases=track_phases,
@@ -268,6 +476,7 @@ class MemoryEngineV2:
         
         # Store memory
         self.episodic_memories[memory_id] = memory
+        self._attach_slot(memory, seq)
         self.total_encodings += 1
         
         # Check capacity
@@ -275,8 +484,10 @@ class MemoryEngineV2:
             self._forget_weakest_episodic()
         
         if self.verbose:
-            print(f"[MEMORY ENGINE V2] Encoded: {memory_id}")
-            print(f"  Context: {context}, Tracks: {len(track_phases)}")
+            logger.debug(
+                "[MEMORY ENGINE V2] Encoded: {} (context: {}, tracks: {})",
+                memory_id, context, len(track_phases)
+            )
         
         return memory
     
@@ -299,28 +510,27 @@ class MemoryEngineV2:
         """
         self.total_recalls += 1
         
-        # Compute similarity with all episodic memories
-        similarities = []
-        
-        for memory_id, memory in self.episodic_memories.items():
-            similarity = query_rhythm.compute_similarity(memory.rhythm_signature)
-            
-            if similarity >= threshold:
-                similarities.append((memory, similarity))
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        # Score every stored memory at once, then keep those above threshold
+        # in seq order so ties rank by insertion, not by reused slot index
+        scores = self._rhythm_scores(query_rhythm)
+        candidates = np.flatnonzero(scores >= threshold)
+        candidates = candidates[np.argsort(self._seq[candidates])]
+        best = candidates[_top_k(scores[candidates], top_k)]
+        mem_by_slot = self._mem_by_slot
+        similarities = [(mem_by_slot[i], float(scores[i])) for i in best]
         
         # Reinforce accessed memories
-        for memory, sim in similarities[:top_k]:
-            memory.reinforce(amount=0.05)
+        self._reinforce_slots(best, amount=0.05)
         
         if self.verbose and similarities:
-            print(f"[MEMORY ENGINE V2] Recalled {len(similarities[:top_k])} memories")
-            for mem, sim in similarities[:top_k]:
-                print(f"  {mem.memory_id}: similarity={sim:.3f}")
-        
-        return similarities[:top_k]
+            # lazy: the per-memory listing is only built if DEBUG is emitted
+            logger.opt(lazy=True).debug(
+                "[MEMORY ENGINE V2] Recalled {} memories: {}",
+                lambda: len(similarities),
+                lambda: ", ".join(f"{mem.memory_id}={sim:.3f}" for mem, sim in similarities)
+            )
+        
+        return similarities
     
     def recall_by_context(
         self,
@@ -339,19 +549,22 @@ class MemoryEngineV2:
         """
         self.total_recalls += 1
         
-        # Filter by context and sort by strength
-        context_memories = [
-            mem for mem in self.episodic_memories.values()
-            if mem.context == context
-        ]
+        # Only the context's own slots are scanned; seq order keeps ties
+        # in insertion order
+        group = self._by_context.get(context)
+        if not group:
+            return []
+        slots = np.fromiter(group, dtype=np.intp, count=len(group))
+        slots = slots[np.argsort(self._seq[slots])]
         
-        context_memories.sort(key=lambda m: m.strength, reverse=True)
+        best = slots[_top_k(self._effective_strengths(slots), top_k)]
+        mem_by_slot = self._mem_by_slot
+        top = [mem_by_slot[i] for i in best]
         
         # Reinforce
-        for memory in context_memories[:top_k]:
-            memory.reinforce(amount=0.05)
+        self._reinforce_slots(best, amount=0.05)
         
-        return context_memories[:top_k]
+        return top
     
     def consolidate_episodic_to_semantic(
         self,
@@ -370,28 +583,26 @@ class MemoryEngineV2:
         """
         # Auto-select episodes if not provided
         if episode_ids is None:
-            # Find episodes ready for consolidation
-            candidates = [
-                mem for mem in self.episodic_memories.values()
-                if mem.should_consolidate(self.consolidation_threshold)
-            ]
-            
+            # Episodes ready for consolidation (MemoryTrace.should_consolidate
+            # as one mask over the store), in insertion order
+            ready = (
+                self._live
+                & (self._cons_count >= self.consolidation_threshold)
+                & (self._effective_strengths() > 0.5)
+            )
+            candidates = np.flatnonzero(ready)
             if len(candidates) < 2:
                 return None
+            candidates = candidates[np.argsort(self._seq[candidates])]
             
-            # Group by context
-            context_groups = {}
-            for mem in candidates:
-                if mem.context not in context_groups:
-                    context_groups[mem.context] = []
-                context_groups[mem.context].append(mem)
-            
-            # Pick largest group
-            if not context_groups:
-                return None
+            # Largest context group; ties go to the context seen first
+            contexts = self._context_id[candidates]
+            ids, first_seen, counts = np.unique(contexts, return_index=True, return_counts=True)
+            largest = np.flatnonzero(counts == counts.max())
+            best = ids[largest[np.argmin(first_seen[largest])]]
             
-            largest_group = max(context_groups.values(), key=len)
-            episodes = largest_group[:5]  # Max 5 episodes per pattern
+            slots = candidates[contexts == best][:5]  # Max 5 episodes per pattern
+            episodes = [self._mem_by_slot[i] for i in slots]
             episode_ids = [mem.memory_id for mem in episodes]
         else:
             episodes = [self.episodic_memories[eid] for eid in episode_ids if eid in self.episodic_memories]
@@ -399,23 +610,21 @@ class MemoryEngineV2:
         if len(episodes) < 2:
             return None
         
-        # Average rhythm signatures
-        avg_phases = {}
-        avg_periods = {}
-        all_tracks = set()
+        # Average rhythm signatures straight from the store rows: tracks an
+        # episode lacks count as phase 0.0 / period 100
+        slots = [self._slot_of[ep.memory_id] for ep in episodes]
+        mask = self._track_mask[slots]
+        columns = np.flatnonzero(mask.any(axis=0))
+        mask = mask[:, columns]
+        phases = np.where(mask, self._phase_matrix[slots][:, columns], 0.0)
+        periods = np.where(mask, self._period_matrix[slots][:, columns], 100)
         
-        for ep in episodes:
-            all_tracks.update(ep.rhythm_signature.track_phases.keys())
-        
-        for track in all_tracks:
-            phases = [ep.rhythm_signature.track_phases.get(track, 0.0) for ep in episodes]
-            periods = [ep.rhythm_signature.track_periods.get(track, 100) for ep in episodes]
-            
-            avg_phases[track] = sum(phases) / len(phases)
-            avg_periods[track] = int(sum(periods) / len(periods))
+        track_names = [self._track_names[c] for c in columns]
+        avg_phases = dict(zip(track_names, phases.mean(axis=0).tolist()))
+        avg_periods = dict(zip(track_names, periods.mean(axis=0).astype(int).tolist()))
         
         # Average dominant frequency
-        avg_freq = sum(ep.rhythm_signature.dominant_frequency for ep in episodes) / len(episodes)
+        avg_freq = float(self._dom_freq[slots].mean())
         
         # Create abstracted rhythm signature
         abstract_rhythm = RhythmSignature(
@@ -447,8 +656,10 @@ class MemoryEngineV2:
             ep.is_consolidated = True
         
         if self.verbose:
-            print(f"[MEMORY ENGINE V2] Consolidated pattern: {pattern_id}")
-            print(f"  Type: {pattern_type}, Episodes: {len(episode_ids)}")
+            logger.debug(
+                "[MEMORY ENGINE V2] Consolidated pattern: {} (type: {}, episodes: {})",
+                pattern_id, pattern_type, len(episode_ids)
+            )
         
         return pattern
     
@@ -501,76 +712,317 @@ class MemoryEngineV2:
         """
         Apply harmonic forgetting to all memories.
         
-        Memories decay over time, respecting harmonic structure.
+        Memories decay over time, respecting harmonic structure. Each call
+        is one forgetting step: exponential decay at decay_rate, turning
+        into a power-law tail after decay_knee steps. Decay is applied
+        lazily on read, so a call is O(1) unless some memory may have
+        crossed the forgetting threshold.
         """
-        forgotten_count = 0
+        # A changed rate only applies from now on
+        if self.decay_rate != self._decay_rate_applied:
+            self._rebase_strengths()
         
-        # Decay episodic memories
-        to_remove = []
-        for memory_id, memory in self.episodic_memories.items():
-            memory.decay(self.decay_rate)
-            
-            if memory.strength < 0.1:
-                to_remove.append(memory_id)
-                forgotten_count += 1
+        self._decay_epoch += 1
+        if self._decay_epoch < self._next_death:
+            return
+        
+        live = np.flatnonzero(self._live)
+        dead = live[self._effective_strengths(live) < FORGET_THRESHOLD]
+        forgotten_count = len(dead)
+        mem_by_slot = self._mem_by_slot
+        for memory_id in [mem_by_slot[i].memory_id for i in dead]:
+            self._remove_episodic(memory_id)
         
-        for memory_id in to_remove:
-            del self.episodic_memories[memory_id]
+        live = np.flatnonzero(self._live)
+        self._next_death = self._death_epochs(live).min(initial=math.inf)
         
         self.total_forgotten += forgotten_count
         
         if self.verbose and forgotten_count > 0:
-            print(f"[MEMORY ENGINE V2] Forgot {forgotten_count} weak memories")
+            logger.debug("[MEMORY ENGINE V2] Forgot {} weak memories", forgotten_count)
     
     def _forget_weakest_episodic(self):
         """Remove weakest episodic memory when at capacity"""
         if not self.episodic_memories:
             return
         
-        # Find weakest non-consolidated memory
-        weakest = min(
-            (m for m in self.episodic_memories.values() if not m.is_consolidated),
-            key=lambda m: m.strength,
-            default=None
+        # Find weakest non-consolidated memory (oldest first on ties)
+        evictable = self._live & ~self._is_cons
+        if not evictable.any():
+            return
+        strength = np.where(evictable, self._effective_strengths(), np.inf)
+        weakest = strength == strength.min()
+        slot = int(np.argmin(np.where(weakest, self._seq, np.iinfo(np.int64).max)))
+        
+        self._remove_episodic(self._mem_by_slot[slot].memory_id)
+        self.total_forgotten += 1
+    
+    # ========== Episodic Store ==========
+    
+    def _track_column(self, track: str) -> int:
+        """Column index for a track, growing the track axis on first use."""
+        tid = self._track_ids.get(track)
+        if tid is not None:
+            return tid
+        tid = len(self._track_ids)
+        self._track_ids[track] = tid
+        self._track_names.append(track)
+        width = self._phase_matrix.shape[1]
+        if tid >= width:
+            new_width = max(8, width * 2)
+            pad = ((0, 0), (0, new_width - width))
+            self._phase_matrix = np.pad(self._phase_matrix, pad)
+            self._period_matrix = np.pad(self._period_matrix, pad)
+            self._track_mask = np.pad(self._track_mask, pad)
+            self._phasors = np.pad(self._phasors, pad)
+        return tid
+    
+    def _context_column(self, context: str) -> int:
+        """Interned integer id for a context name."""
+        cid = self._context_ids.get(context)
+        if cid is None:
+            cid = self._context_ids[context] = len(self._context_ids)
+        return cid
+    
+    def _attach_slot(self, memory: MemoryTrace, seq: Optional[int] = None):
+        """Move a trace's hot fields and rhythm signature into a free row."""
+        slot = self._free_slots.pop()
+        sig = memory.rhythm_signature
+        
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        self._seq[slot] = seq
+        self._context_id[slot] = self._context_column(memory.context)
+        self._by_context[memory.context].add(slot)
+        
+        # Column-backed fields move from the trace into the store
+        values = {name: memory.__dict__.pop(name) for name in _STORE_FIELDS}
+        memory._store = self
+        memory._slot = slot
+        for name, value in values.items():
+            setattr(memory, name, value)
+        
+        columns = [self._track_column(t) for t in sig._track_names]
+        self._phase_matrix[slot] = 0.0
+        self._period_matrix[slot] = 0
+        self._track_mask[slot] = False
+        self._phasors[slot] = 0.0
+        if columns:
+            self._phase_matrix[slot, columns] = sig._phases
+            self._period_matrix[slot, columns] = sig._periods
+            self._track_mask[slot, columns] = True
+            self._phasors[slot, columns] = np.exp(1j * sig._phases)
+        self._track_count[slot] = len(columns)
+        self._dom_freq[slot] = sig.dominant_frequency
+        self._live[slot] = True
+        
+        self._slot_of[memory.memory_id] = slot
+        self._mem_by_slot[slot] = memory
+    
+    def _remove_episodic(self, memory_id: str):
+        """Delete an episodic memory and release its store row."""
+        del self.episodic_memories[memory_id]
+        self._release_slot(memory_id)
+    
+    def _release_slot(self, memory_id: str):
+        """Return a memory's row to the free list."""
+        slot = self._slot_of.pop(memory_id)
+        self._live[slot] = False
+        
+        # Hand the column values back so the detached trace stays usable
+        memory = self._mem_by_slot[slot]
+        group = self._by_context[memory.context]
+        group.discard(slot)
+        if not group:
+            del self._by_context[memory.context]
+        values = {name: getattr(memory, name) for name in _STORE_FIELDS}
+        sig = memory.rhythm_signature
+        if sig.interference_pattern.base is self._interference_pool:
+            sig.interference_pattern = sig.interference_pattern.copy()  # Row is reused
+        memory._store = None
+        memory._slot = -1
+        memory.__dict__.update(values)
+        self._mem_by_slot[slot] = None
+        self._free_slots.append(slot)
+    
+    # ========== Lazy Decay ==========
+    
+    def _decay_factor(self, dt: np.ndarray) -> np.ndarray:
+        """
+        Fraction of strength kept after dt forgetting steps.
+        
+        Exponential (1 - rate)^dt up to decay_knee steps, then a power-law
+        tail (dt / knee)^-b with b chosen so the curve and its slope are
+        continuous at the knee. Old memories fade more slowly than a pure
+        exponential would predict.
+        """
+        rate = self._decay_rate_applied
+        dt = np.asarray(dt, dtype=np.float64)
+        if rate <= 0.0:
+            return np.ones_like(dt)
+        if rate >= 1.0:
+            return (dt <= 0).astype(np.float64)
+        
+        knee = self.decay_knee
+        log_keep = math.log1p(-rate)
+        factor = np.exp(np.minimum(dt, knee) * log_keep)
+        tail = dt > knee
+        if tail.any():
+            factor[tail] *= (dt[tail] / knee) ** (log_keep * knee)
+        return factor
+    
+    def _effective_strengths(self, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """Current strengths (float) for the given slots, or all slots."""
+        if slots is None:
+            slots = slice(None)
+        s0 = self._strength_q[slots] / STRENGTH_SCALE
+        return s0 * self._decay_factor(self._decay_epoch - self._updated_at[slots])
+    
+    def _effective_strength(self, slot: int) -> float:
+        return float(self._effective_strengths(np.array([slot]))[0])
+    
+    def _set_strengths(self, slots: np.ndarray, values: np.ndarray):
+        """Write strengths as of the current epoch (restarts their decay)."""
+        q = np.rint(np.clip(values, 0.0, 1.0) * STRENGTH_SCALE)
+        self._strength_q[slots] = q.astype(np.uint16)
+        self._updated_at[slots] = self._decay_epoch
+        self._next_death = min(self._next_death, self._death_epochs(slots).min(initial=math.inf))
+    
+    def _death_epochs(self, slots: np.ndarray) -> np.ndarray:
+        """
+        Lower bound on the epoch at which each slot drops below the
+        forgetting threshold (inverts _decay_factor; one epoch of slack
+        absorbs rounding, the sweep itself re-checks exactly).
+        """
+        s0 = self._strength_q[slots] / STRENGTH_SCALE
+        start = self._updated_at[slots].astype(np.float64)
+        rate = self._decay_rate_applied
+        if rate <= 0.0:
+            return np.where(s0 < FORGET_THRESHOLD, start, math.inf)
+        if rate >= 1.0:
+            return start + 1.0
+        
+        knee = self.decay_knee
+        log_keep = math.log1p(-rate)
+        with np.errstate(divide='ignore'):
+            ratio = np.log(np.maximum(s0, 1e-12) / FORGET_THRESHOLD)
+            dt = ratio / -log_keep
+            past_knee = dt > knee
+            if past_knee.any():
+                level = ratio[past_knee] + log_keep * knee  # log(s0 * keep^knee / threshold)
+                dt[past_knee] = knee * np.exp(level / (-log_keep * knee))
+        dt = np.maximum(np.floor(dt) - 1.0, 0.0)
+        return start + dt
+    
+    def _rebase_strengths(self):
+        """Fold elapsed decay into the stored values, e.g. before a rate change."""
+        live = np.flatnonzero(self._live)
+        values = self._effective_strengths(live)
+        self._decay_rate_applied = self.decay_rate
+        self._next_death = math.inf
+        self._set_strengths(live, values)
+    
+    def _reinforce_slots(self, slots: np.ndarray, amount: float):
+        """Vectorized MemoryTrace.reinforce over a set of stored rows."""
+        if slots.size == 0:
+            return
+        self._set_strengths(slots, np.minimum(self._effective_strengths(slots) + amount, 1.0))
+        self._access_count[slots] += 1
+        self._cons_count[slots] += 1
+        self._last_access[slots] = _next_tick()  # One tick per recall call
+    
+    def _rhythm_scores(self, query: RhythmSignature) -> np.ndarray:
+        """
+        Similarity of the query against every slot (same formula as
+        RhythmSignature.compute_similarity). Empty slots score -inf.
+        """
+        scores = np.full(self._n_slots, -np.inf)
+        live = self._live
+        if not live.any():
+            return scores
+        
+        n_query = len(query._track_names)
+        if n_query == 0:
+            scores[live] = 0.0
+            return scores
+        
+        width = self._phase_matrix.shape[1]
+        q_phase = np.zeros(width)
+        q_mask = np.zeros(width, dtype=bool)
+        for name, phase in zip(query._track_names, query._phases):
+            tid = self._track_ids.get(name)
+            if tid is not None:
+                q_phase[tid] = phase
+                q_mask[tid] = True
+        
+        if self.phasor_recall:
+            self._phasor_scores(q_phase, q_mask, n_query, query.dominant_frequency, scores)
+            return scores
+        
+        # Large stores go through the fused compiled kernel when available
+        if NUMBA_AVAILABLE and len(self._slot_of) > NUMBA_MIN_ROWS:
+            kernel = batch_rhythm_similarity
+        else:
+            kernel = batch_similarity_numpy
+        kernel(
+            self._phase_matrix, self._track_mask, self._track_count, live,
+            q_phase, q_mask, n_query, self._dom_freq, query.dominant_frequency, scores
         )
+        return scores
+    
+    def _phasor_scores(self, q_phase: np.ndarray, q_mask: np.ndarray,
+                       n_query: int, q_freq: float, out: np.ndarray):
+        """
+        Recall scores from phasor inner products (phasor_recall=True).
+        
+        Each memory row holds e^{iφ} for its tracks (0 elsewhere), so one
+        complex matrix-vector product gives Σ cos(Δφ) over the shared
+        tracks of every memory; a second, real one counts them. The phase
+        term is (1 + mean cos Δφ) / 2, which agrees with the default
+        1 - |Δφ|/π at Δφ = 0 and π and ranks each track the same way,
+        but is not numerically identical to it. Cost is two BLAS GEMVs
+        instead of several (memories x tracks) temporaries.
+        """
+        q = np.where(q_mask, np.exp(1j * q_phase), 0.0).astype(np.complex64)
+        cos_sum = (self._phasors @ q.conj()).real
+        n_common = self._track_mask.astype(np.float32) @ q_mask.astype(np.float32)
+        
+        overlap = n_common / np.maximum(self._track_count, n_query)
+        phase_score = 0.5 * (1.0 + cos_sum / np.maximum(n_common, 1.0))
+        freq_score = np.exp(np.abs(self._dom_freq - q_freq) * -0.1)
         
-        if weakest:
-            del self.episodic_memories[weakest.memory_id]
-            self.total_forgotten += 1
+        total = 0.4 * overlap + 0.4 * phase_score + 0.2 * freq_score
+        out[:] = np.where(n_common > 0, total, 0.0)
+        out[~self._live] = -np.inf
     
     def _compute_interference(
         self,
         track_phases: Dict[str, float],
         track_periods: Dict[str, int],
-        window: int = 10
-    ) -> List[float]:
+        window: int = 10,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """
         Compute interference pattern over time window.
         
-        Returns list of interference strengths.
+        Returns array of interference strengths, written into `out`
+        (length `window`) when given.
         """
+        if out is None:
+            out = np.empty(window, dtype=np.float32)
         if not track_phases:
-            return []
-        
-        interference = []
+            return out[:0]
         
-        for t in range(window):
-            # Compute phase alignment at time t
-            total_alignment = 0.0
-            
-            for track, base_phase in track_phases.items():
-                period = track_periods[track]
-                current_phase = (base_phase + (2 * math.pi * t / period)) % (2 * math.pi)
-                
-                # Alignment is cos(phase) - peaks at 0, 2π
-                alignment = math.cos(current_phase)
-                total_alignment += alignment
-            
-            # Normalize
-            avg_alignment = total_alignment / len(track_phases)
-            interference.append(avg_alignment)
+        n = len(track_phases)
+        phases = np.fromiter(track_phases.values(), dtype=np.float64, count=n)
+        periods = np.fromiter(
+            (track_periods[track] for track in track_phases), dtype=np.float64, count=n
+        )
         
-        return interference
+        # Alignment is cos(phase), peaking at 0, 2π; averaged over tracks
+        compute_interference_nb(phases, periods, window, out)
+        return out
     
     def get_statistics(self) -> Dict:
         """Get memory system statistics"""
@@ -581,8 +1033,12 @@ class MemoryEngineV2:
             'total_recalls': self.total_recalls,
             'total_consolidations': self.total_consolidations,
             'total_forgotten': self.total_forgotten,
-            'avg_episodic_strength': sum(m.strength for m in self.episodic_memories.values()) / max(1, len(self.episodic_memories)),
-            'avg_semantic_confidence': sum(p.confidence for p in self.semantic_patterns.values()) / max(1, len(self.semantic_patterns))
+            'avg_episodic_strength': float(self._effective_strengths(self._live).sum()) / max(1, len(self.episodic_memories)),
+            # Summed on demand: patterns are public and their confidence
+            # can change outside the engine (activate(), direct writes)
+            'avg_semantic_confidence': math.fsum(
+                p.confidence for p in self.semantic_patterns.values()
+            ) / max(1, len(self.semantic_patterns))
         }
     
     def __repr__(self):
@@ -11,10 +11,19 @@ Key features:
 - Context-specific cognitive modifiers
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional, Callable, Any
 from enum import Enum
+import bisect
+import heapq
+import itertools
+import operator
+import threading
 import time
+from types import MappingProxyType
+
+from loguru import logger
 
 
 class ContextLevel(Enum):
@@ -24,7 +33,7 @@ class ContextLevel(Enum):
     CONDITIONAL = "conditional"  # Rule-based transitions
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     """
     Individual context with metadata and modifiers.
@@ -38,70 +47,159 @@ class Context:
     name: str
     level: ContextLevel
     
-    # Temporal
+    # Temporal (time.monotonic() seconds, immune to wall-clock steps)
     expires_at: Optional[float] = None
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.monotonic)
     duration: Optional[float] = None
     
-    # Hierarchy
+    # Hierarchy (children are derived from the stack, see children())
     parent_context: Optional['Context'] = None
-    child_contexts: List['Context'] = field(default_factory=list)
     
     # Cognitive modifiers
-    track_amplifications: Dict[str, float] = field(default_factory=dict)
-    track_suppressions: Dict[str, float] = field(default_factory=dict)
+    track_amplifications: Mapping[str, float] = field(default_factory=dict)
+    track_suppressions: Mapping[str, float] = field(default_factory=dict)
     coherence_threshold: Optional[float] = None
-    emotion_modulation: Dict[str, float] = field(default_factory=dict)
+    emotion_modulation: Mapping[str, float] = field(default_factory=dict)
     plasticity_factor: float = 1.0
     
     # Metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # "Context(name, level" prefix of __repr__, built once
+    _static_repr: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._static_repr = f"Context({self.name}, {self.level.value}"
+    
     def is_expired(self) -> bool:
         """Check if context has expired"""
-        if self.expires_at is None:
-            return False
-        return time.time() > self.expires_at
+        return self.is_expired_at(time.monotonic())
+    
+    def is_expired_at(self, now: float) -> bool:
+        """is_expired() against a timestamp the caller already read"""
+        return self.expires_at is not None and now > self.expires_at
     
     def time_remaining(self) -> Optional[float]:
         """Get remaining time in seconds"""
         if self.expires_at is None:
             return None
-        return max(0.0, self.expires_at - time.time())
+        return max(0.0, self.expires_at - time.monotonic())
     
     def age(self) -> float:
         """Get context age in seconds"""
-        return time.time() - self.created_at
+        return time.monotonic() - self.created_at
+    
+    def children(self, stack: 'ContextStack') -> List['Context']:
+        """Contexts on `stack` that were pushed directly on top of this one"""
+        return [c for c in stack.stack if c.parent_context is self]
     
     def __repr__(self):
-        status = "expired" if self.is_expired() else "active"
-        if self.expires_at:
-            remaining = self.time_remaining()
-            return f"Context({self.name}, {self.level.value}, {status}, {remaining:.1f}s left)"
-        return f"Context({self.name}, {self.level.value}, {status})"
+        if self.expires_at is None:
+            return f"{self._static_repr}, active)"
+        now = time.monotonic()
+        status = "expired" if self.is_expired_at(now) else "active"
+        remaining = max(0.0, self.expires_at - now)
+        return f"{self._static_repr}, {status}, {remaining:.1f}s left)"
+
 
+class StateSnapshot(NamedTuple):
+    """Commonly read cognitive-state fields, captured once per update"""
+    danger: float
+    stress: float
+    context: str
 
-@dataclass
+
+def _snapshot(state: 'CognitiveState') -> StateSnapshot:
+    """Read the snapshot fields (states may omit any of them)"""
+    return StateSnapshot(
+        getattr(state, 'danger', 0.0),
+        getattr(state, 'stress', 0.0),
+        getattr(state, 'context', 'default'),
+    )
+
+
+@dataclass(slots=True)
 class ConditionalRule:
     """
     Rule for automatic context transitions.
     
     When condition(state) is True, perform action on target_context.
+    If condition_tuple is set it is evaluated instead, against a
+    StateSnapshot shared by every rule in the same update.
     """
     condition: Callable[['CognitiveState'], bool]
     action: str  # 'enter' or 'exit'
     target_context: Context
     priority: int = 0
     cooldown: float = 0.0  # Minimum time between activations
-    last_triggered: float = 0.0
+    last_triggered: float = float('-inf')  # Monotonic; never triggered yet
+    condition_tuple: Optional[Callable[[StateSnapshot], bool]] = None
+    
+    @classmethod
+    def from_threshold(
+        cls,
+        attr: str,
+        op: Any,
+        value: Any,
+        action: str,
+        target_context: Context,
+        priority: int = 0,
+        cooldown: float = 0.0,
+    ) -> 'ConditionalRule':
+        """
+        Rule firing when `state.<attr> <op> value`.
+        
+        `op` is a comparison string ('>', '>=', '<', '<=', '==', '!=') or a
+        two-argument callable such as operator.gt. The attribute lookup and
+        comparison are bound once here, so evaluating the rule is a single
+        call instead of a user lambda + closure lookup.
+        
+        Example:
+            ConditionalRule.from_threshold('danger', '>', 0.7, 'enter', survival)
+        """
+        if isinstance(op, str):
+            try:
+                op = _COMPARISONS[op]
+            except KeyError:
+                raise ValueError(f"Unknown comparison: {op!r}") from None
+        
+        def fast(state, _get=operator.attrgetter(attr), _op=op, _value=value):
+            return _op(_get(state), _value)
+        
+        return cls(
+            condition=fast,
+            action=action,
+            target_context=target_context,
+            priority=priority,
+            cooldown=cooldown,
+        )
     
     def can_trigger(self) -> bool:
         """Check if enough time has passed since last trigger"""
-        return (time.time() - self.last_triggered) >= self.cooldown
+        return self.can_trigger_at(time.monotonic())
     
-    def trigger(self):
+    def can_trigger_at(self, now: float) -> bool:
+        """can_trigger() against a timestamp the caller already read"""
+        return (now - self.last_triggered) >= self.cooldown
+    
+    def trigger(self, now: Optional[float] = None):
         """Mark as triggered"""
-        self.last_triggered = time.time()
+        self.last_triggered = time.monotonic() if now is None else now
+
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+
+def _neg_priority(rule: ConditionalRule) -> int:
+    """Sort key for MetaContextSystem.context_rules (highest priority first)"""
+    return -rule.priority
 
 
 class ContextStack:
@@ -110,65 +208,174 @@ class ContextStack:
     
     Contexts are pushed/popped in LIFO order.
     Top of stack = currently active context.
+    
+    Safe to share between threads: mutations (which also update parent
+    links and the name index) hold a lock, while peek/find/depth read
+    without one, relying on single list/dict operations being atomic.
     """
     
-    def __init__(self, max_depth: int = 10):
-        self.stack: List[Context] = []
-        self.max_depth = max_depth
+    __slots__ = (
+        'stack', 'max_depth', 'push', '_by_name', '_lock',
+        '_expiry', '_expiry_seq', '_untimed',
+    )
     
-    def push(self, context: Context) -> bool:
+    def __init__(self, max_depth: Optional[int] = 10):
         """
-        Push context onto stack.
-        
-        Returns:
-            True if successful, False if stack full
+        Args:
+            max_depth: Maximum number of stacked contexts, or None for no
+                limit (push then skips the depth check entirely)
         """
-        if len(self.stack) >= self.max_depth:
-            return False
+        self.stack: List[Context] = []
+        self.max_depth = max_depth
         
-        # Set parent relationship
-        if self.stack:
-            context.parent_context = self.stack[-1]
-            self.stack[-1].child_contexts.append(context)
+        # push(context) -> bool: True if successful, False if stack full
+        self.push: Callable[[Context], bool] = (
+            self._push_unbounded if max_depth is None else self._push_bounded
+        )
+        self._by_name: Dict[str, Context] = {}  # name -> lowest context with that name
+        self._lock = threading.Lock()
         
-        self.stack.append(context)
-        return True
+        # Min-heap of (expires_at, seq, context) for timed contexts; entries
+        # for contexts removed early are dropped lazily in expired()
+        self._expiry: List[tuple] = []
+        self._expiry_seq = itertools.count()
+        
+        # id -> stack context with no expiry; expired() schedules any that
+        # gained an expires_at after being pushed
+        self._untimed: Dict[int, Context] = {}
+    
+    def _push_bounded(self, context: Context) -> bool:
+        """push() when max_depth is set"""
+        with self._lock:
+            if len(self.stack) >= self.max_depth:
+                return False
+            
+            # Set parent relationship
+            if self.stack:
+                context.parent_context = self.stack[-1]
+            
+            self.stack.append(context)
+            self._by_name.setdefault(context.name, context)
+            self._schedule(context)
+            return True
+    
+    def _push_unbounded(self, context: Context) -> bool:
+        """push() when max_depth is None: same as _push_bounded minus the check"""
+        with self._lock:
+            if self.stack:
+                context.parent_context = self.stack[-1]
+            
+            self.stack.append(context)
+            self._by_name.setdefault(context.name, context)
+            self._schedule(context)
+            return True
     
     def pop(self) -> Optional[Context]:
         """Pop context from stack"""
-        if not self.stack:
-            return None
-        
-        context = self.stack.pop()
+        with self._lock:
+            if not self.stack:
+                return None
+            context = self.stack.pop()
+            self._unindex(context)
         
         # Clear parent relationship
-        if context.parent_context:
-            context.parent_context.child_contexts.remove(context)
-            context.parent_context = None
+        context.parent_context = None
         
         return context
     
     def peek(self) -> Optional[Context]:
         """Get top context without removing"""
-        return self.stack[-1] if self.stack else None
+        try:
+            return self.stack[-1]
+        except IndexError:
+            return None
     
     def find(self, name: str) -> Optional[Context]:
         """Find context by name in stack"""
-        for context in self.stack:
-            if context.name == name:
-                return context
-        return None
+        return self._by_name.get(name)
     
     def remove(self, context: Context) -> bool:
         """Remove specific context from stack"""
-        if context in self.stack:
-            self.stack.remove(context)
+        with self._lock:
+            try:
+                removed = self.stack.pop(self.stack.index(context))
+            except ValueError:
+                return False
+            self._unindex(removed)
             return True
-        return False
     
     def clear(self):
         """Clear entire stack"""
-        self.stack.clear()
+        with self._lock:
+            self.stack.clear()
+            self._by_name.clear()
+            self._expiry.clear()
+            self._untimed.clear()
+    
+    def reschedule(self, context: Context):
+        """
+        Re-register a stacked context after changing its expires_at.
+        
+        Needed only to move an expiry earlier; setting one on an untimed
+        context or extending it is picked up by expired() on its own.
+        """
+        with self._lock:
+            if any(c is context for c in self.stack):
+                self._schedule(context)
+    
+    def expired(self, now: float) -> List[Context]:
+        """
+        Contexts on the stack whose expiry is before `now`, in stack order.
+        
+        Does not remove them. Costs O(untimed contexts) when nothing is
+        due. Expiry is registered at push time; setting or extending
+        expires_at afterwards is honoured, moving it earlier takes effect
+        at the original time unless reschedule() is called.
+        """
+        heap = self._expiry
+        due = {}  # id -> context; a context pushed twice has two entries
+        with self._lock:
+            untimed = self._untimed
+            if untimed:
+                for context in [c for c in untimed.values() if c.expires_at is not None]:
+                    self._schedule(context)
+            while heap and heap[0][0] < now:
+                at, _, context = heapq.heappop(heap)
+                if not any(c is context for c in self.stack):
+                    continue  # Removed early
+                if context.expires_at is None:
+                    untimed[id(context)] = context  # Made untimed; watch again
+                    continue
+                if context.expires_at != at:
+                    # Expiry moved after the push: re-key and look again
+                    heapq.heappush(heap, (context.expires_at, next(self._expiry_seq), context))
+                    continue
+                due[id(context)] = context
+            if not due:
+                return []
+            return [c for c in self.stack if id(c) in due]
+    
+    def _schedule(self, context: Context):
+        """Register a stacked context's current expiry (caller holds the lock)"""
+        if context.expires_at is None:
+            self._untimed[id(context)] = context
+        else:
+            self._untimed.pop(id(context), None)
+            heapq.heappush(self._expiry, (context.expires_at, next(self._expiry_seq), context))
+    
+    def _unindex(self, context: Context):
+        """Drop a removed context from the indexes (caller holds the lock)"""
+        if not any(c is context for c in self.stack):
+            self._untimed.pop(id(context), None)
+        name = context.name
+        if self._by_name.get(name) is not context:
+            return
+        del self._by_name[name]
+        # Same name pushed more than once (rare): fall back to the next one
+        for other in self.stack:
+            if other.name == name:
+                self._by_name[name] = other
+                break
     
     def depth(self) -> int:
         """Get current stack depth"""
@@ -187,11 +394,15 @@ class MetaContextSystem:
     Applies context-specific cognitive modifications.
     """
     
-    def __init__(self, verbose: bool = True):
+    __slots__ = (
+        'context_stack', 'context_rules', 'context_history', 'verbose',
+        'total_transitions', 'total_expirations', 'total_rule_triggers',
+    )
+    
+    def __init__(self, verbose: bool = True, history_size: int = 1024):
         self.context_stack = ContextStack()
-        self.active_contexts: List[Context] = []
-        self.context_rules: List[ConditionalRule] = []
-        self.context_history: List[Context] = []
+        self.context_rules: List[ConditionalRule] = []  # Highest priority first
+        self.context_history: Deque[Context] = deque(maxlen=history_size)  # Oldest dropped first
         self.verbose = verbose
         
         # Statistics
@@ -200,7 +411,12 @@ class MetaContextSystem:
         self.total_rule_triggers = 0
         
         if verbose:
-            print("[META-CONTEXT] System initialized")
+            logger.info("[META-CONTEXT] System initialized")
+    
+    @property
+    def active_contexts(self) -> List[Context]:
+        """Active contexts (the stack itself; kept for older callers)"""
+        return self.context_stack.stack
     
     def push_context(
         self,
@@ -220,21 +436,22 @@ class MetaContextSystem:
         # Set expiration if duration provided
         if duration is not None:
             context.duration = duration
-            context.expires_at = time.time() + duration
+            context.expires_at = time.monotonic() + duration
         
         # Push onto stack
         success = self.context_stack.push(context)
         
         if success:
-            self.active_contexts.append(context)
             self.total_transitions += 1
             
             # Apply context modifiers
             self.apply_context_modifiers(context)
             
             if self.verbose:
-                print(f"[META-CONTEXT] + Pushed: {context}")
-                print(f"[META-CONTEXT]   Stack depth: {self.context_stack.depth()}")
+                logger.debug(
+                    "[META-CONTEXT] + Pushed: {} (stack depth: {})",
+                    context, self.context_stack.depth()
+                )
         
         return success
     
@@ -257,9 +474,6 @@ class MetaContextSystem:
             removed = context
         
         if removed:
-            if removed in self.active_contexts:
-                self.active_contexts.remove(removed)
-            
             self.context_history.append(removed)
             self.total_transitions += 1
             
@@ -267,8 +481,10 @@ class MetaContextSystem:
             self.restore_previous_context()
             
             if self.verbose:
-                print(f"[META-CONTEXT] - Popped: {removed.name}")
-                print(f"[META-CONTEXT]   Stack depth: {self.context_stack.depth()}")
+                logger.debug(
+                    "[META-CONTEXT] - Popped: {} (stack depth: {})",
+                    removed.name, self.context_stack.depth()
+                )
         
         return removed
     
@@ -281,41 +497,59 @@ class MetaContextSystem:
         - Evaluate conditional rules
         - Apply context transitions
         """
+        # One clock read per cycle, shared by every expiry/cooldown check
+        now = time.monotonic()
+        
         # 1. Check timed contexts for expiration
-        expired = [c for c in self.active_contexts if c.is_expired()]
-        for context in expired:
+        for context in self.context_stack.expired(now):
             if self.verbose:
-                print(f"[META-CONTEXT] EXPIRED: {context.name}")
+                logger.debug("[META-CONTEXT] EXPIRED: {}", context.name)
             self.pop_context(context)
             self.total_expirations += 1
         
         # 2. Evaluate conditional context rules
-        for rule in sorted(self.context_rules, key=lambda r: r.priority, reverse=True):
-            if not rule.can_trigger():
+        snap = None  # Built on first use by a snapshot rule
+        for rule in self.context_rules:
+            if (now - rule.last_triggered) < rule.cooldown:
+                continue
+            
+            # Cheap presence test first: a rule whose action would be a
+            # no-op never pays for its condition callback
+            existing = self.context_stack.find(rule.target_context.name)
+            if rule.action == 'enter':
+                if existing is not None:
+                    continue
+            elif rule.action == 'exit':
+                if existing is None:
+                    continue
+            else:
                 continue
             
             try:
-                if rule.condition(cognitive_state):
+                if rule.condition_tuple is not None:
+                    if snap is None:
+                        snap = _snapshot(cognitive_state)
+                    fired = rule.condition_tuple(snap)
+                else:
+                    fired = rule.condition(cognitive_state)
+                
+                if fired:
                     if rule.action == 'enter':
-                        # Check if already active
-                        if not self.context_stack.find(rule.target_context.name):
-                            self.push_context(rule.target_context)
-                            rule.trigger()
-                            self.total_rule_triggers += 1
-                            
-                            if self.verbose:
-                                print(f"[META-CONTEXT] RULE triggered: {rule.target_context.name}")
+                        self.push_context(rule.target_context)
+                        rule.trigger(now)
+                        self.total_rule_triggers += 1
+                        
+                        if self.verbose:
+                            logger.debug("[META-CONTEXT] RULE triggered: {}", rule.target_context.name)
                     
-                    elif rule.action == 'exit':
-                        existing = self.context_stack.find(rule.target_context.name)
-                        if existing:
-                            self.pop_context(existing)
-                            rule.trigger()
-                            self.total_rule_triggers += 1
+                    else:
+                        self.pop_context(existing)
+                        rule.trigger(now)
+                        self.total_rule_triggers += 1
             
             except Exception as e:
                 if self.verbose:
-                    print(f"[META-CONTEXT] WARNING Rule error: {e}")
+                    logger.warning("[META-CONTEXT] Rule error: {}", e)
     
     def apply_context_modifiers(self, context: Context):
         """
@@ -323,45 +557,51 @@ class MetaContextSystem:
         
         This modifies the cognitive state based on context-specific settings.
         """
-        if self.verbose and (context.track_amplifications or context.track_suppressions):
-            print(f"[META-CONTEXT] Applying modifiers for '{context.name}'")
+        # Modifiers have no effect beyond logging yet, so quiet runs skip
+        # the dict walks entirely
+        if not self.verbose:
+            return
+        self._log_modifiers(context)
+    
+    def _log_modifiers(self, context: Context):
+        """Log the modifiers a context applies (verbose only)"""
+        if context.track_amplifications or context.track_suppressions:
+            logger.debug("[META-CONTEXT] Applying modifiers for '{}'", context.name)
         
-        # Track amplifications
         for track, factor in context.track_amplifications.items():
-            if self.verbose:
-                print(f"  + Amplify {track} by {factor}x")
+            logger.debug("  + Amplify {} by {}x", track, factor)
         
-        # Track suppressions
         for track, factor in context.track_suppressions.items():
-            if self.verbose:
-                print(f"  - Suppress {track} by {factor}x")
+            logger.debug("  - Suppress {} by {}x", track, factor)
         
-        # Coherence threshold
         if context.coherence_threshold is not None:
-            if self.verbose:
-                print(f"  * Coherence threshold: {context.coherence_threshold}")
+            logger.debug("  * Coherence threshold: {}", context.coherence_threshold)
         
-        # Emotion modulation
         for emotion, factor in context.emotion_modulation.items():
-            if self.verbose:
-                print(f"  ~ Modulate {emotion} by {factor}x")
+            logger.debug("  ~ Modulate {} by {}x", emotion, factor)
         
-        # Plasticity
         if context.plasticity_factor != 1.0:
-            if self.verbose:
-                print(f"  @ Plasticity: {context.plasticity_factor}x")
+            logger.debug("  @ Plasticity: {}x", context.plasticity_factor)
     
     def restore_previous_context(self):
         """Restore modifiers from previous context"""
+        if not self.verbose:
+            return
         previous = self.context_stack.peek()
         if previous:
             self.apply_context_modifiers(previous)
     
     def add_rule(self, rule: ConditionalRule):
-        """Add conditional context rule"""
-        self.context_rules.append(rule)
+        """
+        Add conditional context rule.
+        
+        Rules are kept sorted by descending priority (ties in insertion
+        order), so update_contexts never re-sorts. Changing a rule's
+        priority after adding it requires remove_rule() + add_rule().
+        """
+        bisect.insort_right(self.context_rules, rule, key=_neg_priority)
         if self.verbose:
-            print(f"[META-CONTEXT] + Added rule: {rule.action} '{rule.target_context.name}'")
+            logger.debug("[META-CONTEXT] + Added rule: {} '{}'", rule.action, rule.target_context.name)
     
     def remove_rule(self, rule: ConditionalRule):
         """Remove conditional rule"""
@@ -382,7 +622,7 @@ class MetaContextSystem:
             'total_transitions': self.total_transitions,
             'total_expirations': self.total_expirations,
             'total_rule_triggers': self.total_rule_triggers,
-            'active_contexts': len(self.active_contexts),
+            'active_contexts': self.context_stack.depth(),
             'stack_depth': self.context_stack.depth(),
             'total_rules': len(self.context_rules),
             'history_size': len(self.context_history),
@@ -394,23 +634,34 @@ class MetaContextSystem:
 
 # ========== Predefined Context Templates ==========
 
+# Modifier tables shared read-only by every context a template creates.
+# Assign a new dict to a context's field to customise it.
+_SURVIVAL_AMP = MappingProxyType({'perception': 1.5, 'fast_response': 1.8})
+_SURVIVAL_SUP = MappingProxyType({'reflection': 0.3, 'creativity': 0.2})
+_SURVIVAL_EMO = MappingProxyType({'fear': 1.2, 'alertness': 1.5})
+
+_CREATIVE_AMP = MappingProxyType({'intuition': 1.4, 'divergent_thinking': 1.6})
+_CREATIVE_SUP = MappingProxyType({'critical_analysis': 0.6})
+_CREATIVE_EMO = MappingProxyType({'curiosity': 1.3, 'openness': 1.4})
+
+_LEARNING_AMP = MappingProxyType({'reflection': 1.5, 'memory_consolidation': 1.8})
+_LEARNING_EMO = MappingProxyType({'focus': 1.3})
+
+_REFLECTION_AMP = MappingProxyType({'metacognition': 1.6, 'introspection': 1.5})
+_REFLECTION_SUP = MappingProxyType({'fast_response': 0.4})
+
+_THREAT_AMP = MappingProxyType({'perception': 2.0, 'danger_assessment': 1.8})
+_THREAT_SUP = MappingProxyType({'reflection': 0.1})
+
+
 def create_survival_context() -> Context:
     """Create survival/danger context"""
     return Context(
         name='survival',
         level=ContextLevel.MACRO,
-        track_amplifications={
-            'perception': 1.5,
-            'fast_response': 1.8,
-        },
-        track_suppressions={
-            'reflection': 0.3,
-            'creativity': 0.2,
-        },
-        emotion_modulation={
-            'fear': 1.2,
-            'alertness': 1.5,
-        },
+        track_amplifications=_SURVIVAL_AMP,
+        track_suppressions=_SURVIVAL_SUP,
+        emotion_modulation=_SURVIVAL_EMO,
         coherence_threshold=0.5,
         plasticity_factor=0.7,
     )
@@ -421,17 +672,9 @@ def create_creative_context() -> Context:
     return Context(
         name='creative',
         level=ContextLevel.MACRO,
-        track_amplifications={
-            'intuition': 1.4,
-            'divergent_thinking': 1.6,
-        },
-        track_suppressions={
-            'critical_analysis': 0.6,
-        },
-        emotion_modulation={
-            'curiosity': 1.3,
-            'openness': 1.4,
-        },
+        track_amplifications=_CREATIVE_AMP,
+        track_suppressions=_CREATIVE_SUP,
+        emotion_modulation=_CREATIVE_EMO,
         coherence_threshold=0.6,  # Lower threshold = more tolerance for chaos
         plasticity_factor=1.3,
     )
@@ -442,13 +685,8 @@ def create_learning_context() -> Context:
     return Context(
         name='learning',
         level=ContextLevel.MACRO,
-        track_amplifications={
-            'reflection': 1.5,
-            'memory_consolidation': 1.8,
-        },
-        emotion_modulation={
-            'focus': 1.3,
-        },
+        track_amplifications=_LEARNING_AMP,
+        emotion_modulation=_LEARNING_EMO,
         coherence_threshold=0.7,
         plasticity_factor=1.5,  # High plasticity for learning
     )
@@ -459,13 +697,8 @@ def create_reflection_context() -> Context:
     return Context(
         name='reflection',
         level=ContextLevel.MACRO,
-        track_amplifications={
-            'metacognition': 1.6,
-            'introspection': 1.5,
-        },
-        track_suppressions={
-            'fast_response': 0.4,
-        },
+        track_amplifications=_REFLECTION_AMP,
+        track_suppressions=_REFLECTION_SUP,
         coherence_threshold=0.8,  # High coherence required
         plasticity_factor=1.0,
     )
@@ -477,13 +710,8 @@ def create_threat_evaluation_context(duration: float = 3.0) -> Context:
         name='evaluate_threat',
         level=ContextLevel.MICRO,
         duration=duration,
-        track_amplifications={
-            'perception': 2.0,
-            'danger_assessment': 1.8,
-        },
-        track_suppressions={
-            'reflection': 0.1,
-        },
+        track_amplifications=_THREAT_AMP,
+        track_suppressions=_THREAT_SUP,
     )
 
 
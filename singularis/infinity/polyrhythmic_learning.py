@@ -14,11 +14,56 @@ Key concepts:
 - Harmonic learning: tracks naturally synchronize or desynchronize
 """
 
-from typing import Dict, List, Optional, Tuple, Callable
+from collections import deque
+from functools import cache
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from fractions import Fraction
 import math
 
+import numpy as np
+from loguru import logger
+
+from ._rhythm_kernels import kernel_view, reward_update
+
+
+# Only the most recent values are ever read: the reward trend spans the
+# last REWARD_WINDOW rewards, avg_coherence_contribution the last 20
+REWARD_WINDOW = 10
+COHERENCE_WINDOW = 20
+
+# Previous periods kept per track (oldest dropped first)
+PERIOD_HISTORY_SIZE = 50
+
+# Fixed-point scale for the per-step move fractions (plasticity * 0.1,
+# harmonic_attraction): deltas are computed in integers as
+# (target - current) * round(fraction * _FP_SCALE) // _FP_SCALE
+_FP_SCALE = 10_000
+
+# Rows from which the learner's array paths beat per-track Python loops
+# (NumPy call overhead dominates below; see the commit for the timings)
+_VECTOR_MIN_ROWS = 64
+
+# Same for adapt_to_context, whose scalar loop does less per track
+_VECTOR_MIN_PROFILE_ROWS = 256
+
+# Floor for target ratios when scoring harmonic error (avoids dividing by 0)
+_MIN_RATIO = 1e-9
+
+# Largest denominator used when scoring a target ratio as num/den
+_RATIO_MAX_DEN = 1000
+
+
+def _ratio_fraction(ratio: float) -> Tuple[int, int]:
+    """Target ratio as (num, den) for integer harmonic error scoring"""
+    ratio = max(ratio, _MIN_RATIO)
+    frac = Fraction(ratio).limit_denominator(_RATIO_MAX_DEN)
+    if frac == 0:
+        # Ratios below 1/(2 * _RATIO_MAX_DEN) need a finer denominator
+        frac = Fraction(ratio).limit_denominator(round(1 / _MIN_RATIO))
+    return frac.numerator, frac.denominator
+
 
 class AdaptationStrategy(Enum):
     """How track periods adapt"""
@@ -28,7 +73,7 @@ class AdaptationStrategy(Enum):
     CONTEXT_SPECIFIC = "context_specific"  # Different rhythms per context
 
 
-@dataclass
+@dataclass(slots=True)
 class RhythmProfile:
     """
     Context-specific rhythm configuration.
@@ -44,12 +89,94 @@ class RhythmProfile:
         return f"RhythmProfile({self.name}, {len(self.track_periods)} tracks)"
 
 
-@dataclass
-class TrackRhythmState:
+def _store_of(state) -> Optional['PolyrhythmicLearner']:
+    """Learner holding a state's columns, or None while detached"""
+    try:
+        return state._store
+    except AttributeError:  # Never registered
+        return None
+
+
+class _TrackColumn:
+    """
+    TrackRhythmState field kept in a PolyrhythmicLearner column while the
+    track is registered, so the learner can update tracks as arrays.
+    Detached states hold the value in the field's own slot.
+    """
+    
+    def __init__(self, column: str, cast):
+        self.column = column
+        self.cast = cast
+    
+    def bind(self, cls, name: str):
+        """Install in place of the slot for field `name` (kept for detached storage)"""
+        self.name = name
+        self.slot = vars(cls)[name]
+        setattr(cls, name, self)
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = _store_of(obj)
+        if store is None:
+            return self.slot.__get__(obj, objtype)
+        return self.cast(getattr(store, self.column)[obj._slot])
+    
+    def __set__(self, obj, value):
+        store = _store_of(obj)
+        if store is None:
+            self.slot.__set__(obj, value)
+        else:
+            getattr(store, self.column)[obj._slot] = value
+
+
+class _RingWindow(_TrackColumn):
+    """
+    TrackRhythmState history kept in a PolyrhythmicLearner ring buffer
+    while the track is registered: reads return the retained values oldest
+    first, as a new list. Detached states hold a plain list.
+    """
+    
+    def __init__(self, ring: str, head: str, count: str):
+        self.ring = ring
+        self.head = head
+        self.count = count
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = _store_of(obj)
+        if store is None:
+            return self.slot.__get__(obj, objtype)
+        return store._ring_values(self, obj._slot)
+    
+    def __set__(self, obj, values):
+        store = _store_of(obj)
+        if store is None:
+            self.slot.__set__(obj, list(values))
+        else:
+            store._ring_fill(self, obj._slot, values)
+
+
+class _LearnerLink:
+    """
+    Owning learner and row of a registered TrackRhythmState. Kept out of
+    the dataclass fields; unset until the state is first registered.
+    """
+    __slots__ = ('_store', '_slot')
+
+
+@dataclass(slots=True)
+class TrackRhythmState(_LearnerLink):
     """
     Learnable rhythm state for a single track.
     
-    Tracks the current period and adaptation history.
+    Tracks the current period and adaptation history. While registered
+    with a PolyrhythmicLearner, the numeric fields live in the learner's
+    column arrays (see _TrackColumn) and reward_history and
+    coherence_contributions are windows over its ring buffers (see
+    _RingWindow); record new values through the learner rather than
+    appending to the returned lists.
     """
     track_name: str
     current_period: int
@@ -62,7 +189,7 @@ class TrackRhythmState:
     momentum: float = 0.9
     
     # Adaptation history
-    period_history: List[int] = field(default_factory=list)
+    period_history: Deque[int] = field(default_factory=lambda: deque(maxlen=PERIOD_HISTORY_SIZE))
     reward_history: List[float] = field(default_factory=list)
     velocity: float = 0.0  # Momentum term
     
@@ -79,14 +206,63 @@ class TrackRhythmState:
     
     def avg_coherence_contribution(self) -> float:
         """Average coherence contribution"""
-        if not self.coherence_contributions:
+        recent = self.coherence_contributions[-COHERENCE_WINDOW:]
+        if not recent:
             return 0.5
-        return sum(self.coherence_contributions[-20:]) / len(self.coherence_contributions[-20:])
+        return sum(recent) / len(recent)
     
     def __repr__(self):
         return f"TrackRhythm({self.track_name}, period={self.current_period})"
 
 
+# TrackRhythmState fields backed by PolyrhythmicLearner storage while registered
+_STORE_COLUMNS = {
+    'current_period': _TrackColumn('_period', int),
+    'min_period': _TrackColumn('_min_period', int),
+    'max_period': _TrackColumn('_max_period', int),
+    'learning_rate': _TrackColumn('_lr', float),
+    'momentum': _TrackColumn('_momentum', float),
+    'velocity': _TrackColumn('_velocity', float),
+    'total_activations': _TrackColumn('_total_acts', int),
+    'successful_activations': _TrackColumn('_succ_acts', int),
+    'reward_history': _RingWindow('_reward_ring', '_reward_head', '_reward_count'),
+    'coherence_contributions': _RingWindow('_coh_ring', '_coh_head', '_coh_count'),
+}
+for _name, _column in _STORE_COLUMNS.items():
+    _column.bind(TrackRhythmState, _name)
+del _name, _column
+
+_STORE_FIELDS = tuple(_STORE_COLUMNS)
+
+# Per-track columns of PolyrhythmicLearner: name -> dtype
+_TRACK_COLUMNS = {
+    '_period': np.int32,
+    '_min_period': np.int32,
+    '_max_period': np.int32,
+    '_lr': np.float64,
+    '_momentum': np.float64,
+    '_velocity': np.float64,
+    '_total_acts': np.int32,
+    '_succ_acts': np.int32,
+    '_reward_head': np.int32,   # Next write position in _reward_ring
+    '_reward_count': np.int32,  # Values retained in _reward_ring
+    '_coh_head': np.int32,   # Next write position in _coh_ring
+    '_coh_count': np.int32,  # Values retained in _coh_ring
+}
+
+# Per-track ring buffers: name -> window length
+_RING_COLUMNS = {
+    '_reward_ring': REWARD_WINDOW,
+    '_coh_ring': COHERENCE_WINDOW,
+}
+
+# Columns passed to the reward_update kernel, in argument order
+_REWARD_KERNEL_COLUMNS = (
+    '_reward_ring', '_reward_head', '_reward_count', '_period', '_velocity',
+    '_momentum', '_lr', '_min_period', '_max_period',
+)
+
+
 class PolyrhythmicLearner:
     """
     Adaptive polyrhythmic learning system.
@@ -113,10 +289,25 @@ class PolyrhythmicLearner:
         # Track states
         self.track_states: Dict[str, TrackRhythmState] = {}
         
+        # Column store: per-track arrays indexed by row, grown by doubling
+        self._track_idx: Dict[str, int] = {}  # track name -> row
+        self._track_names: List[str] = []     # row -> track name
+        self._capacity = 0
+        for name, dtype in _TRACK_COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        for name, window in _RING_COLUMNS.items():
+            setattr(self, name, np.zeros((0, window)))
+        self._bind_views()
+        
         # Context-specific profiles
         self.rhythm_profiles: Dict[str, RhythmProfile] = {}
         self.current_profile: Optional[str] = None
         
+        # Profile name -> (track names, rows, target periods, fixed-point
+        # plasticity * 0.1) for registered tracks; built on first use,
+        # dropped when tracks/profiles change
+        self._profile_index: Dict[str, Tuple[List[str], Sequence[int], Sequence[int], int]] = {}
+        
         # Global state
         self.global_beat = 0
         self.total_adaptations = 0
@@ -125,11 +316,43 @@ class PolyrhythmicLearner:
         # Harmonic relationships
         self.harmonic_pairs: List[Tuple[str, str, float]] = []  # (track1, track2, target_ratio)
         
+        # harmonic_pairs as arrays: track rows (-1 until registered) and ratios
+        self._h_idx1 = np.zeros(0, dtype=np.intp)
+        self._h_idx2 = np.zeros(0, dtype=np.intp)
+        self._h_ratio = np.zeros(0)
+        self._h_num = np.zeros(0, dtype=np.int64)  # Ratio as num/den (scoring)
+        self._h_den = np.zeros(0, dtype=np.int64)
+        self._h_valid = np.zeros(0, dtype=bool)  # Both tracks registered
+        self._h_rows: List[Tuple[int, int, int, int]] = []  # Valid pairs as (row1, row2, num, den)
+        
+        # Track row -> partner rows and ratios of the pairs where it is
+        # track1 / only track2 (partner registered); built on first use,
+        # dropped when constraints or registrations change
+        self._pairs_for: Dict[int, Optional[Tuple[List[int], List[float], List[int], List[float]]]] = {}
+        
         if self.verbose:
-            print("[POLYRHYTHMIC LEARNING] System initialized")
-            print(f"  Strategy: {strategy.value}")
-            print(f"  Learning rate: {global_learning_rate}")
-            print(f"  Harmonic attraction: {harmonic_attraction}")
+            logger.info(
+                "[POLYRHYTHMIC LEARNING] System initialized (strategy: {}, learning rate: {}, harmonic attraction: {})",
+                self._strategy_str, global_learning_rate, harmonic_attraction
+            )
+    
+    @property
+    def harmonic_attraction(self) -> float:
+        return self._harmonic_attraction
+    
+    @harmonic_attraction.setter
+    def harmonic_attraction(self, attraction: float):
+        self._harmonic_attraction = attraction
+        self._attract_fp = round(attraction * _FP_SCALE)
+    
+    @property
+    def strategy(self) -> AdaptationStrategy:
+        return self._strategy
+    
+    @strategy.setter
+    def strategy(self, strategy: AdaptationStrategy):
+        self._strategy = strategy
+        self._strategy_str = strategy.value  # Plain str, no Enum attribute lookup
     
     def register_track(
         self,
@@ -160,30 +383,43 @@ class PolyrhythmicLearner:
             learning_rate=lr
         )
         
+        previous = self.track_states.get(track_name)
+        if previous is not None:
+            self._detach_track(previous)
+        
         self.track_states[track_name] = state
+        self._attach_track(state)
         
         if self.verbose:
-            print(f"[POLYRHYTHMIC LEARNING] Registered track: {track_name}")
-            print(f"  Period: {initial_period}, Range: [{min_period}, {max_period}]")
+            logger.info(
+                "[POLYRHYTHMIC LEARNING] Registered track: {} (period: {}, range: [{}, {}])",
+                track_name, initial_period, min_period, max_period
+            )
     
     def add_rhythm_profile(self, profile: RhythmProfile):
-        """Add a context-specific rhythm profile"""
+        """
+        Add a context-specific rhythm profile.
+        
+        Profile targets are indexed on first use; add the profile again
+        after editing its track_periods or plasticity.
+        """
         self.rhythm_profiles[profile.name] = profile
+        self._profile_index.pop(profile.name, None)
         
         if self.verbose:
-            print(f"[POLYRHYTHMIC LEARNING] Added profile: {profile.name}")
+            logger.info("[POLYRHYTHMIC LEARNING] Added profile: {}", profile.name)
     
     def set_active_profile(self, profile_name: str):
         """Switch to a different rhythm profile"""
         if profile_name not in self.rhythm_profiles:
             if self.verbose:
-                print(f"[POLYRHYTHMIC LEARNING] WARNING: Profile '{profile_name}' not found")
+                logger.warning("[POLYRHYTHMIC LEARNING] Profile '{}' not found", profile_name)
             return
         
         self.current_profile = profile_name
         
         if self.verbose:
-            print(f"[POLYRHYTHMIC LEARNING] Switched to profile: {profile_name}")
+            logger.debug("[POLYRHYTHMIC LEARNING] Switched to profile: {}", profile_name)
     
     def add_harmonic_constraint(self, track1: str, track2: str, target_ratio: float):
         """
@@ -200,8 +436,22 @@ class PolyrhythmicLearner:
         """
         self.harmonic_pairs.append((track1, track2, target_ratio))
         
+        track_idx = self._track_idx
+        self._h_idx1 = np.concatenate((self._h_idx1, [track_idx.get(track1, -1)]))
+        self._h_idx2 = np.concatenate((self._h_idx2, [track_idx.get(track2, -1)]))
+        self._h_ratio = np.concatenate((self._h_ratio, [target_ratio]))
+        num, den = _ratio_fraction(target_ratio)
+        self._h_num = np.concatenate((self._h_num, [num]))
+        self._h_den = np.concatenate((self._h_den, [den]))
+        self._h_valid = np.concatenate((self._h_valid, [track1 in track_idx and track2 in track_idx]))
+        self._list_valid_pairs()
+        self._pairs_for.clear()
+        
         if self.verbose:
-            print(f"[POLYRHYTHMIC LEARNING] Harmonic constraint: {track1}/{track2} = {target_ratio:.2f}")
+            logger.info(
+                "[POLYRHYTHMIC LEARNING] Harmonic constraint: {}/{} = {:.2f}",
+                track1, track2, target_ratio
+            )
     
     def adapt_from_reward(
         self,
@@ -221,38 +471,29 @@ class PolyrhythmicLearner:
             reward: Reward signal (-1.0 to 1.0)
             coherence: Optional coherence contribution
         """
-        if track_name not in self.track_states:
+        slot = self._track_idx.get(track_name)
+        if slot is None:
             return
         
-        state = self.track_states[track_name]
-        state.reward_history.append(reward)
-        
         if coherence is not None:
-            state.coherence_contributions.append(coherence)
-        
-        # Compute gradient estimate
-        # If recent rewards increasing → keep direction
-        # If recent rewards decreasing → reverse direction
-        if len(state.reward_history) >= 2:
-            recent_rewards = state.reward_history[-10:]
-            reward_trend = recent_rewards[-1] - recent_rewards[0]
-            
-            # Update velocity with momentum
-            gradient = reward_trend * 100  # Scale to period units
-            state.velocity = state.momentum * state.velocity + state.learning_rate * gradient
-            
-            # Apply update
-            new_period = state.current_period + int(state.velocity)
-            new_period = max(state.min_period, min(state.max_period, new_period))
+            self._push_coherence(slot, coherence)
+        
+        # Record the reward and take one momentum step on the period:
+        # if recent rewards increasing → keep direction,
+        # if recent rewards decreasing → reverse direction
+        reward_trend, old_period, new_period = reward_update(
+            *self._reward_args, slot, float(reward)
+        )
+        
+        if new_period != old_period:
+            self.track_states[track_name].period_history.append(old_period)
+            self.total_adaptations += 1
             
-            if new_period != state.current_period:
-                state.period_history.append(state.current_period)
-                state.current_period = new_period
-                self.total_adaptations += 1
-                
-                if self.verbose:
-                    print(f"[POLYRHYTHMIC LEARNING] Adapted {track_name}: {state.period_history[-1]} -> {new_period}")
-                    print(f"  Reward trend: {reward_trend:.3f}, Velocity: {state.velocity:.2f}")
+            if self.verbose:
+                logger.debug(
+                    "[POLYRHYTHMIC LEARNING] Adapted {}: {} -> {} (reward trend: {:.3f}, velocity: {:.2f})",
+                    track_name, old_period, new_period, reward_trend, self._velocity[slot]
+                )
     
     def adapt_from_coherence(
         self,
@@ -268,17 +509,59 @@ class PolyrhythmicLearner:
             coherence_scores: Per-track coherence contributions
             global_coherence: Overall system coherence
         """
-        for track_name, coherence in coherence_scores.items():
-            if track_name not in self.track_states:
-                continue
+        track_idx = self._track_idx
+        if len(coherence_scores) < _VECTOR_MIN_ROWS:
+            # _push_coherence, inlined over the column views
+            ring, heads, counts = self._coh_ring_view, self._coh_head_view, self._coh_count_view
+            rows, low = [], []
+            for name, coherence in coherence_scores.items():
+                slot = track_idx.get(name)
+                if slot is None:
+                    continue
+                head = heads[slot]
+                ring[slot, head] = coherence
+                heads[slot] = (head + 1) % COHERENCE_WINDOW
+                if counts[slot] < COHERENCE_WINDOW:
+                    counts[slot] += 1
+                if coherence < 0.5:
+                    rows.append(slot)
+                    low.append(name)
+        else:
+            names = [name for name in coherence_scores if name in track_idx]
+            if not names:
+                return
+            
+            rows = np.fromiter((track_idx[name] for name in names), dtype=np.intp, count=len(names))
+            coh = np.fromiter((coherence_scores[name] for name in names), dtype=np.float64, count=len(names))
             
-            state = self.track_states[track_name]
-            state.coherence_contributions.append(coherence)
+            # Record every contribution with one scattered store
+            heads, counts = self._coh_head, self._coh_count
+            head = heads[rows]
+            self._coh_ring[rows, head] = coh
+            heads[rows] = (head + 1) % COHERENCE_WINDOW
+            counts[rows] = np.minimum(counts[rows] + 1, COHERENCE_WINDOW)
             
-            # If coherence low, try adjusting period
-            if coherence < 0.5:
-                # Try moving toward harmonic ratios with other tracks
-                self._apply_harmonic_attraction(track_name)
+            is_low = np.flatnonzero(coh < 0.5).tolist()
+            rows = rows[is_low].tolist()
+            low = [names[i] for i in is_low]
+        
+        # If coherence low, try moving toward harmonic ratios with other
+        # tracks. Applied one track at a time, in input order: each move
+        # changes the partner periods that later tracks are attracted to.
+        attract = self._attract
+        moves = []
+        for slot, name in zip(rows, low):
+            move = attract(slot, name)
+            if move is not None:
+                moves.append((name, *move))
+        
+        if moves and self.verbose:
+            logger.opt(lazy=True).debug(
+                "[POLYRHYTHMIC LEARNING] Harmonic attraction: {}",
+                lambda: ", ".join(
+                    f"{name}: {old} -> {new} (target: {target})" for name, old, new, target in moves
+                )
+            )
     
     def adapt_to_context(self, context_name: str):
         """
@@ -289,35 +572,67 @@ class PolyrhythmicLearner:
         """
         if context_name not in self.rhythm_profiles:
             if self.verbose:
-                print(f"[POLYRHYTHMIC LEARNING] No profile for context: {context_name}")
+                logger.debug("[POLYRHYTHMIC LEARNING] No profile for context: {}", context_name)
             return
         
         profile = self.rhythm_profiles[context_name]
         self.current_profile = context_name
         
-        # Gradually move tracks toward profile targets
-        for track_name, target_period in profile.track_periods.items():
-            if track_name not in self.track_states:
-                continue
-            
-            state = self.track_states[track_name]
-            current = state.current_period
-            
-            # Move toward target with plasticity factor
-            delta = int((target_period - current) * profile.plasticity * 0.1)
-            
-            if delta != 0:
-                new_period = current + delta
-                new_period = max(state.min_period, min(state.max_period, new_period))
-                
+        index = self._profile_index.get(context_name)
+        if index is None:
+            index = self._profile_index[context_name] = self._build_profile_index(profile)
+        names, rows, targets, plast_fp = index
+        if not names:
+            return
+        
+        # Gradually move tracks toward profile targets with plasticity
+        # factor (fixed point, truncated toward zero)
+        moves = []
+        if len(names) < _VECTOR_MIN_PROFILE_ROWS:
+            periods = self._period_view
+            mins, maxs = self._min_period_view, self._max_period_view
+            for name, slot, target in zip(names, rows, targets):
+                current = periods[slot]
+                diff = target - current
+                delta = abs(diff) * plast_fp // _FP_SCALE
+                if delta == 0:
+                    continue
+                new_period = current + delta if diff > 0 else current - delta
+                new_period = max(mins[slot], min(maxs[slot], new_period))
                 if new_period != current:
-                    state.period_history.append(current)
-                    state.current_period = new_period
-                    self.total_adaptations += 1
-                    
-                    if self.verbose:
-                        print(f"[POLYRHYTHMIC LEARNING] Context adaptation: {track_name}")
-                        print(f"  {current} -> {new_period} (target: {target_period})")
+                    periods[slot] = new_period
+                    moves.append((name, current, new_period, target))
+        else:
+            periods = self._period
+            current = periods[rows]
+            diff = targets - current
+            delta = np.sign(diff) * (np.abs(diff) * plast_fp // _FP_SCALE)
+            new = np.clip(current + delta, self._min_period[rows], self._max_period[rows])
+            
+            # Bookkeeping only for the (usually few) tracks that moved
+            changed = np.flatnonzero((delta != 0) & (new != current))
+            periods[rows[changed]] = new[changed]
+            moves = list(zip(
+                [names[i] for i in changed.tolist()], current[changed].tolist(),
+                new[changed].tolist(), targets[changed].tolist(),
+            ))
+        if not moves:
+            return
+        
+        self.total_adaptations += len(moves)
+        states = self.track_states
+        for name, old, _, _ in moves:
+            states[name].period_history.append(old)
+        
+        if self.verbose:
+            logger.opt(lazy=True).debug(
+                "[POLYRHYTHMIC LEARNING] Context adaptation ({}): updated {} tracks: {}",
+                lambda: context_name,
+                lambda: len(moves),
+                lambda: ", ".join(
+                    f"{name} {old} -> {new} (target: {target})" for name, old, new, target in moves
+                )
+            )
     
     def _apply_harmonic_attraction(self, track_name: str):
         """
@@ -325,59 +640,202 @@ class PolyrhythmicLearner:
         
         This creates emergent synchronization between related tracks.
         """
-        if track_name not in self.track_states:
+        slot = self._track_idx.get(track_name)
+        if slot is None:
             return
         
-        state = self.track_states[track_name]
-        
-        # Find all harmonic constraints involving this track
-        attractions = []
-        
-        for t1, t2, ratio in self.harmonic_pairs:
-            if t1 == track_name and t2 in self.track_states:
-                # This track should be ratio * other_period
-                other_period = self.track_states[t2].current_period
-                target_period = int(ratio * other_period)
-                attractions.append(target_period)
-            
-            elif t2 == track_name and t1 in self.track_states:
-                # This track should be other_period / ratio
-                other_period = self.track_states[t1].current_period
-                target_period = int(other_period / ratio)
-                attractions.append(target_period)
-        
-        if not attractions:
-            return
+        move = self._attract(slot, track_name)
+        if move is not None and self.verbose:
+            logger.debug(
+                "[POLYRHYTHMIC LEARNING] Harmonic attraction: {}: {} -> {} (target: {})",
+                track_name, *move
+            )
+    
+    def _attract(self, slot: int, track_name: str) -> Optional[Tuple[int, int, int]]:
+        """
+        _apply_harmonic_attraction for a track whose row is already known,
+        without logging. Returns (old, new, target) if the period moved.
+        """
+        # Harmonic constraints involving this track (with the other track
+        # registered)
+        pairs_for = self._pairs_for
+        if slot not in pairs_for:
+            pairs_for[slot] = self._find_pairs(slot)
+        pairs = pairs_for[slot]
+        if pairs is None:
+            return None
+        partners1, ratios1, partners2, ratios2 = pairs
+        periods = self._period_view
+        
+        # As track1 this track should be ratio * other_period,
+        # as track2 other_period / ratio (both truncated to whole beats)
+        total = 0
+        for partner, ratio in zip(partners1, ratios1):
+            total += int(ratio * periods[partner])
+        for partner, ratio in zip(partners2, ratios2):
+            total += int(periods[partner] / ratio)
         
         # Average all attractions
-        target = sum(attractions) // len(attractions)
-        current = state.current_period
+        target = total // (len(partners1) + len(partners2))
+        current = periods[slot]
         
         # Move toward target with harmonic attraction strength
-        delta = int((target - current) * self.harmonic_attraction)
+        diff = target - current
+        delta = abs(diff) * self._attract_fp // _FP_SCALE
+        if diff < 0:
+            delta = -delta
         
         if delta != 0:
             new_period = current + delta
-            new_period = max(state.min_period, min(state.max_period, new_period))
+            new_period = max(self._min_period_view[slot], min(self._max_period_view[slot], new_period))
             
             if new_period != current:
-                state.period_history.append(current)
-                state.current_period = new_period
+                self.track_states[track_name].period_history.append(current)
+                periods[slot] = new_period
                 self.total_adaptations += 1
-                
-                if self.verbose:
-                    print(f"[POLYRHYTHMIC LEARNING] Harmonic attraction: {track_name}")
-                    print(f"  {current} -> {new_period} (target: {target})")
+                return current, new_period, target
+        return None
+    
+    # ========== Column Store ==========
+    
+    def _attach_track(self, state: TrackRhythmState):
+        """Give a newly registered state a row (re-registering reuses the row)"""
+        slot = self._track_idx.get(state.track_name)
+        if slot is None:
+            slot = len(self._track_names)
+            if slot == self._capacity:
+                self._grow()
+            self._track_idx[state.track_name] = slot
+            self._track_names.append(state.track_name)
+            self._resolve_harmonic_pairs(state.track_name, slot)
+            self._profile_index.clear()  # Profiles may target the new track
+        
+        values = {name: getattr(state, name) for name in _STORE_FIELDS}
+        state._store = self
+        state._slot = slot
+        for name, value in values.items():
+            setattr(state, name, value)
+    
+    def _build_profile_index(self, profile: RhythmProfile) -> Tuple[List[str], Sequence[int], Sequence[int], int]:
+        """
+        Rows and target periods of the profile's registered tracks, as
+        arrays from _VECTOR_MIN_PROFILE_ROWS tracks and as lists below
+        """
+        track_idx = self._track_idx
+        names = [name for name in profile.track_periods if name in track_idx]
+        rows = [track_idx[name] for name in names]
+        targets = [profile.track_periods[name] for name in names]
+        if len(names) >= _VECTOR_MIN_PROFILE_ROWS:
+            rows = np.array(rows, dtype=np.intp)
+            targets = np.array(targets, dtype=np.int64)
+        return names, rows, targets, round(profile.plasticity * 0.1 * _FP_SCALE)
+    
+    def _find_pairs(self, slot: int) -> Optional[Tuple[List[int], List[float], List[int], List[float]]]:
+        """
+        Partner rows and ratios of the constraints where `slot` is track1,
+        then of those where it is only track2 (partner registered); None if
+        there are none.
+        """
+        idx1, idx2, ratio = self._h_idx1, self._h_idx2, self._h_ratio
+        is_first = idx1 == slot
+        first = np.flatnonzero(is_first & (idx2 >= 0))
+        second = np.flatnonzero((idx2 == slot) & (idx1 >= 0) & ~is_first)
+        if first.size == 0 and second.size == 0:
+            return None
+        return (idx2[first].tolist(), ratio[first].tolist(),
+                idx1[second].tolist(), ratio[second].tolist())
+    
+    def _resolve_harmonic_pairs(self, track_name: str, slot: int):
+        """Fill in the row of a newly registered track in harmonic constraints"""
+        for i, (t1, t2, _) in enumerate(self.harmonic_pairs):
+            if t1 == track_name:
+                self._h_idx1[i] = slot
+            if t2 == track_name:
+                self._h_idx2[i] = slot
+        self._h_valid = (self._h_idx1 >= 0) & (self._h_idx2 >= 0)
+        self._list_valid_pairs()
+        self._pairs_for.clear()
+    
+    def _list_valid_pairs(self):
+        """Refresh _h_rows, the scalar-path copy of the registered pairs"""
+        valid = self._h_valid
+        self._h_rows = list(zip(
+            self._h_idx1[valid].tolist(), self._h_idx2[valid].tolist(),
+            self._h_num[valid].tolist(), self._h_den[valid].tolist(),
+        ))
+    
+    def _detach_track(self, state: TrackRhythmState):
+        """Copy a replaced state's values out of the columns"""
+        values = {name: getattr(state, name) for name in _STORE_FIELDS}
+        state._store = None
+        state._slot = -1
+        for name, value in values.items():
+            setattr(state, name, value)
+    
+    def _grow(self):
+        """Double the row capacity of every column"""
+        capacity = max(8, 2 * self._capacity)
+        n = self._capacity
+        
+        for name, dtype in _TRACK_COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[:n] = getattr(self, name)
+            setattr(self, name, column)
+        for name, window in _RING_COLUMNS.items():
+            ring = np.zeros((capacity, window))
+            ring[:n] = getattr(self, name)
+            setattr(self, name, ring)
+        
+        self._capacity = capacity
+        self._bind_views()
+    
+    def _bind_views(self):
+        """
+        Give every column a memoryview, <name>_view, for the scalar paths
+        (its items are Python numbers), and collect the reward kernel's
+        arguments; redone whenever the columns are reallocated.
+        """
+        for name in (*_TRACK_COLUMNS, *_RING_COLUMNS):
+            setattr(self, name + '_view', memoryview(getattr(self, name)))
+        self._reward_args = tuple(kernel_view(getattr(self, name)) for name in _REWARD_KERNEL_COLUMNS)
+    
+    def _push_coherence(self, slot: int, value: float):
+        """Append one coherence contribution to a track's ring"""
+        heads, counts = self._coh_head_view, self._coh_count_view
+        head = heads[slot]
+        self._coh_ring_view[slot, head] = value
+        heads[slot] = (head + 1) % COHERENCE_WINDOW
+        if counts[slot] < COHERENCE_WINDOW:
+            counts[slot] += 1
+    
+    def _ring_values(self, window: _RingWindow, slot: int) -> List[float]:
+        """Values retained in a track's ring, oldest first"""
+        ring = getattr(self, window.ring)[slot]
+        count = int(getattr(self, window.count)[slot])
+        start = int(getattr(self, window.head)[slot]) - count
+        return np.roll(ring, -start)[:count].tolist()
+    
+    def _ring_fill(self, window: _RingWindow, slot: int, values):
+        """Replace a track's ring contents with (the tail of) `values`"""
+        ring = getattr(self, window.ring)
+        size = ring.shape[1]
+        tail = list(values)[-size:]
+        ring[slot, :] = 0.0
+        ring[slot, :len(tail)] = tail
+        getattr(self, window.head)[slot] = len(tail) % size
+        getattr(self, window.count)[slot] = len(tail)
     
     def get_current_period(self, track_name: str) -> Optional[int]:
         """Get current period for a track"""
-        if track_name in self.track_states:
-            return self.track_states[track_name].current_period
-        return None
+        slot = self._track_idx.get(track_name)
+        if slot is None:
+            return None
+        return int(self._period[slot])
     
     def get_all_periods(self) -> Dict[str, int]:
         """Get all current periods"""
-        return {name: state.current_period for name, state in self.track_states.items()}
+        names = self._track_names
+        return dict(zip(names, self._period[:len(names)].tolist()))
     
     def compute_harmonic_coherence(self) -> float:
         """
@@ -386,36 +844,51 @@ class PolyrhythmicLearner:
         Returns:
             Score 0.0-1.0, where 1.0 means perfect harmonic alignment
         """
-        if not self.harmonic_pairs:
+        n_pairs = self._h_ratio.size
+        if n_pairs == 0:
             return 1.0
         
-        total_error = 0.0
-        
-        for t1, t2, target_ratio in self.harmonic_pairs:
-            if t1 not in self.track_states or t2 not in self.track_states:
-                continue
-            
-            p1 = self.track_states[t1].current_period
-            p2 = self.track_states[t2].current_period
+        # Pairs with an unregistered track add no error but still count.
+        # Each error is |p1/p2 - num/den| / (num/den) with a single division.
+        if n_pairs < _VECTOR_MIN_ROWS:
+            periods = self._period_view
+            total_error = 0.0
+            for row1, row2, num, den in self._h_rows:
+                scaled = num * periods[row2]
+                total_error += abs(periods[row1] * den - scaled) / scaled
+        else:
+            valid = self._h_valid
+            periods = self._period
+            p1 = periods[self._h_idx1[valid]].astype(np.int64)
+            p2 = periods[self._h_idx2[valid]].astype(np.int64)
+            num, den = self._h_num[valid], self._h_den[valid]
             
-            actual_ratio = p1 / p2
-            error = abs(actual_ratio - target_ratio) / target_ratio
-            total_error += error
+            scaled = num * p2
+            total_error = float((np.abs(p1 * den - scaled) / scaled).sum())
         
-        avg_error = total_error / len(self.harmonic_pairs)
+        avg_error = total_error / n_pairs
         coherence = max(0.0, 1.0 - avg_error)
         
         return coherence
     
     def get_statistics(self) -> Dict:
         """Get learning statistics"""
+        # Sum of TrackRhythmState.success_rate over every track
+        n = len(self._track_names)
+        if n < _VECTOR_MIN_ROWS:
+            total, succ = self._total_acts_view, self._succ_acts_view
+            rate_sum = sum(succ[i] / total[i] if total[i] else 0.5 for i in range(n))
+        else:
+            total = self._total_acts[:n]
+            rate_sum = float(np.where(total > 0, self._succ_acts[:n] / np.maximum(total, 1), 0.5).sum())
+        
         return {
             'total_tracks': len(self.track_states),
             'total_adaptations': self.total_adaptations,
             'current_profile': self.current_profile,
             'harmonic_coherence': self.compute_harmonic_coherence(),
-            'avg_success_rate': sum(s.success_rate() for s in self.track_states.values()) / max(1, len(self.track_states)),
-            'strategy': self.strategy.value
+            'avg_success_rate': rate_sum / max(1, n),
+            'strategy': self._strategy_str
         }
     
     def __repr__(self):
@@ -423,7 +896,11 @@ class PolyrhythmicLearner:
 
 
 # ========== Predefined Rhythm Profiles ==========
+# Each factory returns one shared instance; to customise a profile, take an
+# independent copy first, e.g. dataclasses.replace(profile, plasticity=1.0,
+# track_periods=dict(profile.track_periods))
 
+@cache
 def create_exploration_profile() -> RhythmProfile:
     """Rhythm profile for exploration context"""
     return RhythmProfile(
@@ -442,6 +919,7 @@ def create_exploration_profile() -> RhythmProfile:
     )
 
 
+@cache
 def create_survival_profile() -> RhythmProfile:
     """Rhythm profile for survival/danger context"""
     return RhythmProfile(
@@ -460,6 +938,7 @@ def create_survival_profile() -> RhythmProfile:
     )
 
 
+@cache
 def create_learning_profile() -> RhythmProfile:
     """Rhythm profile for learning/consolidation context"""
     return RhythmProfile(
@@ -18,13 +18,118 @@ Architecture:
 from __future__ import annotations
 
 import json
-from typing import Dict, Any, Optional, List
+from collections import defaultdict, deque
+from typing import Deque, Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
 from loguru import logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# LLM decision responses are parsed with orjson when installed; its
+# JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Interventions delivered within this window count toward fatigue
+FATIGUE_WINDOW_HOURS = 24
+
+
+# ========== Decision Prompt ==========
+# Static prompt text, filled with str.format; only the context header and
+# the item block change between calls
+
+_PROMPT_HEADER = """
+        You are an empathetic AI life coach deciding whether to intervene.
+        
+        Context:
+        - User ID: {user_id}
+        - Current time: {now:%A %I:%M %p}
+        - User mood: {mood}
+        - Recent interventions (24h): {recent}
+        - Intervention fatigue: {fatigue:.2f} (0=fresh, 1=overwhelmed)
+        
+        {item_type} Detected:
+        - Name: {name}
+        - Type: {type}
+        - Description: {description}
+        - Alert Level: {alert_level}
+        """
+
+_ANOMALY_DETAILS = """
+        - Expected: {expected}
+        - Actual: {actual}
+        - Deviation: {deviation}
+            """
+
+_PATTERN_DETAILS = """
+        - Confidence: {confidence}
+        - Frequency: {frequency}
+            """
+
+_FRAMEWORK_SUFFIX = """
+        
+        Your Decision Framework:
+        
+        1. **Should we intervene?**
+           - Is this actionable?
+           - Will user find it helpful or annoying?
+           - Is timing appropriate?
+           - Have we intervened too much recently? (fatigue: {fatigue:.2f})
+        
+        2. **If yes, what type?**
+           - encouragement: Positive reinforcement
+           - reminder: Gentle nudge
+           - warning: Needs attention
+           - emergency: Critical, immediate
+           - insight: Educational
+           - suggestion: Optional improvement
+        
+        3. **What channel?**
+           - messenger: Text (least intrusive)
+           - voice: Spoken (more urgent)
+           - push: Notification (moderate)
+           - email: Detailed (can wait)
+           - silent: Log only (no notification)
+        
+        4. **Priority (1-10)?**
+           - 10: Life-threatening emergency
+           - 7-9: Important, needs attention soon
+           - 4-6: Useful information
+           - 1-3: Nice to know
+        
+        5. **Timing?**
+           - immediate: Send now
+           - delayed: Wait for better timing
+        
+        6. **What to say?**
+           - Be empathetic and supportive
+           - Be specific and actionable
+           - Consider user's current state
+           - Avoid being preachy or annoying
+           - CRITICAL: Never say "I will call 911" - only advise user to call
+           - Say: "Please call 911" or "Consider calling emergency services"
+           - Never take emergency actions automatically
+        
+        Respond in JSON:
+        {{
+            "should_intervene": true/false,
+            "reasoning": "your reasoning process",
+            "intervention_type": "type",
+            "channel": "channel",
+            "priority": 1-10,
+            "immediate": true/false,
+            "message": "what to say to user",
+            "time_appropriateness": 0.0-1.0,
+            "empathy_factors": ["factor1", "factor2"]
+        }}
+        """
+
 
 class InterventionType(Enum):
     """Types of interventions."""
@@ -109,6 +214,10 @@ class AGIInterventionDecider:
         # Intervention history (to avoid spam)
         self.intervention_history: List[InterventionDecision] = []
         
+        # Timestamps of delivered interventions per user, oldest first;
+        # entries older than FATIGUE_WINDOW_HOURS are dropped on read
+        self._delivered_ts: Dict[str, Deque[float]] = defaultdict(deque)
+        
         # User preferences (learned over time)
         self.user_preferences: Dict[str, Any] = {}
         
@@ -166,6 +275,8 @@ class AGIInterventionDecider:
         
         # Record in history
         self.intervention_history.append(decision)
+        if decision.should_intervene and decision.user_id:
+            self._delivered_ts[decision.user_id].append(decision.timestamp.timestamp())
         
         # Learn from decision (update preferences)
         self._update_preferences(decision, user_context)
@@ -197,7 +308,7 @@ class AGIInterventionDecider:
         
         # Parse JSON response
         try:
-            return json.loads(response.response)
+            return _json_loads(response.response)
         except json.JSONDecodeError:
             logger.warning("[AGI-DECIDER] Failed to parse JSON, using fallback")
             return self._fallback_decision(pattern_or_anomaly)
@@ -242,7 +353,7 @@ class AGIInterventionDecider:
         )
         
         try:
-            decision_data = json.loads(consciousness_response.response)
+            decision_data = _json_loads(consciousness_response.response)
             subsystem_votes['consciousness'] = decision_data.get('should_intervene', False)
         except json.JSONDecodeError:
             decision_data = self._fallback_decision(pattern_or_anomaly)
@@ -281,102 +392,40 @@ class AGIInterventionDecider:
         item_type = "anomaly" if is_anomaly else "pattern"
         
         # Get recent intervention history
-        recent_interventions = self._get_recent_interventions(
-            user_context.get('user_id'),
-            hours=24
-        )
+        recent_interventions = self._count_recent_interventions(user_context.get('user_id'))
         
         # Calculate intervention fatigue
-        fatigue = len(recent_interventions) / 10.0  # 0-1 scale
-        
-        prompt = f"""
-        You are an empathetic AI life coach deciding whether to intervene.
-        
-        Context:
-        - User ID: {user_context.get('user_id', 'unknown')}
-        - Current time: {datetime.now().strftime('%A %I:%M %p')}
-        - User mood: {user_context.get('mood', 'unknown')}
-        - Recent interventions (24h): {len(recent_interventions)}
-        - Intervention fatigue: {fatigue:.2f} (0=fresh, 1=overwhelmed)
-        
-        {item_type.capitalize()} Detected:
-        - Name: {pattern_or_anomaly.get('name', 'Unknown')}
-        - Type: {pattern_or_anomaly.get('type', 'unknown')}
-        - Description: {pattern_or_anomaly.get('description', 'No description')}
-        - Alert Level: {pattern_or_anomaly.get('alert_level', 'unknown')}
-        """
+        fatigue = recent_interventions / 10.0  # 0-1 scale
         
+        get = pattern_or_anomaly.get
         if is_anomaly:
-            prompt += f"""
-        - Expected: {pattern_or_anomaly.get('expected_value')}
-        - Actual: {pattern_or_anomaly.get('actual_value')}
-        - Deviation: {pattern_or_anomaly.get('deviation')}
-            """
+            details = _ANOMALY_DETAILS.format(
+                expected=get('expected_value'),
+                actual=get('actual_value'),
+                deviation=get('deviation')
+            )
         else:
-            prompt += f"""
-        - Confidence: {pattern_or_anomaly.get('confidence', 0)}
-        - Frequency: {pattern_or_anomaly.get('frequency', 'unknown')}
-            """
-        
-        prompt += f"""
-        
-        Your Decision Framework:
-        
-        1. **Should we intervene?**
-           - Is this actionable?
-           - Will user find it helpful or annoying?
-           - Is timing appropriate?
-           - Have we intervened too much recently? (fatigue: {fatigue:.2f})
-        
-        2. **If yes, what type?**
-           - encouragement: Positive reinforcement
-           - reminder: Gentle nudge
-           - warning: Needs attention
-           - emergency: Critical, immediate
-           - insight: Educational
-           - suggestion: Optional improvement
-        
-        3. **What channel?**
-           - messenger: Text (least intrusive)
-           - voice: Spoken (more urgent)
-           - push: Notification (moderate)
-           - email: Detailed (can wait)
-           - silent: Log only (no notification)
-        
-        4. **Priority (1-10)?**
-           - 10: Life-threatening emergency
-           - 7-9: Important, needs attention soon
-           - 4-6: Useful information
-           - 1-3: Nice to know
-        
-        5. **Timing?**
-           - immediate: Send now
-           - delayed: Wait for better timing
-        
-        6. **What to say?**
-           - Be empathetic and supportive
-           - Be specific and actionable
-           - Consider user's current state
-           - Avoid being preachy or annoying
-           - CRITICAL: Never say "I will call 911" - only advise user to call
-           - Say: "Please call 911" or "Consider calling emergency services"
-           - Never take emergency actions automatically
-        
-        Respond in JSON:
-        {{
-            "should_intervene": true/false,
-            "reasoning": "your reasoning process",
-            "intervention_type": "type",
-            "channel": "channel",
-            "priority": 1-10,
-            "immediate": true/false,
-            "message": "what to say to user",
-            "time_appropriateness": 0.0-1.0,
-            "empathy_factors": ["factor1", "factor2"]
-        }}
-        """
+            details = _PATTERN_DETAILS.format(
+                confidence=get('confidence', 0),
+                frequency=get('frequency', 'unknown')
+            )
         
-        return prompt
+        return "".join((
+            _PROMPT_HEADER.format(
+                user_id=user_context.get('user_id', 'unknown'),
+                now=datetime.now(),
+                mood=user_context.get('mood', 'unknown'),
+                recent=recent_interventions,
+                fatigue=fatigue,
+                item_type=item_type.capitalize(),
+                name=get('name', 'Unknown'),
+                type=get('type', 'unknown'),
+                description=get('description', 'No description'),
+                alert_level=get('alert_level', 'unknown')
+            ),
+            details,
+            _FRAMEWORK_SUFFIX.format(fatigue=fatigue)
+        ))
     
     def _parse_decision(
         self,
@@ -465,33 +514,29 @@ class AGIInterventionDecider:
             user_id=user_context.get('user_id')
         )
     
-    def _get_recent_interventions(
-        self,
-        user_id: Optional[str],
-        hours: int = 24
-    ) -> List[InterventionDecision]:
-        """Get recent interventions for user."""
+    def _count_recent_interventions(self, user_id: Optional[str]) -> int:
+        """Count interventions delivered to user in the fatigue window."""
         
         if not user_id:
-            return []
+            return 0
         
-        cutoff = datetime.now().timestamp() - (hours * 3600)
+        delivered = self._delivered_ts.get(user_id)
+        if not delivered:
+            return 0
         
-        return [
-            decision for decision in self.intervention_history
-            if decision.user_id == user_id
-            and decision.timestamp.timestamp() > cutoff
-            and decision.should_intervene
-        ]
+        # Timestamps arrive in order, so expired ones are at the front
+        cutoff = datetime.now().timestamp() - (FATIGUE_WINDOW_HOURS * 3600)
+        while delivered and delivered[0] <= cutoff:
+            delivered.popleft()
+        
+        return len(delivered)
     
     def _calculate_fatigue(self, user_id: Optional[str]) -> float:
         """Calculate intervention fatigue (0-1)."""
         
-        recent = self._get_recent_interventions(user_id, hours=24)
-        
         # 0 interventions = 0 fatigue
         # 10+ interventions = 1.0 fatigue
-        return min(len(recent) / 10.0, 1.0)
+        return min(self._count_recent_interventions(user_id) / 10.0, 1.0)
     
     def _update_preferences(
         self,
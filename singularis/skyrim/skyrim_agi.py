@@ -4703,13 +4703,9 @@ Based on this visual and contextual data, provide:
                         
                         # Evaluate coherence V2
                         if self.coherence_v2:
-                            # Build mock cognitive state for coherence evaluation
-                            mock_cog_state = type('obj', (object,), {
-                                'truth_values': {},
-                                'tracks': [],
-                                'goals': [],
-                                'emotions': {}
-                            })()
+                            # Build cognitive state for coherence evaluation
+                            from ..infinity import CognitiveState
+                            mock_cog_state = CognitiveState()
                             
                             # Add truth values from HaackLang
                             if self.haack_bridge:
@@ -4729,7 +4725,7 @@ Based on this visual and contextual data, provide:
                                 if cycle_count % 10 == 0 and adjustments.adjustments:
                                     print(f"[INFINITY] Coherence V2 intervention: {len(adjustments.adjustments)} adjustments")
                                     for adj in adjustments.adjustments[:2]:
-                                        print(f"[INFINITY]   {adj.intervention_type.value}: {adj.target}")
+                                        print(f"[INFINITY]   {adj.intervention_type.label}: {adj.target}")
                         
                         # Adapt rhythms based on reward
                         if self.rhythm_learner and hasattr(self, 'current_consciousness'):
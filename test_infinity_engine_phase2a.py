@@ -86,6 +86,7 @@ class MockCognitiveState:
             MockTrack('intuition', 500, 0.0),
             MockTrack('reflection', 2000, 0.0),
         ]
+        self.tracks_version = None  # Tracks are edited freely; no partition caching
         
         self.context = 'exploration'
         self.goals = ['explore', 'learn']
@@ -138,7 +139,7 @@ def test_coherence_engine_v2():
     adjustments = engine.apply_corrections(report)
     print(f"Adjustments generated: {len(adjustments.adjustments)}")
     for adj in adjustments.adjustments[:3]:
-        print(f"  - {adj.intervention_type.value}: {adj.target}")
+        print(f"  - {adj.intervention_type.label}: {adj.target}")
         print(f"    Reason: {adj.reason}")
     
     # Test 4: High tension
@@ -343,7 +344,7 @@ def test_integration():
     adjustments = coherence_engine.apply_corrections(report)
     print(f"   Adjustments: {len(adjustments.adjustments)}")
     for adj in adjustments.adjustments[:2]:
-        print(f"   - {adj.intervention_type.value}: {adj.target}")
+        print(f"   - {adj.intervention_type.label}: {adj.target}")
     
     # Step 5: Context shift to survival
     print("\n5. Shift to survival context")
@@ -0,0 +1,135 @@
+"""
+AGI Intervention Decider Tests
+
+Tests for response parsing and per-user intervention fatigue.
+"""
+
+import importlib
+import json
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from singularis.life_ops import agi_intervention_decider as decider_module
+from singularis.life_ops.agi_intervention_decider import AGIInterventionDecider
+
+
+_INTERVENE = json.dumps({
+    'should_intervene': True,
+    'intervention_type': 'reminder',
+    'channel': 'messenger',
+    'priority': 4,
+    'immediate': False,
+    'message': 'Time for a walk?',
+    'reasoning': 'sedentary afternoon',
+})
+
+
+class FakeConsciousness:
+    """Returns a fixed response string for every query."""
+
+    def __init__(self, response):
+        self.response = response
+        self.prompts = []
+
+    async def process(self, query, subsystem_inputs, context):
+        self.prompts.append(query)
+        return SimpleNamespace(response=self.response)
+
+
+class TestResponseParsing:
+    """Test JSON parsing of consciousness responses."""
+
+    @pytest.mark.asyncio
+    async def test_valid_json_response(self):
+        """A JSON response becomes the decision."""
+        decider = AGIInterventionDecider(FakeConsciousness(_INTERVENE))
+        decision = await decider.decide_intervention(
+            {'name': 'sitting', 'alert_level': 'low'}, {'user_id': 'u1'}
+        )
+        assert decision.should_intervene
+        assert decision.message == 'Time for a walk?'
+        assert decision.priority == 4
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_uses_fallback(self):
+        """Unparseable responses fall back on the alert level."""
+        decider = AGIInterventionDecider(FakeConsciousness('not json {'))
+        decision = await decider.decide_intervention(
+            {'name': 'fall', 'alert_level': 'high', 'message': 'Fall detected'},
+            {'user_id': 'u1'},
+        )
+        assert decision.should_intervene
+        assert decision.priority == 7
+        assert decision.message == 'Fall detected'
+
+    def test_stdlib_fallback_without_orjson(self, monkeypatch):
+        """Without orjson the module parses with json.loads."""
+        try:
+            with monkeypatch.context() as patch:
+                patch.setitem(sys.modules, 'orjson', None)  # Blocks the import
+                module = importlib.reload(decider_module)
+                assert not module.ORJSON_AVAILABLE
+                assert module._json_loads is json.loads
+        finally:
+            importlib.reload(decider_module)
+
+    def test_orjson_errors_caught_as_json_errors(self):
+        """orjson's decode error is a json.JSONDecodeError."""
+        orjson = pytest.importorskip('orjson')
+        assert decider_module._json_loads is orjson.loads
+        with pytest.raises(json.JSONDecodeError):
+            decider_module._json_loads('not json {')
+
+
+class TestFatigue:
+    """Test the per-user delivered-intervention window."""
+
+    @pytest.mark.asyncio
+    async def test_fatigue_counts_delivered_per_user(self):
+        """Only delivered interventions for the same user add fatigue."""
+        decider = AGIInterventionDecider(FakeConsciousness(_INTERVENE))
+        for _ in range(3):
+            await decider.decide_intervention({'name': 'p'}, {'user_id': 'u1'})
+        await decider.decide_intervention({'name': 'p'}, {'user_id': 'u2'})
+
+        assert decider._calculate_fatigue('u1') == pytest.approx(0.3)
+        assert decider._calculate_fatigue('u2') == pytest.approx(0.1)
+        assert decider._calculate_fatigue('nobody') == 0.0
+        assert decider._calculate_fatigue(None) == 0.0
+
+        quiet = AGIInterventionDecider(FakeConsciousness('{"should_intervene": false}'))
+        await quiet.decide_intervention({'name': 'p'}, {'user_id': 'u1'})
+        assert quiet._calculate_fatigue('u1') == 0.0
+
+    def test_expired_entries_drop_out(self):
+        """Interventions older than the window stop counting."""
+        decider = AGIInterventionDecider(FakeConsciousness(_INTERVENE))
+        now = datetime.now()
+        window = timedelta(hours=decider_module.FATIGUE_WINDOW_HOURS)
+        for stamp in (now - window - timedelta(minutes=5),
+                      now - window + timedelta(minutes=5),
+                      now):
+            decider._delivered_ts['u1'].append(stamp.timestamp())
+
+        assert decider._count_recent_interventions('u1') == 2
+        assert len(decider._delivered_ts['u1']) == 2
+
+    def test_fatigue_caps_at_one(self):
+        """Ten or more recent interventions mean full fatigue."""
+        decider = AGIInterventionDecider(FakeConsciousness(_INTERVENE))
+        stamp = datetime.now().timestamp()
+        decider._delivered_ts['u1'].extend([stamp] * 15)
+        assert decider._calculate_fatigue('u1') == 1.0
+
+    @pytest.mark.asyncio
+    async def test_prompt_reports_recent_count(self):
+        """The decision prompt carries the user's recent count and fatigue."""
+        consciousness = FakeConsciousness(_INTERVENE)
+        decider = AGIInterventionDecider(consciousness)
+        await decider.decide_intervention({'name': 'p'}, {'user_id': 'u1'})
+        await decider.decide_intervention({'name': 'p'}, {'user_id': 'u1'})
+
+        assert 'Recent interventions (24h): 1' in consciousness.prompts[-1]
+        assert 'Intervention fatigue: 0.10' in consciousness.prompts[-1]
@@ -0,0 +1,248 @@
+"""
+Coherence Engine V2 Tests
+
+Tests for the meta-logic coherence engine and its evaluation caches.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+from singularis.infinity import CoherenceEngineV2, CoherenceReport, CognitiveState
+from singularis.infinity.coherence_engine_v2 import (
+    BREACH_COHERENCE,
+    BREACH_CONTRADICTION,
+    InterventionType,
+)
+
+
+def _track(period):
+    """Minimal track object - the engine only reads .period"""
+    return SimpleNamespace(period=period)
+
+
+class _TruthValue:
+    """Minimal TruthValue: per-track values behind .tracks and .get()"""
+
+    def __init__(self, **tracks):
+        self.tracks = tracks
+
+    def get(self, track):
+        return self.tracks[track]
+
+
+def _reference_pairs(state):
+    """
+    Straight pairwise loops over every TruthValue, as the engine did
+    before the fused scan: (contradictions, coherence ratio, conflicts).
+    """
+    contradictions = []
+    conflicts = []
+    agreements = comparisons = 0
+    for tv_name, tv in state.truth_values.items():
+        tracks = list(tv.tracks)
+        for i, track1 in enumerate(tracks):
+            for track2 in tracks[i + 1:]:
+                val1, val2 = tv.get(track1), tv.get(track2)
+                diff = abs(val1 - val2)
+                if diff > 0.7:
+                    contradictions.append((tv_name, track1, track2, val1, val2, diff))
+                if diff > 0.6:
+                    conflicts.append((f"{tv_name}.{track1}", f"{tv_name}.{track2}"))
+                if diff < 0.3:
+                    agreements += 1
+                comparisons += 1
+    ratio = agreements / comparisons if comparisons else 1.0
+    return contradictions, ratio, conflicts
+
+
+def _random_state(rng):
+    truth_values = {}
+    for n in range(rng.randint(0, 6)):
+        names = rng.sample(['main', 'fast', 'slow', 'deep', 'para'], rng.randint(1, 5))
+        truth_values[f"tv{n}"] = _TruthValue(**{t: rng.random() for t in names})
+    return CognitiveState(truth_values=truth_values)
+
+
+class TestBaselineEquivalence:
+    """Test the fused pair scan against the plain pairwise loops."""
+
+    def test_pair_analyses_match_reference(self):
+        """Contradictions, coherence ratio and conflicts match on random states."""
+        rng = random.Random(1234)
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=0)
+        for _ in range(300):
+            state = _random_state(rng)
+            contradictions, ratio, conflicts = _reference_pairs(state)
+            report = engine.evaluate_coherence(state)
+
+            got = [(c.truthvalue, c.track1, c.track2, c.val1, c.val2, c.severity)
+                   for c in report.contradictions]
+            assert got == contradictions
+            assert report.coherence_ratio == pytest.approx(ratio)
+            assert report.conflicting_tracks == conflicts
+            if contradictions:
+                level = min(1.0, sum(c[5] for c in contradictions) / len(contradictions))
+                assert report.contradiction_level == pytest.approx(level)
+            else:
+                assert report.contradiction_level == 0.0
+
+    def test_goal_tension_matches_reference(self):
+        """Goal-conflict tension sources keep the pairwise order."""
+        engine = CoherenceEngineV2(verbose=False)
+        goals = ['explore the ruins', 'rest', 'hide', 'attack bandit', 'flee']
+        report = engine.evaluate_coherence(CognitiveState(goals=goals))
+        assert report.tension_sources == [
+            "Goal conflict: explore the ruins vs hide",
+            "Goal conflict: attack bandit vs flee",
+        ]
+        assert report.cognitive_tension == pytest.approx(0.5)
+
+
+class TestTrackPartition:
+    """Test the fast/slow track partition used by modal alignment."""
+
+    def test_in_place_track_append_is_seen(self):
+        """Appending a track without bumping any counter changes the result."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=0)
+        state = CognitiveState(tracks=[_track(100)])
+        assert engine.evaluate_coherence(state).modal_consistency == 1.0
+
+        state.tracks.append(_track(2000))
+        assert engine.evaluate_coherence(state).modal_consistency == 0.8
+
+    def test_in_place_period_change_is_seen(self):
+        """Changing a period in place changes the partition."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=0)
+        state = CognitiveState(tracks=[_track(100), _track(500)])
+        assert engine.evaluate_coherence(state).modal_consistency == 1.0
+
+        state.tracks[1].period = 2000
+        assert engine.evaluate_coherence(state).modal_consistency == 0.8
+
+    def test_versioned_state_reuses_partition(self):
+        """Opting in with tracks_version caches until the version changes."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=0)
+        state = CognitiveState(tracks=[_track(100), _track(2000)], tracks_version=0)
+
+        first = engine._partition_tracks(state)
+        assert engine._partition_tracks(state)[0] is first[0]
+
+        state.tracks.pop()
+        state.tracks_version += 1
+        fast, slow = engine._partition_tracks(state)
+        assert len(fast) == 1 and slow == []
+
+
+class TestCoherenceReport:
+    """Test severity and the breach mask on CoherenceReport."""
+
+    def test_severity_matches_weighted_sum(self):
+        """Severity is the documented weighted sum of the metrics."""
+        report = CoherenceReport(
+            contradiction_level=0.4,
+            cognitive_tension=0.2,
+            coherence_ratio=0.7,
+            modal_consistency=0.9,
+            context_appropriateness=0.5,
+        )
+        expected = (
+            0.3 * 0.4 + 0.25 * 0.2 + 0.25 * (1 - 0.7)
+            + 0.1 * (1 - 0.9) + 0.1 * (1 - 0.5)
+        )
+        assert report.severity() == pytest.approx(expected)
+
+    def test_severity_tracks_metric_changes(self):
+        """Adjusting a metric after the first severity() call is reflected."""
+        report = CoherenceReport()
+        assert report.severity() == pytest.approx(0.0)
+
+        report.contradiction_level = 1.0
+        assert report.severity() == pytest.approx(0.3)
+
+    def test_breach_mask_recomputed_after_reset(self):
+        """Resetting breach_mask after an edit makes corrections follow it."""
+        engine = CoherenceEngineV2(verbose=False)
+        report = engine.evaluate_coherence(CognitiveState())
+        assert report.breach_mask == 0
+        assert len(engine.apply_corrections(report)) == 0
+
+        report.context_appropriateness = 0.1
+        assert report.breach_mask == 0  # Evaluation-time snapshot
+        report.breach_mask = -1
+        adjustments = engine.apply_corrections(report)
+        assert [a.intervention_type for a in adjustments] == [
+            InterventionType.FORCE_CONTEXT_SHIFT
+        ]
+
+    def test_breach_mask_bits(self):
+        """compute_breach_mask sets one bit per breached threshold."""
+        report = CoherenceReport(contradiction_level=0.9, coherence_ratio=0.1)
+        thr = (0.7, 0.6, 0.4, 0.5, 0.5)
+        assert report.compute_breach_mask(thr) == (
+            BREACH_CONTRADICTION | BREACH_COHERENCE
+        )
+
+
+class TestShapeCache:
+    """Test report reuse for repeated state shapes."""
+
+    def test_cache_is_opt_in(self):
+        """A default engine analyses every state afresh."""
+        engine = CoherenceEngineV2(verbose=False)
+        engine.evaluate_coherence(CognitiveState())
+        engine.evaluate_coherence(CognitiveState())
+        assert engine.shape_cache_hits == 0
+        assert not engine._shape_cache
+
+    def test_epsilon_reuses_near_states(self):
+        """Within shape_cache_epsilon a drifted state hits the cache."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=8, shape_cache_epsilon=0.05)
+        engine.evaluate_coherence(CognitiveState(emotions={'fear': 0.60}))
+        engine.evaluate_coherence(CognitiveState(emotions={'fear': 0.62}))
+        engine.evaluate_coherence(CognitiveState(emotions={'fear': 0.90}))
+        assert engine.shape_cache_hits == 1
+
+    def test_cached_report_matches_fresh_engine(self):
+        """A cache hit returns the same metrics as a cold evaluation."""
+        state = CognitiveState(goals=['explore cave', 'hide from guard'],
+                               emotions={'fear': 0.8, 'trust': 0.7})
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=64)
+        engine.evaluate_coherence(state)
+        hit = engine.evaluate_coherence(state)
+        fresh = CoherenceEngineV2(verbose=False).evaluate_coherence(state)
+
+        assert engine.shape_cache_hits == 1
+        assert hit.severity() == pytest.approx(fresh.severity())
+        assert hit.tension_sources == fresh.tension_sources
+
+    def test_caller_edits_do_not_leak_into_cache(self):
+        """Mutating a returned report doesn't change later cache hits."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=64)
+        report = engine.evaluate_coherence(CognitiveState())
+        report.contradiction_level = 0.9
+        report.tension_sources.append('edited')
+
+        again = engine.evaluate_coherence(CognitiveState())
+        assert engine.shape_cache_hits == 1
+        assert again.contradiction_level == 0.0
+        assert again.tension_sources == []
+
+
+class TestStatistics:
+    """Test get_statistics bookkeeping."""
+
+    def test_avg_severity_matches_recent_window(self):
+        """avg_severity stays equal to the mean of the last 100 severities."""
+        engine = CoherenceEngineV2(verbose=False, shape_cache_size=0)
+        severities = []
+        for i in range(1050):
+            fear = (i * 37 % 101) / 100.0
+            state = CognitiveState(emotions={'fear': fear, 'trust': 0.9},
+                                   goals=['attack', 'flee'] if i % 3 else [])
+            severities.append(engine.evaluate_coherence(state).severity())
+
+        window = severities[-100:]
+        stats = engine.get_statistics()
+        assert stats['avg_severity'] == pytest.approx(sum(window) / 100, abs=1e-12)
+        assert engine._severity_sum == pytest.approx(sum(window), abs=1e-12)
@@ -0,0 +1,164 @@
+"""
+HaackLang Operator Tests
+
+Tests for the scalar/vector operator registry and paraconsistent values.
+"""
+
+import math
+
+import numpy as np
+import pytest
+from singularis.infinity.haacklang_operators import (
+    OperatorRegistry,
+    ParaconsistentArray,
+    ParaconsistentValue,
+    TemporalWindow,
+    TemporalWindowQ8,
+    Track,
+    TrackBank,
+    fuzzy_blend,
+    fuzzy_sum,
+    interference_matrix,
+    make_pv,
+    paraconsistent_and,
+    paraconsistent_and_vec,
+    paraconsistent_or,
+    paraconsistent_or_vec,
+    probability,
+    track_align,
+    track_interference,
+    _trend_loop,
+    _trend_numpy,
+    uncertainty,
+)
+
+
+class TestElementwiseDispatch:
+    """Test registry entries that accept scalars or arrays."""
+
+    def test_keyword_only_call(self):
+        """Registry operators accept every argument by keyword."""
+        registry = OperatorRegistry()
+        assert registry.get('P')(evidence=0.9, prior=0.5) == pytest.approx(
+            probability(0.9, 0.5)
+        )
+        assert registry.get('~')(value=0.8, confidence=0.5) == pytest.approx(
+            uncertainty(0.8, 0.5)
+        )
+        assert registry.get('⊕')(a=0.2, b=0.6, weight=0.25) == pytest.approx(
+            fuzzy_blend(0.2, 0.6, 0.25)
+        )
+
+    def test_keyword_array_call_uses_vector_path(self):
+        """A keyword-passed array still dispatches to the vector kernel."""
+        registry = OperatorRegistry()
+        a = np.array([0.1, 0.5, 0.9])
+        b = np.array([0.3, 0.2, 0.7])
+        out = registry.get('⊞')(a=a, b=b)
+        assert isinstance(out, np.ndarray)
+        np.testing.assert_allclose(out, [fuzzy_sum(x, y) for x, y in zip(a, b)])
+
+    def test_vector_matches_scalar(self):
+        """Vector kernels agree with the scalar operators elementwise."""
+        registry = OperatorRegistry()
+        rng = np.random.default_rng(7)
+        a, b = rng.random(64), rng.random(64)
+        for symbol in ('⊕', '⊗', '⊞'):
+            op = registry.get(symbol)
+            np.testing.assert_allclose(op(a, b), [op(x, y) for x, y in zip(a, b)])
+        np.testing.assert_allclose(registry.get('¬')(a), 1.0 - a)
+
+
+class TestParaconsistentValue:
+    """Test immutable paraconsistent values and literal interning."""
+
+    def test_make_pv_interns_equal_literals(self):
+        """Repeated literals share one instance."""
+        assert make_pv(0.5, 0.5) is make_pv(0.5, 0.5)
+
+    def test_make_pv_normalizes_int_literals(self):
+        """An int call never leaks int fields into a later float call."""
+        from_int = make_pv(1, 0)
+        from_float = make_pv(1.0, 0.0)
+        assert from_int is from_float
+        assert type(from_float.belief) is float
+        assert type(from_float.disbelief) is float
+
+    def test_values_are_frozen(self):
+        """Interned instances can't be mutated through a shared reference."""
+        pv = make_pv(0.9, 0.1)
+        with pytest.raises(AttributeError):
+            pv.belief = 0.0
+        assert pv == ParaconsistentValue(0.9, 0.1)
+
+
+class TestTemporalWindow:
+    """Test the circular window buffer and its trend kernels."""
+
+    def test_values_oldest_first_after_wrap(self):
+        """Once full, the window keeps the newest `size` values in order."""
+        window = TemporalWindow(4)
+        for i in range(7):
+            window.add(i / 10, float(i))
+        assert len(window) == 4
+        np.testing.assert_allclose(window.get_values(), [0.3, 0.4, 0.5, 0.6], rtol=1e-6)
+        assert window.mean() == pytest.approx(0.45, rel=1e-6)
+
+    @pytest.mark.parametrize('n', [2, 3, 10, 37])
+    def test_trend_kernels_match_polyfit(self, n):
+        """Both trend kernels give the least-squares slope."""
+        y = np.random.default_rng(n).random(n).astype(np.float32)
+        expected = np.polyfit(np.arange(n), y.astype(np.float64), 1)[0]
+        assert _trend_loop(y, n) == pytest.approx(expected, abs=1e-9)
+        assert _trend_numpy(y, n) == pytest.approx(expected, abs=1e-9)
+
+    def test_trend_across_wrap(self):
+        """trend() regresses over the wrapped, oldest-first values."""
+        window = TemporalWindow(5)
+        for i in range(9):
+            window.add(0.1 * i, float(i))
+        assert window.trend() == pytest.approx(0.1, rel=1e-5)
+        assert TemporalWindow(3).trend() == 0.0
+
+    def test_q8_window_quantizes(self):
+        """The 8-bit window clamps and rounds to 1/255 steps."""
+        window = TemporalWindowQ8(3)
+        for value in (-0.5, 0.5, 2.0):
+            window.add(value, 0.0)
+        np.testing.assert_allclose(window.get_values(), [0.0, 128 / 255, 1.0], rtol=1e-6)
+        assert window.mean() == pytest.approx((128 / 255 + 1.0) / 3)
+
+
+class TestBatchedOperators:
+    """Test struct-of-arrays operators against their scalar forms."""
+
+    def test_paraconsistent_arrays_match_scalars(self):
+        """⊓/⊔ over arrays agree with the scalar operators."""
+        rng = np.random.default_rng(5)
+        a_vals = [ParaconsistentValue(*rng.random(2)) for _ in range(16)]
+        b_vals = [ParaconsistentValue(*rng.random(2)) for _ in range(16)]
+        a = ParaconsistentArray.from_values(a_vals)
+        b = ParaconsistentArray.from_values(b_vals)
+        out = ParaconsistentArray.empty(16)
+
+        for vec, scalar in ((paraconsistent_and_vec, paraconsistent_and),
+                            (paraconsistent_or_vec, paraconsistent_or)):
+            got = vec(a, b, out=out)
+            for i, (x, y) in enumerate(zip(a_vals, b_vals)):
+                want = scalar(x, y)
+                assert got[i].belief == pytest.approx(want.belief, abs=1e-6)
+                assert got[i].disbelief == pytest.approx(want.disbelief, abs=1e-6)
+
+    def test_interference_matrix_matches_pairwise(self):
+        """The bank matrix equals interfere() for every pair."""
+        tracks = [Track(f"t{i}", 100, phase) for i, phase in enumerate((0.0, 1.0, 3.0, 6.0))]
+        matrix = interference_matrix(TrackBank.from_tracks(tracks))
+        for i, a in enumerate(tracks):
+            for j, b in enumerate(tracks):
+                assert matrix[i, j] == pytest.approx(track_interference(a, b), abs=1e-6)
+
+    def test_track_align_takes_short_way_round(self):
+        """align() moves along the shorter arc across 0/2π."""
+        a, b = Track('a', 100, 0.1), Track('b', 100, 2 * math.pi - 0.1)
+        track_align(a, b, strength=0.5)
+        assert a.phase == pytest.approx(0.0)
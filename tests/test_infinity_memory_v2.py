@@ -0,0 +1,320 @@
+"""
+Memory Engine V2 Tests
+
+Tests for rhythm signatures and the struct-of-arrays episodic store.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+from singularis.infinity import MemoryEngineV2, RhythmSignature
+from singularis.infinity import _memory_kernels as kernels
+from singularis.infinity.memory_engine_v2 import FORGET_THRESHOLD, STRENGTH_SCALE
+
+
+def _signature(phases, periods=None, pattern=(), freq=0.01):
+    periods = periods or {name: 100 for name in phases}
+    return RhythmSignature(
+        track_phases=dict(phases),
+        track_periods=dict(periods),
+        interference_pattern=list(pattern),
+        dominant_frequency=freq,
+    )
+
+
+class TestRhythmSignature:
+    """Test RhythmSignature value semantics and similarity."""
+
+    def test_equality_compares_patterns_by_value(self):
+        """Equal signatures compare equal despite holding ndarrays."""
+        a = _signature({'main': 1.0}, pattern=[0.5, 0.25])
+        b = _signature({'main': 1.0}, pattern=[0.5, 0.25])
+        assert a == b
+
+    def test_inequality_on_pattern_difference(self):
+        """Different patterns (or lengths) make signatures unequal."""
+        a = _signature({'main': 1.0}, pattern=[0.5, 0.25])
+        assert a != _signature({'main': 1.0}, pattern=[0.5, 0.3])
+        assert a != _signature({'main': 1.0}, pattern=[0.5])
+        assert a != _signature({'main': 2.0}, pattern=[0.5, 0.25])
+
+
+class _ReferenceStore:
+    """
+    Dict-of-traces model of the episodic store: linear similarity scan,
+    stable sorts, per-memory decay. Insertion order is dict order.
+    """
+
+    def __init__(self, capacity, decay_rate):
+        self.capacity = capacity
+        self.decay_rate = decay_rate
+        self.memories = {}  # id -> [signature, strength, context, cons_count]
+
+    def encode(self, memory_id, signature, context):
+        self.memories[memory_id] = [signature, 1.0, context, 0]
+        if len(self.memories) > self.capacity:
+            weakest = min(self.memories, key=lambda m: self.memories[m][1])
+            del self.memories[weakest]
+
+    def _reinforce(self, ids):
+        for memory_id in ids:
+            entry = self.memories[memory_id]
+            entry[1] = min(1.0, entry[1] + 0.05)
+            entry[3] += 1
+
+    def recall_by_rhythm(self, query, top_k, threshold):
+        scored = [
+            (memory_id, query.compute_similarity(entry[0]))
+            for memory_id, entry in self.memories.items()
+        ]
+        scored = [pair for pair in scored if pair[1] >= threshold]
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        top = scored[:top_k]
+        self._reinforce(memory_id for memory_id, _ in top)
+        return top
+
+    def recall_by_context(self, context, top_k):
+        ids = [m for m, entry in self.memories.items() if entry[2] == context]
+        ids.sort(key=lambda m: self.memories[m][1], reverse=True)
+        top = ids[:top_k]
+        self._reinforce(top)
+        return top
+
+    def apply_forgetting(self):
+        for memory_id in list(self.memories):
+            entry = self.memories[memory_id]
+            entry[1] *= 1.0 - self.decay_rate
+            if entry[1] < 0.1:
+                del self.memories[memory_id]
+
+
+_TRACKS = ('main', 'fast', 'slow', 'deep')
+_PHASES = (0.0, math.pi / 2, math.pi, 3 * math.pi / 2)
+
+
+def _random_track_states(rng):
+    names = rng.sample(_TRACKS, rng.randint(1, len(_TRACKS)))
+    return {name: (float(rng.choice(_PHASES)), int(rng.choice((50, 100, 400)))) for name in names}
+
+
+class TestBaselineEquivalence:
+    """Test the SoA episodic store against the dict-of-traces model."""
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_random_operation_sequence(self, seed):
+        """Encode/recall/forget sequences return the same ids in the same order."""
+        rng = np.random.default_rng(seed)
+        py_rng = random.Random(seed)
+        capacity = 12
+        engine = MemoryEngineV2(episodic_capacity=capacity, decay_rate=0.05, verbose=False)
+        reference = _ReferenceStore(capacity, decay_rate=0.05)
+
+        for step in range(400):
+            op = rng.integers(0, 10)
+            if op < 4:
+                memory_id = f"m{rng.integers(0, 30)}"
+                states = _random_track_states(py_rng)
+                context = str(py_rng.choice(('combat', 'explore')))
+                memory = engine.encode_episodic(memory_id, {}, states, context)
+                reference.encode(memory_id, memory.rhythm_signature, context)
+            elif op < 7:
+                phases = {n: p for n, (p, _) in _random_track_states(py_rng).items()}
+                query = _signature(phases, freq=0.01)
+                got = engine.recall_by_rhythm(query, top_k=4, threshold=0.3)
+                want = reference.recall_by_rhythm(query, top_k=4, threshold=0.3)
+                assert [m.memory_id for m, _ in got] == [m for m, _ in want], step
+                assert [s for _, s in got] == pytest.approx([s for _, s in want])
+            elif op < 9:
+                context = str(py_rng.choice(('combat', 'explore')))
+                got = engine.recall_by_context(context, top_k=3)
+                want = reference.recall_by_context(context, top_k=3)
+                assert [m.memory_id for m in got] == want, step
+            else:
+                engine.apply_forgetting()
+                reference.apply_forgetting()
+
+            assert list(engine.episodic_memories) == list(reference.memories), step
+            for memory_id, entry in reference.memories.items():
+                memory = engine.episodic_memories[memory_id]
+                assert memory.strength == pytest.approx(entry[1], abs=1e-3)
+                assert memory.consolidation_count == entry[3]
+
+    def test_rhythm_ties_follow_insertion_order_after_slot_reuse(self):
+        """Equal-score recalls rank by insertion even when slots were reused."""
+        engine = MemoryEngineV2(episodic_capacity=3, verbose=False)
+        states = {'main': (0.0, 100)}
+        for i in range(3):
+            engine.encode_episodic(f"old{i}", {}, states, 'ctx')
+        # Evicts old0 (oldest of the equally strong); new0 takes its slot
+        engine.encode_episodic('new0', {}, states, 'ctx')
+        engine._remove_episodic('old1')
+        engine.encode_episodic('new1', {}, states, 'ctx')
+
+        query = _signature({'main': 0.0})
+        got = engine.recall_by_rhythm(query, top_k=5, threshold=0.0)
+        assert [m.memory_id for m, _ in got] == ['old2', 'new0', 'new1']
+
+
+class TestStatistics:
+    """Test get_statistics averages."""
+
+    def _engine_with_pattern(self):
+        engine = MemoryEngineV2(verbose=False, consolidation_threshold=0)
+        for i in range(3):
+            engine.encode_episodic(f"m{i}", {}, {'main': (0.1 * i, 100)}, 'ctx')
+        pattern = engine.consolidate_episodic_to_semantic('habit')
+        assert pattern is not None
+        return engine, pattern
+
+    def test_semantic_confidence_follows_direct_writes(self):
+        """Confidence changed outside the engine is reflected in the average."""
+        engine, pattern = self._engine_with_pattern()
+        assert engine.get_statistics()['avg_semantic_confidence'] == pytest.approx(0.6)
+
+        pattern.activate()
+        assert engine.get_statistics()['avg_semantic_confidence'] == pytest.approx(0.65)
+
+        pattern.confidence = 0.9
+        assert engine.get_statistics()['avg_semantic_confidence'] == pytest.approx(0.9)
+
+    def test_semantic_confidence_after_retrieval(self):
+        """Engine-side activation is counted once."""
+        engine, pattern = self._engine_with_pattern()
+        assert engine.retrieve_semantic_pattern('habit') is pattern
+        assert engine.get_statistics()['avg_semantic_confidence'] == pytest.approx(0.65)
+
+    def test_episodic_strength_average(self):
+        """avg_episodic_strength averages the lazily decayed strengths."""
+        engine = MemoryEngineV2(verbose=False, decay_rate=0.1)
+        for i in range(4):
+            engine.encode_episodic(f"m{i}", {}, {'main': (0.0, 100)}, 'ctx')
+        engine.apply_forgetting()
+        engine.apply_forgetting()
+        stats = engine.get_statistics()
+        assert stats['avg_episodic_strength'] == pytest.approx(0.81, abs=1e-4)
+
+
+class TestKernels:
+    """Test the Numba-ready loops against their NumPy counterparts."""
+
+    def test_batch_similarity_loop_matches_numpy(self):
+        """The fused loop and the broadcast version score rows identically."""
+        rng = np.random.default_rng(3)
+        rows, width = 40, 6
+        phase_mat = rng.uniform(0, 2 * math.pi, (rows, width))
+        track_mask = rng.random((rows, width)) < 0.5
+        track_count = track_mask.sum(axis=1).astype(np.int32)
+        live = rng.random(rows) < 0.8
+        q_phase = rng.uniform(0, 2 * math.pi, width)
+        q_mask = rng.random(width) < 0.6
+        dom_freq = rng.random(rows) * 0.05
+
+        loop_out = np.empty(rows)
+        numpy_out = np.empty(rows)
+        args = (phase_mat, track_mask, track_count, live,
+                q_phase, q_mask, int(q_mask.sum()), dom_freq, 0.01)
+        kernels._batch_similarity_loop(*args, loop_out)
+        kernels.batch_similarity_numpy(*args, numpy_out)
+        np.testing.assert_allclose(loop_out, numpy_out)
+
+    def test_pair_similarity_loop_matches_signature(self):
+        """The scalar loop reproduces RhythmSignature.compute_similarity."""
+        a = _signature({'main': 0.3, 'fast': 5.9, 'slow': 2.0}, freq=0.02)
+        b = _signature({'main': 6.1, 'slow': 1.0, 'deep': 4.0}, freq=0.005)
+        _, i1, i2 = np.intersect1d(a._name_array, b._name_array,
+                                   assume_unique=True, return_indices=True)
+        got = kernels._pair_similarity_loop(a._phases, b._phases, i1, i2,
+                                            0.02, 0.005, 3, 3)
+        assert got == pytest.approx(a.compute_similarity(b))
+
+    def test_interference_matches_per_step_formula(self):
+        """Both interference kernels equal the per-step mean of cos(phase)."""
+        phases = {'main': 0.4, 'fast': 2.5, 'slow': 5.0}
+        periods = {'main': 100, 'fast': 7, 'slow': 1000}
+        expected = [
+            sum(math.cos((phases[k] + 2 * math.pi * t / periods[k]) % (2 * math.pi))
+                for k in phases) / len(phases)
+            for t in range(10)
+        ]
+        p = np.array(list(phases.values()))
+        q = np.array([float(periods[k]) for k in phases])
+        for kernel in (kernels._interference_loop, kernels.interference_numpy):
+            out = np.empty(10, dtype=np.float32)
+            kernel(p, q, 10, out)
+            np.testing.assert_allclose(out, expected, atol=1e-6)
+
+        engine = MemoryEngineV2(verbose=False)
+        memory = engine.encode_episodic(
+            'm', {}, {k: (phases[k], periods[k]) for k in phases}, 'ctx'
+        )
+        np.testing.assert_allclose(
+            memory.rhythm_signature.interference_pattern, expected, atol=1e-6
+        )
+
+
+def _hybrid_decay(rate, knee, dt):
+    """Exponential up to the knee, slope-matched power law after it"""
+    log_keep = math.log1p(-rate)
+    factor = math.exp(min(dt, knee) * log_keep)
+    if dt > knee:
+        factor *= (dt / knee) ** (log_keep * knee)
+    return factor
+
+
+class TestLazyDecay:
+    """Test lazily applied forgetting against an eager per-step model."""
+
+    def test_strength_follows_hybrid_curve(self):
+        """Strength reads apply the exponential, then power-law, decay."""
+        engine = MemoryEngineV2(verbose=False, decay_rate=0.01, decay_knee=20)
+        memory = engine.encode_episodic('m', {}, {'main': (0.0, 100)}, 'ctx')
+        for step in range(1, 60):
+            engine.apply_forgetting()
+            if 'm' not in engine.episodic_memories:
+                break
+            assert memory.strength == pytest.approx(_hybrid_decay(0.01, 20, step))
+
+    def test_forgetting_matches_eager_sweep(self):
+        """Memories are forgotten on exactly the step an eager sweep would."""
+        rate, knee = 0.02, 50
+        engine = MemoryEngineV2(episodic_capacity=64, verbose=False,
+                                decay_rate=rate, decay_knee=knee)
+        rng = np.random.default_rng(11)
+        initial = {}
+        for i in range(40):
+            memory = engine.encode_episodic(f"m{i}", {}, {'main': (0.0, 100)}, 'ctx')
+            memory.strength = float(rng.uniform(0.12, 1.0))
+            initial[f"m{i}"] = round(memory.strength * STRENGTH_SCALE) / STRENGTH_SCALE
+
+        forgotten = 0
+        for step in range(1, 400):
+            engine.apply_forgetting()
+            alive = {m for m, s0 in initial.items()
+                     if s0 * _hybrid_decay(rate, knee, step) >= FORGET_THRESHOLD}
+            assert set(engine.episodic_memories) == alive, step
+            forgotten = len(initial) - len(alive)
+        assert engine.total_forgotten == forgotten > 0
+
+    def test_rate_change_applies_from_now_on(self):
+        """Changing decay_rate folds the elapsed decay in at the old rate."""
+        engine = MemoryEngineV2(verbose=False, decay_rate=0.1)
+        memory = engine.encode_episodic('m', {}, {'main': (0.0, 100)}, 'ctx')
+        engine.apply_forgetting()
+        engine.decay_rate = 0.2
+        engine.apply_forgetting()
+        assert memory.strength == pytest.approx(0.9 * 0.8, abs=1e-4)
+
+    def test_detached_trace_keeps_its_fields(self):
+        """A trace removed from the store keeps its column values."""
+        engine = MemoryEngineV2(episodic_capacity=1, verbose=False)
+        first = engine.encode_episodic('a', {}, {'main': (0.0, 100)}, 'ctx')
+        first.access_count = 4
+        engine.encode_episodic('b', {}, {'main': (1.0, 100)}, 'ctx')
+
+        assert 'a' not in engine.episodic_memories
+        assert first._store is None
+        assert first.access_count == 4
+        assert first.strength == pytest.approx(1.0)
+        assert first.rhythm_signature.interference_pattern.base is None
@@ -0,0 +1,178 @@
+"""
+Meta-Context System Tests
+
+Tests for the context stack, timed expiry and conditional rules.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from singularis.infinity import ConditionalRule, Context, ContextLevel, MetaContextSystem
+from singularis.infinity.meta_context import ContextStack, create_survival_context
+
+
+def _context(name, level=ContextLevel.MICRO):
+    return Context(name=name, level=level)
+
+
+class TestContextExpiry:
+    """Test the expiry heap against the expires_at each context holds now."""
+
+    def test_timed_push_expires(self):
+        """A context pushed with a duration expires after it."""
+        system = MetaContextSystem(verbose=False)
+        ctx = _context('focus')
+        system.push_context(ctx, duration=0.01)
+        system.update_contexts(SimpleNamespace())
+        assert system.get_active_context() is ctx
+
+        time.sleep(0.02)
+        system.update_contexts(SimpleNamespace())
+        assert system.get_active_context() is None
+        assert system.total_expirations == 1
+
+    def test_expiry_set_after_push(self):
+        """Setting expires_at on an already pushed context is honoured."""
+        system = MetaContextSystem(verbose=False)
+        ctx = _context('focus')
+        system.push_context(ctx)
+        ctx.expires_at = time.monotonic() + 0.01
+
+        time.sleep(0.02)
+        system.update_contexts(SimpleNamespace())
+        assert system.get_active_context() is None
+        assert system.total_expirations == 1
+
+    def test_extended_expiry_is_honoured(self):
+        """Extending expires_at after the push keeps the context alive."""
+        stack = ContextStack()
+        ctx = _context('focus')
+        ctx.expires_at = time.monotonic() + 0.01
+        stack.push(ctx)
+        ctx.expires_at = time.monotonic() + 60.0
+
+        time.sleep(0.02)
+        assert stack.expired(time.monotonic()) == []
+        assert stack.expired(time.monotonic() + 120.0) == [ctx]
+
+    def test_earlier_expiry_needs_reschedule(self):
+        """reschedule() lets an expiry moved earlier take effect."""
+        stack = ContextStack()
+        ctx = _context('focus')
+        ctx.expires_at = time.monotonic() + 60.0
+        stack.push(ctx)
+
+        ctx.expires_at = time.monotonic() - 1.0
+        stack.reschedule(ctx)
+        assert stack.expired(time.monotonic()) == [ctx]
+
+    def test_untimed_again_then_retimed(self):
+        """A context made untimed and later re-timed still expires."""
+        stack = ContextStack()
+        ctx = _context('focus')
+        ctx.expires_at = time.monotonic() - 1.0
+        stack.push(ctx)
+        ctx.expires_at = None
+        assert stack.expired(time.monotonic()) == []
+
+        ctx.expires_at = time.monotonic() - 0.5
+        assert stack.expired(time.monotonic()) == [ctx]
+
+    def test_removed_context_never_reported(self):
+        """Early removal drops the context from expiry results."""
+        stack = ContextStack()
+        ctx = _context('focus')
+        ctx.expires_at = time.monotonic() - 1.0
+        stack.push(ctx)
+        stack.remove(ctx)
+        assert stack.expired(time.monotonic()) == []
+
+    def test_expired_in_stack_order(self):
+        """Due contexts come back bottom-to-top regardless of expiry order."""
+        stack = ContextStack()
+        now = time.monotonic()
+        contexts = [_context(f"c{i}") for i in range(3)]
+        for ctx, offset in zip(contexts, (-1.0, -3.0, -2.0)):
+            ctx.expires_at = now + offset
+            stack.push(ctx)
+        assert stack.expired(now) == contexts
+
+
+class TestContextStack:
+    """Test stack bookkeeping and thread safety."""
+
+    def test_find_falls_back_to_duplicate_name(self):
+        """Removing the indexed context exposes the next one with that name."""
+        stack = ContextStack()
+        first, second = _context('dup'), _context('dup')
+        stack.push(first)
+        stack.push(second)
+        assert stack.find('dup') is first
+        stack.remove(first)
+        assert stack.find('dup') is second
+
+    def test_bounded_push(self):
+        """A bounded stack rejects pushes beyond max_depth."""
+        stack = ContextStack(max_depth=2)
+        assert stack.push(_context('a'))
+        assert stack.push(_context('b'))
+        assert not stack.push(_context('c'))
+        assert stack.depth() == 2
+
+    def test_concurrent_push_pop(self):
+        """Concurrent pushes and pops leave the indexes consistent."""
+        stack = ContextStack(max_depth=None)
+
+        def worker(tag):
+            for i in range(500):
+                stack.push(_context(f"{tag}{i % 5}"))
+                stack.pop()
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in 'abcd']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert stack.depth() == 0
+        assert stack._by_name == {}
+        assert stack._untimed == {}
+
+
+class TestConditionalRules:
+    """Test declarative threshold rules."""
+
+    @pytest.mark.parametrize('op, value, danger, fired', [
+        ('>', 0.7, 0.8, True),
+        ('>', 0.7, 0.7, False),
+        ('>=', 0.7, 0.7, True),
+        ('<', 0.2, 0.1, True),
+        ('==', 0.5, 0.5, True),
+        ('!=', 0.5, 0.5, False),
+    ])
+    def test_from_threshold_comparisons(self, op, value, danger, fired):
+        """from_threshold compares the named attribute with the operator."""
+        rule = ConditionalRule.from_threshold('danger', op, value, 'enter', _context('x'))
+        assert rule.condition(SimpleNamespace(danger=danger)) is fired
+
+    def test_from_threshold_rejects_unknown_operator(self):
+        """Unknown comparison strings raise ValueError."""
+        with pytest.raises(ValueError):
+            ConditionalRule.from_threshold('danger', '=>', 0.7, 'enter', _context('x'))
+
+    def test_threshold_rule_enters_and_cools_down(self):
+        """A threshold rule pushes its context once and respects cooldown."""
+        system = MetaContextSystem(verbose=False)
+        survival = create_survival_context()
+        system.add_rule(ConditionalRule.from_threshold(
+            'danger', '>', 0.7, 'enter', survival, cooldown=60.0
+        ))
+
+        system.update_contexts(SimpleNamespace(danger=0.9))
+        assert system.get_active_context() is survival
+        system.pop_context()
+        system.update_contexts(SimpleNamespace(danger=0.9))
+        assert system.get_active_context() is None
+        assert system.total_rule_triggers == 1
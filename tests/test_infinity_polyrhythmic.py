@@ -0,0 +1,307 @@
+"""
+Polyrhythmic Learning Tests
+
+Tests for the column-backed learner against a per-object reference model.
+"""
+
+import math
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from singularis.infinity import PolyrhythmicLearner, RhythmProfile, TrackRhythmState
+from singularis.infinity._rhythm_kernels import _reward_update_loop, _reward_update_scalar
+from singularis.infinity.polyrhythmic_learning import (
+    _VECTOR_MIN_PROFILE_ROWS,
+    _VECTOR_MIN_ROWS,
+    COHERENCE_WINDOW,
+    REWARD_WINDOW,
+    create_exploration_profile,
+)
+
+
+class _ReferenceLearner:
+    """
+    One dict per track and plain loops, as the learner worked before its
+    state moved into columns. Period deltas use exact rationals, which
+    is what the fixed-point implementation computes.
+    """
+
+    def __init__(self, attraction):
+        self.attraction = Fraction(str(attraction))
+        self.tracks = {}
+        self.pairs = []
+        self.total_adaptations = 0
+
+    def register(self, name, period, lo, hi, lr):
+        self.tracks[name] = {
+            'period': period, 'min': lo, 'max': hi, 'lr': lr, 'momentum': 0.9,
+            'velocity': 0.0, 'rewards': [], 'coherence': [], 'history': [],
+        }
+
+    def _move(self, state, new):
+        new = max(state['min'], min(state['max'], new))
+        if new != state['period']:
+            state['history'].append(state['period'])
+            state['period'] = new
+            self.total_adaptations += 1
+
+    def adapt_from_reward(self, name, reward, coherence=None):
+        state = self.tracks.get(name)
+        if state is None:
+            return
+        state['rewards'].append(reward)
+        if coherence is not None:
+            state['coherence'].append(coherence)
+        if len(state['rewards']) >= 2:
+            recent = state['rewards'][-REWARD_WINDOW:]
+            gradient = (recent[-1] - recent[0]) * 100
+            state['velocity'] = state['momentum'] * state['velocity'] + state['lr'] * gradient
+            self._move(state, state['period'] + int(state['velocity']))
+
+    def adapt_from_coherence(self, scores):
+        for name, coherence in scores.items():
+            state = self.tracks.get(name)
+            if state is None:
+                continue
+            state['coherence'].append(coherence)
+            if coherence < 0.5:
+                self._attract(name)
+
+    def _attract(self, name):
+        attractions = []
+        for t1, t2, ratio in self.pairs:
+            if t1 == name and t2 in self.tracks:
+                attractions.append(int(ratio * self.tracks[t2]['period']))
+            elif t2 == name and t1 in self.tracks:
+                attractions.append(int(self.tracks[t1]['period'] / ratio))
+        if not attractions:
+            return
+        state = self.tracks[name]
+        target = sum(attractions) // len(attractions)
+        delta = math.trunc((target - state['period']) * self.attraction)
+        if delta:
+            self._move(state, state['period'] + delta)
+
+    def adapt_to_context(self, profile):
+        step = Fraction(str(profile.plasticity)) / 10
+        for name, target in profile.track_periods.items():
+            state = self.tracks.get(name)
+            if state is None:
+                continue
+            delta = math.trunc((target - state['period']) * step)
+            if delta:
+                self._move(state, state['period'] + delta)
+
+    def harmonic_coherence(self):
+        if not self.pairs:
+            return 1.0
+        errors = []
+        for t1, t2, ratio in self.pairs:
+            if t1 in self.tracks and t2 in self.tracks:
+                actual = self.tracks[t1]['period'] / self.tracks[t2]['period']
+                errors.append(abs(actual - ratio) / ratio)
+        return max(0.0, 1.0 - sum(errors) / len(self.pairs))
+
+
+_NAMES = ('perception', 'curiosity', 'reflection', 'strategic', 'unregistered')
+
+
+def _check_same(learner, reference):
+    assert learner.total_adaptations == reference.total_adaptations
+    for name, ref in reference.tracks.items():
+        state = learner.track_states[name]
+        assert state.current_period == ref['period'], name
+        assert list(state.period_history) == ref['history'][-50:], name
+        assert state.reward_history == pytest.approx(ref['rewards'][-REWARD_WINDOW:])
+        assert state.coherence_contributions == pytest.approx(
+            ref['coherence'][-COHERENCE_WINDOW:]
+        )
+        assert state.velocity == pytest.approx(ref['velocity'])
+    assert learner.compute_harmonic_coherence() == pytest.approx(
+        reference.harmonic_coherence()
+    )
+
+
+class TestBaselineEquivalence:
+    """Test the column store against the per-object reference learner."""
+
+    @pytest.mark.parametrize('seed', range(5))
+    def test_random_adaptation_sequence(self, seed):
+        """Reward, coherence and context adaptation agree step by step."""
+        rng = random.Random(seed)
+        learner = PolyrhythmicLearner(harmonic_attraction=0.1, verbose=False)
+        reference = _ReferenceLearner(attraction=0.1)
+
+        for name in _NAMES[:4]:
+            period = rng.randint(20, 600)
+            learner.register_track(name, period, 10, 1000, 0.05)
+            reference.register(name, period, 10, 1000, 0.05)
+        for t1, t2, ratio in (('perception', 'curiosity', 0.5),
+                              ('curiosity', 'reflection', 0.5),
+                              ('strategic', 'unregistered', 0.25),
+                              ('reflection', 'strategic', 0.4)):
+            learner.add_harmonic_constraint(t1, t2, ratio)
+            reference.pairs.append((t1, t2, ratio))
+        profile = create_exploration_profile()
+        learner.add_rhythm_profile(profile)
+
+        for _ in range(300):
+            op = rng.randrange(3)
+            if op == 0:
+                name = rng.choice(_NAMES)
+                reward = rng.uniform(-1.0, 1.0)
+                coherence = rng.random() if rng.random() < 0.5 else None
+                learner.adapt_from_reward(name, reward, coherence)
+                reference.adapt_from_reward(name, reward, coherence)
+            elif op == 1:
+                scores = {name: rng.random() for name in rng.sample(_NAMES, 3)}
+                learner.adapt_from_coherence(scores, 0.5)
+                reference.adapt_from_coherence(scores)
+            else:
+                learner.adapt_to_context('exploration')
+                reference.adapt_to_context(profile)
+            _check_same(learner, reference)
+
+    def test_wide_learner_uses_array_paths(self):
+        """Past the vector thresholds the array paths agree too."""
+        rng = random.Random(11)
+        names = [f"t{i}" for i in range(max(_VECTOR_MIN_ROWS, _VECTOR_MIN_PROFILE_ROWS) + 8)]
+        learner = PolyrhythmicLearner(harmonic_attraction=0.3, verbose=False)
+        reference = _ReferenceLearner(attraction=0.3)
+        for name in names:
+            period = rng.randint(20, 600)
+            learner.register_track(name, period, 10, 1000, 0.05)
+            reference.register(name, period, 10, 1000, 0.05)
+        for i in range(len(names)):
+            ratio = rng.choice((0.25, 0.5, 0.75))
+            learner.add_harmonic_constraint(names[i], names[(i + 3) % len(names)], ratio)
+            reference.pairs.append((names[i], names[(i + 3) % len(names)], ratio))
+        profile = RhythmProfile('wide', {name: rng.randint(20, 600) for name in names}, {}, 0.7)
+        learner.add_rhythm_profile(profile)
+
+        for _ in range(20):
+            scores = {name: rng.random() for name in names}
+            learner.adapt_from_coherence(scores, 0.5)
+            reference.adapt_from_coherence(scores)
+            learner.adapt_to_context('wide')
+            reference.adapt_to_context(profile)
+            _check_same(learner, reference)
+
+        for state in learner.track_states.values():
+            state.total_activations = rng.randrange(3)
+            state.successful_activations = rng.randrange(state.total_activations + 1)
+        expected = sum(state.success_rate() for state in learner.track_states.values())
+        assert learner.get_statistics()['avg_success_rate'] == pytest.approx(expected / len(names))
+
+
+class TestRewardKernel:
+    """Test the interpreter twin of the reward kernel."""
+
+    def test_scalar_twin_matches_loop(self):
+        """Over memoryviews the scalar step matches the array loop."""
+        def columns():
+            return [np.zeros((2, REWARD_WINDOW)), np.zeros(2, np.int32), np.zeros(2, np.int32),
+                    np.array([100, 300], np.int32), np.zeros(2), np.full(2, 0.9),
+                    np.full(2, 0.05), np.full(2, 90, np.int32), np.full(2, 120, np.int32)]
+
+        arrays, viewed = columns(), columns()
+        views = [memoryview(column) for column in viewed]
+        rng = random.Random(3)
+        for _ in range(200):
+            slot, reward = rng.randrange(2), rng.uniform(-1.0, 1.0)
+            assert _reward_update_scalar(*views, slot, reward) == pytest.approx(
+                _reward_update_loop(*arrays, slot, reward)
+            )
+        for a, b in zip(arrays, viewed):
+            np.testing.assert_array_equal(a, b)
+
+
+class TestTrackColumns:
+    """Test the column and ring-window descriptors on TrackRhythmState."""
+
+    def test_detached_state_keeps_plain_fields(self):
+        """A state never registered stores its values itself."""
+        state = TrackRhythmState('t', current_period=100, base_period=100)
+        state.velocity = 2.5
+        state.reward_history = [0.1, 0.2]
+        assert state.velocity == 2.5
+        assert state.reward_history == [0.1, 0.2]
+
+    def test_registration_moves_values_into_columns(self):
+        """Registered values read back through the learner's columns."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.register_track('t', 120, min_period=20, max_period=400)
+        state = learner.track_states['t']
+        assert state.current_period == 120
+        assert (state.min_period, state.max_period) == (20, 400)
+
+        state.current_period = 150
+        assert learner.get_current_period('t') == 150
+
+    def test_replaced_state_keeps_its_values(self):
+        """Re-registering a track detaches the old state with its values."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.register_track('t', 120)
+        old = learner.track_states['t']
+        learner.adapt_from_reward('t', 0.0)
+        learner.adapt_from_reward('t', 1.0)
+        period, rewards = old.current_period, old.reward_history
+
+        learner.register_track('t', 300)
+        assert old.current_period == period
+        assert old.reward_history == rewards
+        assert learner.track_states['t'].current_period == 300
+        assert learner.track_states['t'].reward_history == []
+
+    def test_ring_window_keeps_latest_values(self):
+        """The reward ring retains the last REWARD_WINDOW values, oldest first."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.register_track('t', 100)
+        for i in range(REWARD_WINDOW + 3):
+            learner.adapt_from_reward('t', i / 100)
+        state = learner.track_states['t']
+        assert state.reward_history == pytest.approx(
+            [i / 100 for i in range(3, REWARD_WINDOW + 3)]
+        )
+
+        state.reward_history = [0.5, 0.25]
+        assert state.reward_history == [0.5, 0.25]
+
+    def test_empty_learner_ignores_unknown_tracks(self):
+        """Updates naming only unregistered tracks are no-ops."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.adapt_from_coherence({'ghost': 0.1}, 0.1)
+        learner.adapt_from_reward('ghost', 1.0, 0.2)
+        assert learner.total_adaptations == 0
+
+    def test_success_rate_statistics(self):
+        """avg_success_rate averages per-track rates (0.5 when unused)."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.register_track('a', 100)
+        learner.register_track('b', 100)
+        state = learner.track_states['a']
+        state.total_activations = 4
+        state.successful_activations = 3
+        assert learner.get_statistics()['avg_success_rate'] == pytest.approx(
+            (0.75 + 0.5) / 2
+        )
+
+
+class TestProfiles:
+    """Test context profile indexing."""
+
+    def test_profile_edit_needs_re_add(self):
+        """Editing a profile takes effect once it is added again."""
+        learner = PolyrhythmicLearner(verbose=False)
+        learner.register_track('x', 100)
+        profile = RhythmProfile('p', {'x': 200}, {}, plasticity=1.0)
+        learner.add_rhythm_profile(profile)
+        learner.adapt_to_context('p')
+        assert learner.get_current_period('x') == 110
+
+        profile.track_periods['x'] = 10
+        learner.add_rhythm_profile(profile)
+        learner.adapt_to_context('p')
+        assert learner.get_current_period('x') == 100